@@ -0,0 +1,7 @@
+"""
+Benchmarks for the RunPod MCP server.
+
+Each module can be run with ``python -m benchmarks.<name>`` from the
+repository root and writes its results as JSON, so runs from different
+commits can be compared with ``python -m benchmarks.compare``.
+"""
@@ -0,0 +1,57 @@
+"""
+Shared helpers for the benchmarks.
+"""
+
+import json
+import math
+import platform
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+def percentile(values: List[float], q: float) -> float:
+    """Return the nearest-rank percentile ``q`` (0-100) of unsorted values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))]
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_metadata(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe the benchmark run so results can be compared later."""
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "args": args,
+    }
+
+def write_json(results: Dict[str, Any], path: Optional[str]) -> None:
+    """Write results to ``path``, or to stdout if no path is given."""
+    text = json.dumps(results, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+def int_list(value: str) -> List[int]:
+    """Parse a comma-separated list of integers from the command line."""
+    return [int(item) for item in value.split(",") if item.strip()]
@@ -0,0 +1,106 @@
+"""
+Compare two benchmark result files.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 10]
+
+Prints every measurement whose value changed by more than the threshold
+(in percent) between the two runs, worst regressions first.
+"""
+
+import argparse
+import json
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Metrics where a larger value is better; all others are better when smaller
+_HIGHER_IS_BETTER = {"rps", "dict_decode_per_sec", "model_decode_per_sec", "items_per_sec"}
+
+# Metrics compared between runs
+_METRICS = ("p50_ms", "p99_ms", "rps", "upstream_calls_per_read", "errors")
+
+# Startup measurements compared between runs
+_STARTUP_METRICS = ("p50_ms", "p90_ms")
+
+# Model measurements compared between runs
+_MODEL_METRICS = ("model_bytes_per_item", "dict_decode_per_sec", "model_decode_per_sec")
+
+def flatten(results: Dict[str, Any]) -> Iterator[Tuple[str, float]]:
+    """Yield ("<pods>/<uri>/<concurrency>/<metric>", value) for a resources run.
+
+    Startup runs yield ("startup/<measurement>/<metric>", value), model
+    runs ("models/<kind>/<metric>", value) and decoding runs
+    ("decoding/<kind>/<decoder>/<mode>/items_per_sec", value).
+    """
+    for measurement, values in results.get("startup", {}).items():
+        for metric in _STARTUP_METRICS:
+            if isinstance(values, dict) and metric in values:
+                yield f"startup/{measurement}/{metric}", float(values[metric])
+    for kind, values in results.get("models", {}).items():
+        for metric in _MODEL_METRICS:
+            if metric in values:
+                yield f"models/{kind}/{metric}", float(values[metric])
+    for kind, values in results.get("decoding", {}).items():
+        for decoder, modes in values.get("decoders", {}).items():
+            for mode in ("loads", "decode_list"):
+                if mode in modes:
+                    yield f"decoding/{kind}/{decoder}/{mode}/items_per_sec", float(modes[mode]["items_per_sec"])
+    for run in results.get("runs", []):
+        for uri, measurements in run.get("resources", {}).items():
+            for level, values in measurements.items():
+                if not isinstance(values, dict):
+                    continue
+                for metric in _METRICS:
+                    if metric in values:
+                        yield f"{run['pods']}/{uri}/{level}/{metric}", float(values[metric])
+        if "peak_rss_mb" in run:
+            yield f"{run['pods']}/peak_rss_mb", float(run["peak_rss_mb"])
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any], threshold: float = 10.0) -> List[Dict[str, Any]]:
+    """Return the measurements that changed by more than ``threshold`` percent.
+
+    Returns:
+        Rows with key, baseline, candidate, change (percent) and regression,
+        sorted with the worst regressions first
+    """
+    before = dict(flatten(baseline))
+    rows = []
+    for key, value in flatten(candidate):
+        if key not in before:
+            continue
+        old = before[key]
+        if old == value:
+            continue
+        change = (value - old) / old * 100 if old else float("inf")
+        if abs(change) < threshold:
+            continue
+        metric = key.rsplit("/", 1)[-1]
+        regression = change < 0 if metric in _HIGHER_IS_BETTER else change > 0
+        rows.append({"key": key, "baseline": old, "candidate": value, "change": change, "regression": regression})
+    rows.sort(key=lambda row: (not row["regression"], -abs(row["change"])))
+    return rows
+
+def main(argv=None):
+    """Print the differences between two result files."""
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", help="Results of the baseline commit")
+    parser.add_argument("candidate", help="Results of the commit being evaluated")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Minimum change in percent to report")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(f"Baseline:  {baseline.get('meta', {}).get('commit')}")
+    print(f"Candidate: {candidate.get('meta', {}).get('commit')}")
+    rows = compare(baseline, candidate, args.threshold)
+    if not rows:
+        print(f"No changes above {args.threshold:g}%")
+        return
+    for row in rows:
+        marker = "REGRESSION" if row["regression"] else "improved"
+        print(f"{marker:>10}  {row['change']:+8.1f}%  {row['baseline']:10.2f} -> {row['candidate']:10.2f}  {row['key']}")
+
+if __name__ == "__main__":
+    main()
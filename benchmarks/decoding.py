@@ -0,0 +1,159 @@
+"""
+JSON decoding benchmark.
+
+Decodes large synthetic ``/pods`` and ``/templates`` responses with every
+installed decoder (``src/runpod_mcp/decoding.py``) and reports, per
+decoder and payload:
+
+- ``loads``: decoding into plain dicts, as for untyped requests; the
+  stdlib row is what ``response.json()`` used to cost.
+- ``decode_list``: decoding into models, as resources request listings.
+  With msgspec, unused fields are skipped while parsing.
+
+The payloads are fake fleet objects padded with fields that real RunPod
+responses carry but no resource reads (machine details, GPU telemetry,
+timestamps, ...), so most of each object is unused. Each measurement
+is the fastest of ``--rounds`` runs, in items and MB per second.
+
+Usage:
+    python -m benchmarks.decoding --count 10000 --output decoding.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from src.runpod_mcp.decoding import DECODERS, create_decoder, decoder_available
+from src.runpod_mcp.models import Pod, Template
+from src.runpod_mcp.testing import FakeFleet
+
+from .common import run_metadata, write_json
+
+# Model each payload decodes into
+MODELS = {"pods": Pod, "templates": Template}
+
+def pad_pod(pod: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """Add the fields of a real pod response that resources do not read."""
+    padded = dict(pod)
+    padded.update({
+        "imageName": pod["container"]["image"],
+        "podType": "RESERVED",
+        "vcpuCount": rng.choice([8, 16, 32]),
+        "memoryInGb": rng.choice([62, 125, 251]),
+        "volumeInGb": 100,
+        "containerDiskInGb": 50,
+        "volumeMountPath": "/workspace",
+        "lastStatusChange": "Rented by User: Mon Jan 01 2024 00:00:00 GMT+0000 (Coordinated Universal Time)",
+        "interruptible": False,
+        "locked": False,
+        "adjustedCostPerHr": pod.get("costPerHr"),
+        "dockerArgs": "",
+        "templateId": f"tpl{rng.randrange(500):04d}",
+        "machine": {
+            "podHostId": f"{pod['id']}-{rng.randrange(1 << 32):08x}",
+            "gpuDisplayName": pod["gpuDisplayName"],
+            "location": rng.choice(["US-OR-1", "EU-RO-1", "CA-MTL-1"]),
+            "secureCloud": True,
+            "maxDownloadSpeedMbps": rng.randrange(1000, 10000),
+            "maxUploadSpeedMbps": rng.randrange(1000, 10000),
+        },
+    })
+    if pod.get("runtime"):
+        padded["runtime"] = dict(pod["runtime"], gpus=[
+            {"id": f"gpu{i}", "gpuUtilPercent": rng.randrange(100), "memoryUtilPercent": rng.randrange(100)}
+            for i in range(pod.get("gpuCount", 1))
+        ], container={"cpuPercent": rng.randrange(100), "memoryPercent": rng.randrange(100)})
+    return padded
+
+def pad_template(template: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """Add the fields of a real template response that resources do not read."""
+    padded = dict(template)
+    padded.update({
+        "imageName": template["container"]["image"],
+        "readme": "# Generated template\n\n" + "Starts a container with the tools preinstalled. " * 8,
+        "isPublic": True,
+        "isServerless": False,
+        "containerDiskInGb": 20,
+        "volumeInGb": 50,
+        "volumeMountPath": "/workspace",
+        "startJupyter": True,
+        "startSsh": True,
+        "category": rng.choice(["NVIDIA", "AMD", "CPU"]),
+        "earned": rng.randrange(1000),
+        "runtimeInMin": rng.randrange(100000),
+    })
+    return padded
+
+def payloads(count: int, seed: int = 0) -> Dict[str, bytes]:
+    """Return padded JSON listings of ``count`` pods and templates."""
+    rng = random.Random(seed)
+    fleet = FakeFleet(pods=count, endpoints=0, volumes=0, templates=count, seed=seed, boot_seconds=0)
+    return {
+        "pods": json.dumps([pad_pod(pod, rng) for pod in fleet.list_pods()]).encode(),
+        "templates": json.dumps([pad_template(template, rng) for template in fleet.templates]).encode(),
+    }
+
+def fastest(run: Callable[[], List[Any]], rounds: int) -> float:
+    """Return the shortest time of ``rounds`` runs in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def rates(seconds: float, count: int, size: int) -> Dict[str, float]:
+    """Express a duration as items and MB per second."""
+    return {
+        "ms": seconds * 1000,
+        "items_per_sec": count / seconds if seconds else 0.0,
+        "mb_per_sec": size / (1024 * 1024) / seconds if seconds else 0.0,
+    }
+
+def run_decoding(args) -> Dict[str, Any]:
+    """Measure every decoder on every payload."""
+    results: Dict[str, Any] = {}
+    for kind, payload in payloads(args.count, seed=args.seed).items():
+        model = MODELS[kind]
+        count = len(json.loads(payload))
+        results[kind] = {"count": count, "bytes": len(payload), "decoders": {}}
+        for name in args.decoders:
+            decoder = create_decoder(name)
+            results[kind]["decoders"][name] = {
+                "loads": rates(fastest(lambda: decoder.loads(payload), args.rounds), count, len(payload)),
+                "decode_list": rates(fastest(lambda: decoder.decode_list(payload, model), args.rounds), count, len(payload)),
+                "fallbacks": decoder.fallbacks,
+            }
+        baseline = results[kind]["decoders"].get("stdlib", {}).get("loads", {}).get("ms")
+        if baseline:
+            for measured in results[kind]["decoders"].values():
+                for mode in ("loads", "decode_list"):
+                    measured[mode]["speedup_vs_stdlib_loads"] = baseline / measured[mode]["ms"]
+    return results
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on large synthetic API responses")
+    parser.add_argument("--count", type=int, default=10000, help="Pods and templates in each payload")
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per measurement; the fastest is reported")
+    parser.add_argument("--decoders", type=lambda value: value.split(","),
+                        default=[name for name in DECODERS if decoder_available(name)],
+                        help="Comma-separated decoders to measure (default: all installed)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the fake fleet")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmark and write its results."""
+    args = parse_args(argv)
+    missing = [name for name in args.decoders if name not in DECODERS or not decoder_available(name)]
+    if missing:
+        sys.exit(f"Unknown or not installed decoders: {', '.join(missing)}")
+    print(f"Decoding {args.count} pods and templates with {', '.join(args.decoders)}...", file=sys.stderr)
+    write_json({"meta": run_metadata(vars(args)), "decoding": run_decoding(args)}, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Concurrent multi-client load harness.
+
+Runs N concurrent MCP client sessions against ``src.runpod_mcp.server``
+and replays a weighted mix of resource reads and tool calls. With the
+stdio transport every client spawns its own server subprocess, as desktop
+clients do. With the sse and streamable-http transports, one server
+subprocess serves all clients. Unless ``--api-url`` is given, the server
+talks to an in-process fake RunPod API.
+
+Reported as JSON: throughput, p50/p95/p99/max latency and error rate per
+operation and overall, and event-loop stalls. Stalls are measured in two
+places:
+
+- Server stalls come from a canary session that reads ``status://version``,
+  which does no upstream I/O, every ``--canary-interval`` seconds. Canary
+  reads slower than ``--stall-threshold`` are counted as server event-loop
+  stalls. With stdio, the canary shares the first client's server process.
+- Client loop lag measures the harness's own event loop. If it is high, the
+  harness is the bottleneck and the results understate the server.
+
+Usage:
+    python -m benchmarks.load --transport streamable-http --clients 50 \\
+        --duration 30 --pods 1000 --latency lognormal:40:0.5 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from src.runpod_mcp.testing import FakeRunPodAPI, FaultConfig
+
+from .common import peak_rss_mb, percentile, run_metadata, write_json
+from .resources import fleet_for
+
+# Repository root, the working directory of server subprocesses
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@dataclass
+class Operation:
+    """One entry of the workload mix."""
+    name: str
+    weight: float
+    uri: Optional[str] = None
+    tool: Optional[str] = None
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+# Default mix: mostly reads, plus tool calls that do not change the fleet
+DEFAULT_MIX = [
+    Operation("pods_list", 25, uri="pods://list"),
+    Operation("pod_details", 15, uri="pods://details/pod00001"),
+    Operation("gpus_available", 15, uri="gpus://available"),
+    Operation("gpu_recommended", 5, uri="gpus://recommended/inference"),
+    Operation("endpoints", 10, uri="serverless://endpoints"),
+    Operation("endpoint_metrics", 5, uri="serverless://endpoint/ep0000/metrics"),
+    Operation("volumes", 5, uri="storage://volumes"),
+    Operation("account", 5, uri="account://info"),
+    Operation("templates", 5, uri="pods://templates"),
+    Operation("stop_pods_dry_run", 5, tool="stop_pods", arguments={"name_prefix": "dev", "dry_run": True}),
+    Operation("wait_running", 5, tool="wait_for_pod_state", arguments={"pod_ids": ["pod00001"], "timeout": 1}),
+]
+
+def load_mix(path: Optional[str]) -> List[Operation]:
+    """Load a workload mix from a JSON list of operations, or the default mix."""
+    if not path:
+        return DEFAULT_MIX
+    with open(path) as f:
+        entries = json.load(f)
+    mix = [Operation(**entry) for entry in entries]
+    for op in mix:
+        if (op.uri is None) == (op.tool is None):
+            raise ValueError(f"Operation {op.name} needs exactly one of uri or tool")
+    return mix
+
+class Recorder:
+    """Collects latencies and errors per operation."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_samples: Dict[str, str] = {}
+
+    def record(self, name: str, seconds: float, error: Optional[str] = None) -> None:
+        """Record one completed operation."""
+        self.latencies.setdefault(name, []).append(seconds)
+        if error is not None:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            self.error_samples.setdefault(name, error[:200])
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """Summarize throughput, latency and errors per operation and overall."""
+        def summarize(latencies: List[float], errors: int) -> Dict[str, Any]:
+            return {
+                "count": len(latencies),
+                "errors": errors,
+                "error_rate": errors / len(latencies) if latencies else 0.0,
+                "rps": len(latencies) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p95_ms": percentile(latencies, 95) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "max_ms": max(latencies, default=0.0) * 1000,
+            }
+
+        operations = {
+            name: summarize(latencies, self.errors.get(name, 0))
+            for name, latencies in sorted(self.latencies.items())
+        }
+        everything = [seconds for latencies in self.latencies.values() for seconds in latencies]
+        return {
+            "overall": summarize(everything, sum(self.errors.values())),
+            "operations": operations,
+            "error_samples": self.error_samples,
+        }
+
+async def run_operation(session: ClientSession, op: Operation) -> Optional[str]:
+    """Run one operation, returning an error description or None."""
+    try:
+        if op.uri is not None:
+            result = await session.read_resource(op.uri)
+            text = getattr(result.contents[0], "text", "") if result.contents else ""
+        else:
+            result = await session.call_tool(op.tool, op.arguments)
+            if result.isError:
+                return getattr(result.content[0], "text", "tool error") if result.content else "tool error"
+            text = getattr(result.content[0], "text", "") if result.content else ""
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return text if text.startswith("Error") else None
+
+async def client_worker(session: ClientSession, mix: List[Operation], recorder: Recorder, deadline: float, args, seed: int):
+    """Replay the weighted mix until the deadline."""
+    rng = random.Random(seed)
+    weights = [op.weight for op in mix]
+    while time.monotonic() < deadline:
+        op = rng.choices(mix, weights)[0]
+        start = time.perf_counter()
+        error = await run_operation(session, op)
+        recorder.record(op.name, time.perf_counter() - start, error)
+        if args.think_time:
+            await asyncio.sleep(rng.expovariate(1 / args.think_time))
+
+async def canary(session: ClientSession, deadline: float, interval: float) -> List[float]:
+    """Read a resource without upstream I/O at a fixed interval."""
+    latencies = []
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            await session.read_resource("status://version")
+        except Exception:
+            pass
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+async def loop_lag(deadline: float, interval: float = 0.01) -> List[float]:
+    """Measure how late this event loop wakes up from short sleeps."""
+    lags = []
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - start - interval))
+    return lags
+
+def stall_summary(latencies: List[float], threshold: float) -> Dict[str, Any]:
+    """Summarize canary or loop lag samples against the stall threshold."""
+    return {
+        "samples": len(latencies),
+        "stalls": sum(1 for seconds in latencies if seconds > threshold),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+    }
+
+def server_command(args, extra: List[str]) -> List[str]:
+    """Return the command line of a server subprocess."""
+    return [sys.executable, "-m", "src.runpod_mcp.server", "--log-level", "WARNING", *extra, *args.server_arg]
+
+def server_env(api_url: str) -> Dict[str, str]:
+    """Return the environment of a server subprocess."""
+    env = dict(os.environ)
+    env.setdefault("RUNPOD_API_KEY", "load-test")
+    env["RUNPOD_API_URL"] = api_url
+    # Without this the client rate limiter, not the server, sets throughput
+    env.setdefault("RUNPOD_RATE_LIMIT", "0")
+    return env
+
+def free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    """Wait until the HTTP server subprocess accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"Server did not listen on port {port} within {timeout:g}s")
+
+@asynccontextmanager
+async def open_session(streams_context):
+    """Open and initialize a client session over a transport's streams."""
+    async with streams_context as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            yield session
+
+async def run_load(args, api_url: str) -> Dict[str, Any]:
+    """Open the client sessions, run the mix and collect the results."""
+    mix = load_mix(args.mix)
+    recorder = Recorder()
+    async with AsyncExitStack() as stack:
+        errlog = sys.stderr if args.verbose else stack.enter_context(open(os.devnull, "w"))
+        if args.transport == "stdio":
+            params = StdioServerParameters(
+                command=sys.executable, args=server_command(args, [])[1:], env=server_env(api_url), cwd=_ROOT
+            )
+            def connect():
+                return open_session(stdio_client(params, errlog=errlog))
+        else:
+            port = free_port()
+            server = subprocess.Popen(
+                server_command(args, ["--transport", args.transport, "--port", str(port)]),
+                env=server_env(api_url), cwd=_ROOT, stdout=errlog, stderr=errlog,
+            )
+            stack.callback(server.wait)
+            stack.callback(server.terminate)
+            await wait_for_port(port, server)
+            if args.transport == "sse":
+                url = f"http://127.0.0.1:{port}/sse"
+                def connect():
+                    return open_session(sse_client(url, timeout=args.timeout, sse_read_timeout=args.timeout))
+            else:
+                url = f"http://127.0.0.1:{port}/mcp"
+                def connect():
+                    return open_session(streamablehttp_client(url, timeout=args.timeout))
+
+        # Transport contexts must be entered and exited in the same task, so
+        # every client task opens its own session and waits for the others
+        connected = asyncio.Semaphore(args.connect_batch)
+        ready: List[asyncio.Future] = []
+        go = asyncio.Event()
+        timing: Dict[str, float] = {}
+        canary_latencies: List[float] = []
+
+        async def client(index: int, with_canary: bool):
+            async with connected:
+                session_context = connect()
+                session = await session_context.__aenter__()
+            try:
+                ready[index].set_result(None)
+                await go.wait()
+                jobs = [client_worker(session, mix, recorder, timing["deadline"], args, args.seed + index)]
+                if with_canary:
+                    jobs.append(canary(session, timing["deadline"], args.canary_interval))
+                results = await asyncio.gather(*jobs)
+                if with_canary:
+                    canary_latencies.extend(results[-1])
+            finally:
+                await session_context.__aexit__(None, None, None)
+
+        async def canary_client():
+            async with connect() as session:
+                ready[-1].set_result(None)
+                await go.wait()
+                canary_latencies.extend(await canary(session, timing["deadline"], args.canary_interval))
+
+        loop = asyncio.get_running_loop()
+        # With stdio the canary shares the first client's server process
+        shared_canary = args.transport == "stdio"
+        ready = [loop.create_future() for _ in range(args.clients + (0 if shared_canary else 1))]
+        connect_start = time.perf_counter()
+        tasks = [asyncio.ensure_future(client(i, shared_canary and i == 0)) for i in range(args.clients)]
+        if not shared_canary:
+            tasks.append(asyncio.ensure_future(canary_client()))
+        # Fail fast if a client cannot connect
+        waiting = [asyncio.ensure_future(asyncio.gather(*ready)), *tasks]
+        done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+        if waiting[0] not in done:
+            for task in done:
+                task.result()
+        connect_seconds = time.perf_counter() - connect_start
+
+        start = time.perf_counter()
+        timing["deadline"] = time.monotonic() + args.duration
+        go.set()
+        lags, *_ = await asyncio.gather(loop_lag(timing["deadline"]), *tasks)
+        elapsed = time.perf_counter() - start
+
+    results = recorder.summary(elapsed)
+    results.update({
+        "transport": args.transport,
+        "clients": args.clients,
+        "duration": elapsed,
+        "connect_seconds": connect_seconds,
+        "server_stalls": stall_summary(canary_latencies, args.stall_threshold),
+        "client_loop_lag": stall_summary(lags, args.stall_threshold),
+        "harness_peak_rss_mb": peak_rss_mb(),
+    })
+    return results
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Concurrent multi-client load test for the RunPod MCP server")
+    parser.add_argument("--transport", choices=["stdio", "sse", "streamable-http"], default="stdio", help="MCP transport to test")
+    parser.add_argument("--clients", type=int, default=10, help="Number of concurrent client sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run the mix for")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds a client waits between operations")
+    parser.add_argument("--mix", help="JSON file with a list of operations: name, weight and uri or tool/arguments")
+    parser.add_argument("--connect-batch", type=int, default=20, help="Sessions opened at a time")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Transport timeout in seconds")
+    parser.add_argument("--stall-threshold", type=float, default=0.1, help="Seconds above which a canary read or loop wakeup counts as a stall")
+    parser.add_argument("--canary-interval", type=float, default=0.05, help="Seconds between canary reads")
+    parser.add_argument("--api-url", help="RunPod API to use instead of the in-process fake API")
+    parser.add_argument("--pods", type=int, default=100, help="Pods in the fake fleet")
+    parser.add_argument("--latency", default="0", help="Fake API latency: ms, uniform:lo:hi or lognormal:median:sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake API requests that fail with 500")
+    parser.add_argument("--server-arg", action="append", default=[], help="Extra server argument, e.g. --server-arg=--mirror (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the mix and the fake fleet")
+    parser.add_argument("--verbose", action="store_true", help="Show server logs")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the load test and write its results."""
+    args = parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    api = None
+    api_url = args.api_url
+    if api_url is None:
+        api = FakeRunPodAPI(
+            fleet_for(args.pods, seed=args.seed),
+            latency=args.latency,
+            faults=FaultConfig(error_rate=args.error_rate),
+            seed=args.seed,
+        ).start()
+        api_url = api.url
+    try:
+        print(f"Running {args.clients} {args.transport} clients for {args.duration:g}s...", file=sys.stderr)
+        results = asyncio.run(run_load(args, api_url))
+    finally:
+        if api is not None:
+            api.stop()
+    if api is not None:
+        results["upstream_requests"] = api.total_requests()
+    write_json({"meta": run_metadata(vars(args)), "results": results}, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Model memory and decode throughput benchmark.
+
+Compares the API dicts the client returns with the slotted models the
+resources decode them into (``src/runpod_mcp/models.py``), for each kind
+of object in a fake fleet of ``--count`` items:
+
+- Memory: bytes retained per item, measured with ``tracemalloc`` after
+  decoding the JSON listing into dicts, and into models with the dicts
+  dropped. Also reported per 10k items.
+- Decode throughput: items per second for ``json.loads`` alone and for
+  ``json.loads`` followed by ``from_api``.
+
+Fake fleet objects carry fewer fields than real API responses, so the
+memory saved on a real account is larger than reported here.
+
+Usage:
+    python -m benchmarks.models --count 10000 --output models.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Type
+
+from src.runpod_mcp.models import Endpoint, Model, NetworkVolume, Pod, Template
+from src.runpod_mcp.testing import FakeFleet
+
+from .common import run_metadata, write_json
+
+def fleet_payloads(count: int, seed: int = 0) -> Dict[str, bytes]:
+    """Return JSON listings of ``count`` pods, endpoints, volumes and templates."""
+    fleet = FakeFleet(pods=count, endpoints=count, volumes=count, templates=count, seed=seed, boot_seconds=0)
+    return {
+        "pods": json.dumps(fleet.list_pods()).encode(),
+        "endpoints": json.dumps(list(fleet.endpoints.values())).encode(),
+        "volumes": json.dumps(list(fleet.volumes.values())).encode(),
+        "templates": json.dumps(fleet.templates).encode(),
+    }
+
+# Model each listing decodes into
+MODELS: Dict[str, Type[Model]] = {
+    "pods": Pod,
+    "endpoints": Endpoint,
+    "volumes": NetworkVolume,
+    "templates": Template,
+}
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by ``build()`` while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+def throughput(decode: Callable[[], List[Any]], rounds: int) -> float:
+    """Return items decoded per second, from the fastest of ``rounds`` runs."""
+    best = float("inf")
+    items = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        items = len(decode())
+        best = min(best, time.perf_counter() - start)
+    return items / best if best else 0.0
+
+def bench_kind(payload: bytes, model: Type[Model], rounds: int) -> Dict[str, Any]:
+    """Measure dicts against models for one JSON listing."""
+    count = len(json.loads(payload))
+
+    def dicts() -> List[Dict[str, Any]]:
+        return json.loads(payload)
+
+    def models() -> List[Model]:
+        return [model.from_api(item) for item in json.loads(payload)]
+
+    dict_bytes = retained_bytes(dicts) / count
+    model_bytes = retained_bytes(models) / count
+    return {
+        "count": count,
+        "dict_bytes_per_item": dict_bytes,
+        "model_bytes_per_item": model_bytes,
+        "dict_mb_per_10k": dict_bytes * 10000 / (1024 * 1024),
+        "model_mb_per_10k": model_bytes * 10000 / (1024 * 1024),
+        "memory_ratio": model_bytes / dict_bytes if dict_bytes else 0.0,
+        "dict_decode_per_sec": throughput(dicts, rounds),
+        "model_decode_per_sec": throughput(models, rounds),
+    }
+
+def run_models(args) -> Dict[str, Any]:
+    """Measure every kind of listing."""
+    payloads = fleet_payloads(args.count, seed=args.seed)
+    return {kind: bench_kind(payloads[kind], MODELS[kind], args.rounds) for kind in args.kinds}
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark model memory and decode throughput against dicts")
+    parser.add_argument("--count", type=int, default=10000, help="Items of each kind")
+    parser.add_argument("--rounds", type=int, default=5, help="Decode runs; the fastest is reported")
+    parser.add_argument("--kinds", type=lambda value: value.split(","), default=list(MODELS),
+                        help=f"Comma-separated kinds to measure (default: {','.join(MODELS)})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the fake fleet")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmark and write its results."""
+    args = parse_args(argv)
+    unknown = [kind for kind in args.kinds if kind not in MODELS]
+    if unknown:
+        sys.exit(f"Unknown kinds: {', '.join(unknown)}")
+    print(f"Measuring models with {args.count} items of each kind...", file=sys.stderr)
+    write_json({"meta": run_metadata(vars(args)), "models": run_models(args)}, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Per-resource latency and throughput benchmark.
+
+Drives every registered resource through an in-process MCP client session
+against the fake RunPod API, sweeping fleet size and client concurrency.
+For each resource it reports the cold (first) read latency, p50/p99
+latency, reads per second, errors and upstream API calls per read, plus
+the peak RSS of the process, as JSON.
+
+Usage:
+    python -m benchmarks.resources --fleet-sizes 10,100,1000,10000 \\
+        --concurrency 1,8,32 --reads 50 --output results.json
+
+The fake API runs in the same process, so peak RSS includes the fake
+fleet. Compare two runs with ``python -m benchmarks.compare``.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from src.runpod_mcp.testing import FakeFleet, FakeRunPodAPI, FaultConfig
+
+from .common import int_list, peak_rss_mb, percentile, run_metadata, write_json
+
+# Values for resource template parameters; ids are filled from the fleet
+_TEMPLATE_VALUES = {
+    "workload_type": "training",
+    "cloud_type": "secure",
+    "window": "5m",
+    "cursor": "0",
+}
+
+def fleet_for(pods: int, seed: int = 0) -> FakeFleet:
+    """Build a fake fleet whose other collections scale with the pod count."""
+    return FakeFleet(
+        pods=pods,
+        endpoints=max(1, pods // 20),
+        volumes=max(1, pods // 50),
+        templates=min(pods, 500),
+        seed=seed,
+        boot_seconds=0,
+    )
+
+def template_values(fleet: FakeFleet) -> Dict[str, str]:
+    """Return sample values for every resource template parameter."""
+    values = dict(_TEMPLATE_VALUES)
+    values["pod_id"] = next(iter(fleet.pods))
+    values["endpoint_id"] = next(iter(fleet.endpoints))
+    values["volume_id"] = next(iter(fleet.volumes))
+    values["template_id"] = fleet.templates[0]["id"] if fleet.templates else "tpl0000"
+    values["gpu_id"] = fleet.gpus[0]["id"]
+    return values
+
+def fill_template(uri_template: str, values: Dict[str, str]) -> Optional[str]:
+    """Fill a resource URI template, or return None if a parameter is unknown."""
+    params = re.findall(r"{(\w+)}", uri_template)
+    if any(param not in values for param in params):
+        return None
+    return re.sub(r"{(\w+)}", lambda match: values[match.group(1)], uri_template)
+
+async def list_resource_uris(session, values: Dict[str, str]) -> List[str]:
+    """Return the URIs of all static resources and filled resource templates."""
+    uris = [str(resource.uri) for resource in (await session.list_resources()).resources]
+    for template in (await session.list_resource_templates()).resourceTemplates:
+        uri = fill_template(template.uriTemplate, values)
+        if uri is None:
+            print(f"Skipping {template.uriTemplate}: no sample value", file=sys.stderr)
+        else:
+            uris.append(uri)
+    return sorted(uris)
+
+async def read_once(session, uri: str) -> bool:
+    """Read a resource, returning whether it succeeded."""
+    try:
+        result = await session.read_resource(uri)
+    except Exception:
+        return False
+    text = getattr(result.contents[0], "text", "") if result.contents else ""
+    return not text.startswith("Error")
+
+async def measure(session, api: FakeRunPodAPI, uri: str, reads: int, concurrency: int) -> Dict[str, Any]:
+    """Read one resource ``reads`` times from ``concurrency`` workers."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = reads
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            ok = await read_once(session, uri)
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    calls_before = api.total_requests()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "reads": len(latencies),
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "upstream_calls_per_read": (api.total_requests() - calls_before) / max(1, len(latencies)),
+    }
+
+async def bench_fleet(args, pods: int) -> Dict[str, Any]:
+    """Benchmark every resource against a fleet of ``pods`` pods."""
+    fleet = fleet_for(pods, seed=args.seed)
+    api = FakeRunPodAPI(
+        fleet,
+        latency=args.latency,
+        faults=FaultConfig(error_rate=args.error_rate),
+        seed=args.seed,
+    ).start()
+    os.environ["RUNPOD_API_KEY"] = "benchmark"
+    os.environ["RUNPOD_API_URL"] = api.url
+
+    # Imported late so the server module sees the benchmark environment
+    from src.runpod_mcp.config import config_store
+    from src.runpod_mcp.server import mcp
+    # Each fleet has its own fake API URL
+    config_store.reset()
+
+    results: Dict[str, Any] = {}
+    try:
+        async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+            uris = await list_resource_uris(session, template_values(fleet))
+            uris = [uri for uri in uris if not args.only or any(uri.startswith(p) for p in args.only)]
+            for uri in uris:
+                start = time.perf_counter()
+                ok = await read_once(session, uri)
+                results[uri] = {"cold_ms": (time.perf_counter() - start) * 1000, "cold_ok": ok}
+            for concurrency in args.concurrency:
+                for uri in uris:
+                    results[uri][f"c{concurrency}"] = await measure(session, api, uri, args.reads, concurrency)
+    finally:
+        api.stop()
+    return {
+        "pods": pods,
+        "upstream_requests": dict(api.requests),
+        # ru_maxrss only grows, so this is the peak up to and including this fleet size
+        "peak_rss_mb": peak_rss_mb(),
+        "resources": results,
+    }
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark RunPod MCP resources against the fake API")
+    parser.add_argument("--fleet-sizes", type=int_list, default=[10, 100, 1000, 10000], help="Comma-separated pod counts")
+    parser.add_argument("--concurrency", type=int_list, default=[1, 8, 32], help="Comma-separated client concurrency levels")
+    parser.add_argument("--reads", type=int, default=50, help="Reads per resource and concurrency level")
+    parser.add_argument("--latency", default="0", help="Fake API latency: ms, uniform:lo:hi or lognormal:median:sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake API requests that fail with 500")
+    parser.add_argument("--mirror", action="store_true", help="Serve reads from the fleet mirror (RUNPOD_MIRROR)")
+    parser.add_argument("--metrics-sampler", action="store_true", help="Enable the endpoint metrics sampler (RUNPOD_METRICS_SAMPLER)")
+    parser.add_argument("--only", action="append", help="Only benchmark URIs with this prefix (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the fake fleet")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmark and write its results."""
+    args = parse_args(argv)
+    # Keep the server's per-request logging out of the measurements
+    logging.disable(logging.INFO)
+    # The client rate limiter would otherwise cap throughput at its default
+    os.environ.setdefault("RUNPOD_RATE_LIMIT", "0")
+    os.environ.setdefault("RUNPOD_RETRY_BASE_DELAY", "0")
+    if args.mirror:
+        os.environ["RUNPOD_MIRROR"] = "true"
+    if args.metrics_sampler:
+        os.environ["RUNPOD_METRICS_SAMPLER"] = "true"
+
+    runs = []
+    for pods in args.fleet_sizes:
+        print(f"Benchmarking resources with {pods} pods...", file=sys.stderr)
+        runs.append(asyncio.run(bench_fleet(args, pods)))
+
+    write_json({"meta": run_metadata(vars(args)), "runs": runs, "peak_rss_mb": peak_rss_mb()}, args.output)
+
+if __name__ == "__main__":
+    main()
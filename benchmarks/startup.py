@@ -0,0 +1,192 @@
+"""
+Server startup benchmark.
+
+Measures what a desktop client waits for when it launches the server over
+stdio:
+
+- Time to first response: wall time from spawning
+  ``python -m src.runpod_mcp.server`` to the ``initialize`` result, and to
+  the result of reading ``status://version``, which does no upstream I/O.
+  Messages are written as raw JSON-RPC lines, so the client side adds
+  nothing to the measurement.
+- Import time: ``python -X importtime -c "import src.runpod_mcp.server"``,
+  summed per top-level package, with the slowest individual modules. This
+  includes registering the resources and tools, which runs at import.
+
+Each measurement is repeated ``--runs`` times after one warm-up run, which
+also writes the bytecode caches. Reported as JSON with medians and p90s.
+
+Usage:
+    python -m benchmarks.startup --runs 20 --output startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from .common import percentile, run_metadata, write_json
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module imported by the server entry point
+SERVER_MODULE = "src.runpod_mcp.server"
+
+def parse_importtime(text: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into (module, self us, cumulative us)."""
+    modules = []
+    for line in text.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if not fields[0].isdigit():
+            # The header line
+            continue
+        modules.append((fields[2], int(fields[0]), int(fields[1])))
+    return modules
+
+def package_of(module: str) -> str:
+    """Group a module under its top-level package; the server's own modules together."""
+    if module.startswith("src.runpod_mcp") or module == "src":
+        return "runpod_mcp"
+    top = module.split(".")[0]
+    return "stdlib" if top in sys.stdlib_module_names else top
+
+def server_env() -> Dict[str, str]:
+    """Return the environment of a server subprocess."""
+    env = dict(os.environ)
+    env.setdefault("RUNPOD_API_KEY", "startup-benchmark")
+    return env
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float], List[Tuple[str, int, int]]]:
+    """Import ``module`` in a fresh interpreter.
+
+    Returns:
+        Total import time in ms, self time in ms per package, and the
+        parsed modules
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=_ROOT, env=server_env(), check=True,
+    )
+    modules = parse_importtime(result.stderr)
+    packages: Dict[str, float] = defaultdict(float)
+    for name, self_us, _ in modules:
+        packages[package_of(name)] += self_us / 1000
+    total = sum(self_us for _, self_us, _ in modules) / 1000
+    return total, dict(packages), modules
+
+async def first_response() -> Tuple[float, float]:
+    """Spawn a stdio server and time its first two responses.
+
+    Returns:
+        Seconds from spawn to the ``initialize`` result and to the
+        ``status://version`` result
+    """
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", SERVER_MODULE, "--log-level", "WARNING",
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+        cwd=_ROOT, env=server_env(),
+    )
+
+    async def request(message: Dict[str, Any]) -> Dict[str, Any]:
+        process.stdin.write((json.dumps(message) + "\n").encode())
+        await process.stdin.drain()
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                raise RuntimeError(f"Server exited with code {await process.wait()}")
+            response = json.loads(line)
+            if response.get("id") == message["id"]:
+                if "error" in response:
+                    raise RuntimeError(f"{message['method']} failed: {response['error']}")
+                return response
+
+    try:
+        await request({
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "startup-benchmark", "version": "1"},
+            },
+        })
+        initialized = time.perf_counter() - start
+        process.stdin.write(b'{"jsonrpc": "2.0", "method": "notifications/initialized"}\n')
+        response = await request({
+            "jsonrpc": "2.0", "id": 2, "method": "resources/read", "params": {"uri": "status://version"},
+        })
+        version = time.perf_counter() - start
+        if not response["result"]["contents"][0]["text"].startswith("RunPod MCP Server"):
+            raise RuntimeError(f"Unexpected status://version response: {response}")
+        return initialized, version
+    finally:
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Return the median, p90 and minimum of values in ms."""
+    ms = [value * 1000 for value in values]
+    return {"p50_ms": percentile(ms, 50), "p90_ms": percentile(ms, 90), "min_ms": min(ms)}
+
+def run_startup(args) -> Dict[str, Any]:
+    """Measure import times and time to first response."""
+    # Warm-up run: writes bytecode caches and the OS file cache
+    import_profile(args.module)
+    asyncio.run(first_response())
+
+    totals: List[float] = []
+    packages: Dict[str, List[float]] = defaultdict(list)
+    slowest: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        total, by_package, modules = import_profile(args.module)
+        totals.append(total / 1000)
+        for package, ms in by_package.items():
+            packages[package].append(ms / 1000)
+        for name, self_us, _ in modules:
+            slowest[name].append(self_us)
+
+    initialized: List[float] = []
+    version: List[float] = []
+    for _ in range(args.runs):
+        first, second = asyncio.run(first_response())
+        initialized.append(first)
+        version.append(second)
+
+    top = sorted(slowest.items(), key=lambda item: -percentile(item[1], 50))[:args.top]
+    by_package = {package: summarize(values)["p50_ms"] for package, values in packages.items()}
+    return {
+        "import": summarize(totals),
+        "import_by_package_ms": dict(sorted(by_package.items(), key=lambda item: -item[1])),
+        "slowest_modules_ms": {name: percentile(values, 50) / 1000 for name, values in top},
+        "initialize": summarize(initialized),
+        "first_version_read": summarize(version),
+    }
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark RunPod MCP server startup")
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs of each kind")
+    parser.add_argument("--module", default=SERVER_MODULE, help="Module whose import time is profiled")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to report")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the benchmark and write its results."""
+    args = parse_args(argv)
+    print(f"Measuring startup over {args.runs} runs...", file=sys.stderr)
+    write_json({"meta": run_metadata(vars(args)), "startup": run_startup(args)}, args.output)
+
+if __name__ == "__main__":
+    main()
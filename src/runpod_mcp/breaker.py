@@ -0,0 +1,201 @@
+"""
+Circuit breakers for the RunPod API client.
+
+Tracks upstream failures per route group (pods, endpoints, gpus, ...).
+After repeated failures a group's breaker opens and calls fail fast
+instead of waiting for timeouts; after a cool-down a single trial call
+is let through to probe whether the API has recovered.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open."""
+    
+    def __init__(self, group: str, retry_in: float):
+        self.group = group
+        self.retry_in = retry_in
+        super().__init__(
+            f"RunPod API circuit for '{group}' is open after repeated failures; "
+            f"retrying in {retry_in:.0f}s"
+        )
+
+def is_outage_error(error: Exception) -> bool:
+    """Whether an error indicates the API is unavailable (not a client error)."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return False
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one route group."""
+    
+    def __init__(
+        self,
+        group: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the breaker.
+        
+        Args:
+            group: Route group name
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before a trial call
+            clock: Monotonic clock function
+        """
+        self.group = group
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._clock = clock
+    
+    def before_call(self) -> None:
+        """Check whether a call may proceed.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial call already in flight
+        """
+        if self.state == OPEN:
+            elapsed = self._clock() - self.opened_at
+            if elapsed < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError(self.group, self.reset_timeout - elapsed)
+            self.state = HALF_OPEN
+            self._trial_in_flight = False
+        
+        if self.state == HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError(self.group, 0.0)
+            self._trial_in_flight = True
+    
+    def abort_call(self) -> None:
+        """Forget a call that was cancelled before it completed."""
+        self._trial_in_flight = False
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self.state = CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+    
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed call; only outage errors count towards opening."""
+        if not is_outage_error(error):
+            if self.state == HALF_OPEN:
+                # The API answered, so it is reachable again
+                self.record_success()
+            return
+        
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = self._clock()
+            self._trial_in_flight = False
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state for reporting."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "timesOpened": self.times_opened,
+        }
+
+class CircuitBreakers:
+    """Circuit breakers keyed by route group."""
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker registry.
+        
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+                (0 disables circuit breaking)
+            reset_timeout: Seconds a circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+    
+    @staticmethod
+    def group_for(route: str) -> str:
+        """Return the route group of a route template, e.g. /pods/{id} -> pods."""
+        return route.strip("/").split("/", 1)[0] or "root"
+    
+    def get(self, route: str) -> Optional[CircuitBreaker]:
+        """Return the breaker for a route, or None if breaking is disabled."""
+        if self.failure_threshold <= 0:
+            return None
+        group = self.group_for(route)
+        breaker = self.breakers.get(group)
+        if breaker is None:
+            breaker = self.breakers[group] = CircuitBreaker(
+                group, self.failure_threshold, self.reset_timeout
+            )
+        return breaker
+    
+    def configure(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Change the settings of this registry and of its existing breakers."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        for breaker in self.breakers.values():
+            breaker.failure_threshold = failure_threshold
+            breaker.reset_timeout = reset_timeout
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every breaker for reporting."""
+        return {group: breaker.snapshot() for group, breaker in self.breakers.items()}
+
+class SnapshotStore:
+    """Size-bounded store of the last successful response per request.
+    
+    Used to serve last known data, annotated with its age, while the API
+    is unavailable.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """Initialize the store.
+        
+        Args:
+            max_entries: Maximum number of snapshots kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+    
+    def put(self, key: str, value: Any) -> None:
+        """Remember the latest successful response for a request."""
+        self._entries[key] = (value, time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Forget every snapshot."""
+        self._entries.clear()
+    
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, age in seconds) for a request, if known."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        return value, time.time() - stored_at
@@ -0,0 +1,152 @@
+"""
+Bulk pod lifecycle operations for the RunPod MCP server.
+
+Selects pods by id or by selector (name prefix, GPU type, status) and
+runs start/stop/terminate actions on them with bounded concurrency. The
+client's rate limiter still paces the individual calls, so a large
+batch queues instead of tripping the API's rate limits.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from .catalog import normalize_gpu_name
+
+@dataclass
+class PodActionResult:
+    """Outcome of one pod action in a bulk operation."""
+    pod_id: str
+    name: str
+    ok: bool
+    elapsed: float
+    error: Optional[str] = None
+
+def _matches_gpu(pod: Dict[str, Any], gpu_type: str) -> bool:
+    query = normalize_gpu_name(gpu_type)
+    names = (pod.get("gpuDisplayName"), pod.get("gpuTypeId"), (pod.get("machine") or {}).get("gpuDisplayName"))
+    return any(name and query in normalize_gpu_name(name) for name in names)
+
+def select_pods(
+    pods: Iterable[Dict[str, Any]],
+    pod_ids: Optional[List[str]] = None,
+    name_prefix: Optional[str] = None,
+    gpu_type: Optional[str] = None,
+    status: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Select pods by id list and/or selectors.
+    
+    All given criteria must match. IDs that are not in ``pods`` are still
+    selected, as minimal ``{"id": ...}`` entries, so that an explicit id
+    list works even when the listing is incomplete.
+    
+    Args:
+        pods: Known pods
+        pod_ids: Explicit pod IDs
+        name_prefix: Select pods whose name starts with this prefix
+        gpu_type: Select pods on this GPU type (e.g. "4090", "A100 80GB")
+        status: Select pods with this desired status (e.g. RUNNING, EXITED)
+    
+    Returns:
+        The selected pods
+    """
+    wanted = {str(pod_id) for pod_id in pod_ids} if pod_ids else None
+    selected = []
+    found = set()
+    for pod in pods:
+        pod_id = str(pod.get("id"))
+        if wanted is not None and pod_id not in wanted:
+            continue
+        if name_prefix and not str(pod.get("name") or "").startswith(name_prefix):
+            continue
+        if gpu_type and not _matches_gpu(pod, gpu_type):
+            continue
+        if status and str(pod.get("desiredStatus") or "").upper() != status.upper():
+            continue
+        selected.append(pod)
+        found.add(pod_id)
+    
+    if wanted is not None and not (name_prefix or gpu_type or status):
+        selected.extend({"id": pod_id} for pod_id in pod_ids if str(pod_id) not in found)
+    return selected
+
+def concurrency_limit(requested: Optional[int], maximum: int) -> int:
+    """Return the concurrency of a bulk operation, capped at ``maximum``.
+    
+    Args:
+        requested: Concurrency asked for by the caller, or None for ``maximum``
+        maximum: Configured limit (``config.bulk_concurrency``)
+    
+    Returns:
+        A concurrency between 1 and ``maximum``
+    
+    Raises:
+        ValueError: If ``requested`` is below 1
+    """
+    if requested is None:
+        return max(1, maximum)
+    if requested < 1:
+        raise ValueError(f"concurrency must be at least 1, got {requested}")
+    return max(1, min(requested, maximum))
+
+def describe_error(error: Exception) -> str:
+    """Return a short description of a failed API call."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}: {error.response.text[:200] or error.response.reason_phrase}"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timed out"
+    return str(error) or type(error).__name__
+
+async def run_bulk(
+    action: Callable[[str], Awaitable[Any]],
+    pods: List[Dict[str, Any]],
+    concurrency: int = 8
+) -> List[PodActionResult]:
+    """Run an action on every pod with at most ``concurrency`` calls in flight.
+    
+    Failures are recorded per pod and never cancel the rest of the batch.
+    
+    Args:
+        action: Coroutine function taking a pod ID, e.g. client.stop_pod
+        pods: Pods to act on
+        concurrency: Maximum number of concurrent calls
+    
+    Returns:
+        One result per pod, in the order of ``pods``
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run_one(pod: Dict[str, Any]) -> PodActionResult:
+        pod_id = str(pod.get("id"))
+        name = pod.get("name") or ""
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await action(pod_id)
+            except Exception as e:
+                return PodActionResult(pod_id, name, False, time.monotonic() - start, describe_error(e))
+            return PodActionResult(pod_id, name, True, time.monotonic() - start)
+    
+    return list(await asyncio.gather(*(run_one(pod) for pod in pods)))
+
+def format_results(verb: str, results: List[PodActionResult], elapsed: float) -> str:
+    """Format bulk results as a Markdown summary and per-pod table."""
+    failed = [result for result in results if not result.ok]
+    lines = [
+        f"# Bulk {verb}: {len(results) - len(failed)}/{len(results)} succeeded in {elapsed:.2f}s",
+        "",
+        "| Pod ID | Name | Result | Time |",
+        "|---|---|---|---|",
+    ]
+    for result in results:
+        outcome = "ok" if result.ok else f"failed: {result.error}"
+        lines.append(f"| {result.pod_id} | {result.name} | {outcome} | {result.elapsed:.2f}s |")
+    if failed:
+        lines.extend([
+            "",
+            f"{len(failed)} pods failed; retry them with pod_ids={[result.pod_id for result in failed]}",
+        ])
+    return "\n".join(lines)
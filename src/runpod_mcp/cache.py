@@ -0,0 +1,181 @@
+"""
+Response cache for the RunPod API client.
+
+Provides a size-bounded TTL cache with stale-while-revalidate semantics:
+fresh entries are served directly, stale entries are served immediately
+while a single background refresh runs, and expired entries are fetched
+again before returning.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheEntry:
+    """A cached value and the times at which it goes stale and expires."""
+    value: Any
+    fetched_at: float
+    fresh_until: float
+    stale_until: float
+    
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the value was fetched."""
+        return (now if now is not None else time.monotonic()) - self.fetched_at
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+    
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain dictionary."""
+        return dict(self.__dict__)
+
+class TTLCache:
+    """Size-bounded TTL cache with stale-while-revalidate.
+    
+    Entries are evicted least-recently-used first once ``max_entries``
+    is reached. Counters are kept both globally and per key.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in memory
+        """
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self.key_stats: Dict[str, CacheStats] = {}
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _count(self, key: str, counter: str) -> None:
+        """Increment a counter globally and for the given key."""
+        setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+        stats = self.key_stats.setdefault(key, CacheStats())
+        setattr(stats, counter, getattr(stats, counter) + 1)
+    
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for a key without touching counters or TTLs."""
+        return self._entries.get(key)
+    
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0) -> None:
+        """Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the value is considered fresh
+            stale_ttl: Extra seconds a stale value may be served while refreshing
+        """
+        now = time.monotonic()
+        self._entries[key] = CacheEntry(
+            value=value,
+            fetched_at=now,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + stale_ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._count(evicted, "evictions")
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one key, or every key when ``key`` is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0.0
+    ) -> Any:
+        """Return a cached value, fetching or refreshing it as needed.
+        
+        Args:
+            key: Cache key
+            fetch: Coroutine function producing a fresh value
+            ttl: Seconds a fetched value is considered fresh
+            stale_ttl: Extra seconds a stale value may be served while a
+                background refresh runs
+        
+        Returns:
+            The cached or freshly fetched value
+        """
+        if ttl <= 0:
+            return await fetch()
+        
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        
+        if entry is not None and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self._count(key, "hits")
+            return entry.value
+        
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self._count(key, "stale_hits")
+            if key not in self._refreshing:
+                self._refreshing[key] = asyncio.ensure_future(
+                    self._refresh(key, fetch, ttl, stale_ttl)
+                )
+            return entry.value
+        
+        self._count(key, "misses")
+        value = await fetch()
+        self.set(key, value, ttl, stale_ttl)
+        return value
+    
+    async def _refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float
+    ) -> None:
+        """Refresh a stale entry in the background."""
+        try:
+            value = await fetch()
+            self.set(key, value, ttl, stale_ttl)
+            self._count(key, "refreshes")
+        except Exception as e:
+            self._count(key, "refresh_errors")
+            logger.warning(f"Background refresh of cache key '{key}' failed: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cache size and counters for reporting."""
+        now = time.monotonic()
+        return {
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "totals": self.stats.as_dict(),
+            "keys": {
+                key: {
+                    **stats.as_dict(),
+                    "ageSeconds": round(self._entries[key].age(now), 3) if key in self._entries else None,
+                }
+                for key, stats in self.key_stats.items()
+            },
+        }
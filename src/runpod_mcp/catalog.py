@@ -0,0 +1,143 @@
+"""
+Indexed GPU catalog for the RunPod MCP server.
+
+Builds lookup tables over the GPU type list once per catalog refresh so
+that detail and filter queries are dictionary lookups instead of scans.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+# Prefixes that users commonly leave out when naming a GPU
+_VENDOR_PREFIXES = ("nvidia", "geforce", "amd", "radeon")
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def normalize_gpu_name(name: str) -> str:
+    """Normalize a GPU name for lookups.
+    
+    Lowercases the name and drops everything but letters and digits, so
+    "A100 80GB", "a100-80gb" and "A100_80GB" all map to "a10080gb".
+    """
+    return _NON_ALNUM.sub("", str(name).lower())
+
+def _aliases_for(gpu: Dict[str, Any]) -> Iterable[str]:
+    """Generate normalized aliases for a GPU type."""
+    names = [gpu.get("displayName"), gpu.get("id")]
+    memory = gpu.get("memoryInGb")
+    
+    for name in names:
+        if not name:
+            continue
+        words = str(name).lower().split()
+        # Drop leading vendor/brand words ("NVIDIA GeForce RTX 4090" -> "rtx 4090")
+        while words and words[0] in _VENDOR_PREFIXES:
+            words = words[1:]
+        if not words:
+            continue
+        short = normalize_gpu_name(" ".join(words))
+        yield short
+        if memory and not short.endswith("gb"):
+            yield f"{short}{memory}gb"
+
+class GpuCatalog:
+    """Immutable index over a list of GPU type objects.
+    
+    Indexes GPUs by id, normalized display name and aliases, with
+    secondary indexes by VRAM size and cloud type (secure/community).
+    """
+    
+    def __init__(self, gpus: List[Dict[str, Any]]):
+        """Build the catalog indexes.
+        
+        Args:
+            gpus: GPU type objects as returned by the RunPod API
+        """
+        self.source = gpus
+        self.gpus: List[Dict[str, Any]] = [g for g in gpus if isinstance(g, dict)]
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_alias: Dict[str, Dict[str, Any]] = {}
+        self.by_vram: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_cloud: Dict[str, List[Dict[str, Any]]] = {"secure": [], "community": []}
+        
+        ambiguous = set()
+        for gpu in self.gpus:
+            gpu_id = gpu.get("id")
+            if gpu_id:
+                self.by_id.setdefault(str(gpu_id), gpu)
+            
+            name = gpu.get("displayName")
+            if name:
+                self.by_name.setdefault(normalize_gpu_name(name), gpu)
+            
+            # Aliases that would match more than one GPU are dropped
+            for alias in set(_aliases_for(gpu)):
+                existing = self.by_alias.get(alias)
+                if existing is not None and existing is not gpu:
+                    ambiguous.add(alias)
+                else:
+                    self.by_alias[alias] = gpu
+            
+            memory = gpu.get("memoryInGb")
+            if isinstance(memory, (int, float)):
+                self.by_vram[int(memory)].append(gpu)
+            
+            if gpu.get("secureCloud"):
+                self.by_cloud["secure"].append(gpu)
+            if gpu.get("communityCloud"):
+                self.by_cloud["community"].append(gpu)
+        
+        for alias in ambiguous:
+            self.by_alias.pop(alias, None)
+        
+        self.vram_sizes = sorted(self.by_vram)
+    
+    def __len__(self) -> int:
+        return len(self.gpus)
+    
+    def lookup(self, query: str) -> Optional[Dict[str, Any]]:
+        """Find a GPU by id, display name or alias.
+        
+        Args:
+            query: GPU id, display name or alias such as "a100-80gb"
+        
+        Returns:
+            The matching GPU type object, or None if not found
+        """
+        if query in self.by_id:
+            return self.by_id[query]
+        
+        key = normalize_gpu_name(query)
+        return self.by_name.get(key) or self.by_alias.get(key)
+    
+    def filter(
+        self,
+        min_vram: Optional[int] = None,
+        cloud: Optional[str] = None,
+        available: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Return GPUs matching the given criteria.
+        
+        Args:
+            min_vram: Minimum VRAM in GB
+            cloud: "secure" or "community"
+            available: Only include GPUs with this availability
+        
+        Returns:
+            Matching GPU type objects
+        """
+        if cloud is not None:
+            candidates = list(self.by_cloud.get(cloud.lower(), []))
+            if min_vram is not None:
+                candidates = [g for g in candidates if (g.get("memoryInGb") or 0) >= min_vram]
+        elif min_vram is not None:
+            sizes = [size for size in self.vram_sizes if size >= min_vram]
+            candidates = [g for size in sizes for g in self.by_vram[size]]
+        else:
+            candidates = list(self.gpus)
+        
+        if available is not None:
+            candidates = [g for g in candidates if bool(g.get("available", False)) == available]
+        return candidates
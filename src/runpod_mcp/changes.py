@@ -0,0 +1,223 @@
+"""
+Change feed for the RunPod MCP server.
+
+Compares successive fleet mirror snapshots of pods, endpoints and
+network volumes by id and records compact change events (created,
+status changed, cost changed, terminated) under a monotonically
+increasing cursor. Watchers read only the changes since their last
+cursor instead of re-reading whole listings, and subscribed MCP clients
+are sent resources/updated notifications for the affected resources.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from pydantic import AnyUrl
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+STATUS_CHANGED = "status_changed"
+COST_CHANGED = "cost_changed"
+TERMINATED = "terminated"
+
+# Status field of each mirrored collection
+_STATUS_FIELDS = {
+    "pods": "desiredStatus",
+    "endpoints": "status",
+    "volumes": "status",
+}
+
+# Resources that show a collection, and the detail resource of one item
+_RESOURCE_URIS = {
+    "pods": ("pods://list", "pods://details/{id}"),
+    "endpoints": ("serverless://endpoints", "serverless://endpoint/{id}"),
+    "volumes": ("storage://volumes", "storage://volume/{id}"),
+}
+
+CHANGES_URI_PREFIX = "changes://"
+
+@dataclass
+class ChangeEvent:
+    """A single change to a pod, endpoint or volume."""
+    cursor: int
+    kind: str
+    item_id: str
+    event: str
+    old: Any = None
+    new: Any = None
+    timestamp: float = 0.0
+    
+    def describe(self) -> str:
+        """Return a one-line description of the change."""
+        line = f"[{self.cursor}] {self.kind} {self.item_id} {self.event}"
+        if self.event in (STATUS_CHANGED, COST_CHANGED):
+            line += f": {self.old} -> {self.new}"
+        elif self.new is not None:
+            line += f" ({self.new})"
+        return line
+    
+    def resource_uris(self) -> Tuple[str, str]:
+        """Return the list and detail resource URIs affected by the change."""
+        list_uri, detail_uri = _RESOURCE_URIS[self.kind]
+        return list_uri, detail_uri.format(id=self.item_id)
+
+def _item_state(kind: str, item: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Return the (status, hourly cost) of an item."""
+    status = item.get(_STATUS_FIELDS[kind])
+    cost = item.get("costPerHr", item.get("costPerHour"))
+    if cost is None:
+        cost = (item.get("runtime") or {}).get("costPerHr")
+    return status, cost
+
+def diff_collection(
+    kind: str,
+    old: Dict[str, Tuple[Any, Any]],
+    new: Dict[str, Tuple[Any, Any]]
+) -> List[Tuple[str, str, Any, Any]]:
+    """Compare two snapshots of (status, cost) keyed by id.
+    
+    Args:
+        kind: Collection name
+        old: Previous snapshot
+        new: Current snapshot
+    
+    Returns:
+        List of (item id, event, old value, new value) tuples
+    """
+    changes = []
+    for item_id, (status, cost) in new.items():
+        previous = old.get(item_id)
+        if previous is None:
+            changes.append((item_id, CREATED, None, status))
+            continue
+        old_status, old_cost = previous
+        if status != old_status:
+            event = TERMINATED if str(status).upper() == "TERMINATED" else STATUS_CHANGED
+            changes.append((item_id, event, old_status, status))
+        if cost != old_cost:
+            changes.append((item_id, COST_CHANGED, old_cost, cost))
+    for item_id, (old_status, _) in old.items():
+        if item_id not in new and str(old_status).upper() != "TERMINATED":
+            changes.append((item_id, TERMINATED, old_status, None))
+    return changes
+
+class ChangeFeed:
+    """Bounded log of change events derived from fleet mirror snapshots."""
+    
+    def __init__(self, max_events: int = 1000):
+        """Initialize the feed.
+        
+        Args:
+            max_events: Number of most recent events retained
+        """
+        self.max_events = max_events
+        self.cursor = 0
+        self.events: "deque[ChangeEvent]" = deque(maxlen=max_events)
+        self._state: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+        self._listeners: List[Callable[[List[ChangeEvent]], Any]] = []
+    
+    def add_listener(self, listener: Callable[[List[ChangeEvent]], Any]) -> None:
+        """Call ``listener`` with each non-empty batch of new events."""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[List[ChangeEvent]], Any]) -> None:
+        """Unregister a listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    async def observe(self, collections) -> List[ChangeEvent]:
+        """Diff the mirror's collections against the previous snapshot.
+        
+        The first snapshot of a collection only establishes a baseline.
+        Suitable as a FleetMirror listener.
+        
+        Args:
+            collections: Mapping of collection name to MirroredCollection
+        
+        Returns:
+            The new events
+        """
+        now = time.time()
+        batch = []
+        for kind, collection in collections.items():
+            if collection.synced_at is None:
+                continue
+            state = {item_id: _item_state(kind, item) for item_id, item in collection.by_id.items()}
+            previous = self._state.get(kind)
+            self._state[kind] = state
+            if previous is None:
+                continue
+            for item_id, event, old, new in diff_collection(kind, previous, state):
+                self.cursor += 1
+                batch.append(ChangeEvent(self.cursor, kind, item_id, event, old, new, now))
+        
+        if batch:
+            self.events.extend(batch)
+            for listener in self._listeners:
+                try:
+                    result = listener(batch)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Change feed listener failed: {e}")
+        return batch
+    
+    def since(self, cursor: int) -> Tuple[List[ChangeEvent], bool]:
+        """Return the events after ``cursor``.
+        
+        Returns:
+            Tuple of (events, complete); ``complete`` is False when events
+            after the cursor have already been dropped from the log
+        """
+        oldest = self.events[0].cursor if self.events else self.cursor + 1
+        complete = cursor >= oldest - 1
+        return [event for event in self.events if event.cursor > cursor], complete
+
+class ResourceSubscriptions:
+    """Tracks resources/subscribe requests and sends resources/updated."""
+    
+    def __init__(self):
+        self._sessions: Dict[str, Set[Any]] = {}
+        self.sent = 0
+    
+    def subscribe(self, uri: str, session) -> None:
+        """Subscribe a client session to updates of a resource."""
+        self._sessions.setdefault(uri, set()).add(session)
+    
+    def unsubscribe(self, uri: str, session) -> None:
+        """Remove a client session's subscription to a resource."""
+        sessions = self._sessions.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[uri]
+    
+    def affected_uris(self, events: Iterable[ChangeEvent]) -> Set[str]:
+        """Return the subscribed URIs whose content changed with ``events``."""
+        changed = set()
+        for event in events:
+            changed.update(event.resource_uris())
+        uris = {uri for uri in self._sessions if uri in changed}
+        uris.update(uri for uri in self._sessions if uri.startswith(CHANGES_URI_PREFIX))
+        return uris
+    
+    async def notify(self, events: List[ChangeEvent]) -> None:
+        """Send resources/updated for every subscribed resource that changed."""
+        for uri in self.affected_uris(events):
+            for session in list(self._sessions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                    self.sent += 1
+                except Exception as e:
+                    # The client has most likely disconnected
+                    logger.debug(f"Dropping subscription to {uri}: {e}")
+                    self.unsubscribe(uri, session)
+    
+    def count(self) -> int:
+        """Return the number of active subscriptions."""
+        return sum(len(sessions) for sessions in self._sessions.values())
@@ -5,420 +5,900 @@ Provides authenticated access to the RunPod API.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union
-import requests
+import contextvars
+import time
+from typing import AsyncIterator, Awaitable, Dict, List, Any, Optional, Set, Tuple, Type, Union
+from urllib.parse import urlencode
+import httpx
 from .config import RunPodConfig
+from .cache import TTLCache
+from .catalog import GpuCatalog
+from .singleflight import SingleFlight
+from .retry import RetryEngine, RetryPolicy
+from .ratelimit import RateLimiter
+from .breaker import CircuitBreakers, CircuitOpenError, SnapshotStore, is_outage_error
+from .conditional import ValidatorStore
+from .decoding import create_decoder
+from .models import Endpoint, Model, NetworkVolume, Pod, Template
+from .telemetry import Telemetry
+from .tracing import span
 
 logger = logging.getLogger(__name__)
 
+# Methods whose identical concurrent requests can share one upstream call
+_COALESCED_METHODS = ("GET", "HEAD")
+
+# Fixed path segments of the RunPod REST API; anything else is an ID
+_STATIC_SEGMENTS = frozenset({
+    "gpus", "pods", "start", "stop", "terminate", "templates", "endpoints",
+    "metrics", "serverless", "network-volumes", "me",
+})
+
+# Page size used by the iter_* methods when none is configured
+_DEFAULT_PAGE_SIZE = 100
+
+# Age of the oldest snapshot served in place of live data in the current
+# request context, or None if every response so far was live
+_stale_data_age: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "runpod_stale_data_age", default=None
+)
+
+def _request_key(
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    model: Optional[Type[Model]] = None
+) -> str:
+    """Build a key identifying equivalent requests."""
+    key = f"{method} {path}"
+    if params:
+        key += "?" + urlencode(sorted(dict(params).items()))
+    if model is not None:
+        # Decoded into models, so not interchangeable with the plain response
+        key += f" as {model.__name__}"
+    return key
+
+async def _with_stale_age(call: Awaitable[Any]) -> Tuple[Any, Optional[float]]:
+    """Await ``call`` and return its result with the stale data age it left.
+    
+    Context variables set in a child task do not reach its parent, so a
+    call run as its own task reports the age alongside its result.
+    """
+    result = await call
+    return result, _stale_data_age.get()
+
+def route_for(path: str) -> str:
+    """Turn a request path into a route template, e.g. /pods/{id}/stop."""
+    segments = [
+        segment if segment in _STATIC_SEGMENTS else "{id}"
+        for segment in path.strip("/").split("/")
+        if segment
+    ]
+    return "/" + "/".join(segments)
+
+def _http2_available() -> bool:
+    """Check whether the optional HTTP/2 dependency (h2) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 class RunPodClient:
     """Client for interacting with RunPod API.
     
     This class uses direct REST API calls to interact with RunPod services.
+    Requests are sent through a shared asyncio HTTP connection pool, so
+    concurrent calls reuse a small number of keep-alive connections
+    instead of blocking executor threads.
     """
     
-    def __init__(self, config: RunPodConfig):
+    def __init__(
+        self,
+        config: RunPodConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        telemetry: Optional[Telemetry] = None
+    ):
         """Initialize the RunPod client.
         
         Args:
             config: RunPod configuration with API key and URL
+            transport: Optional httpx transport (mainly for testing)
+            telemetry: Optional registry recording request latencies and sizes
         """
         self.config = config
+        self.telemetry = telemetry
         
-        # Initialize direct REST client
+        # Initialize direct REST client. All traffic goes to a single host,
+        # so the pool limits are effectively per-host limits.
         self.api_base = config.api_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {config.api_key}",
-            "Content-Type": "application/json"
-        })
+        self._transport = transport
+        self.session = self._build_session(config)
+        
+        # Requests in flight per session, and sessions replaced by
+        # reconfigure() that are waiting for theirs to finish
+        self._in_flight: Dict[httpx.AsyncClient, int] = {}
+        self._retired: Dict[httpx.AsyncClient, asyncio.Event] = {}
+        self._draining: Set[asyncio.Task] = set()
+        
+        # Cache for slow-changing catalog data (GPU types, templates)
+        self.cache = TTLCache(max_entries=config.cache_max_entries)
+        self._gpu_catalog: Optional[GpuCatalog] = None
+        
+        # Identical in-flight GET requests share a single upstream call
+        self.singleflight = SingleFlight()
+        
+        # Transient failures (429, 5xx, connection errors) are retried
+        self.retries = RetryEngine(RetryPolicy(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            retry_non_idempotent=config.retry_non_idempotent
+        ))
+        
+        # Route groups that keep failing fail fast instead of timing out, and
+        # reads fall back to the last known response while the API is down
+        self.breakers = CircuitBreakers(
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout
+        )
+        self.snapshots = SnapshotStore(max_entries=config.cache_max_entries)
+        
+        # Validators of large list responses for conditional refreshes
+        self.validators = ValidatorStore(max_entries=config.cache_max_entries)
+        
+        # Parses response bodies, listings straight into models
+        self.decoder = create_decoder(config.json_decoder)
+        
+        # Requests are paced by shared token buckets to stay under API limits
+        self.rate_limiter = self._build_rate_limiter(config)
         
         logger.info(f"RunPod client initialized with API URL: {self.api_base}")
     
-    # GPU related methods
+    def _build_session(self, config: RunPodConfig) -> httpx.AsyncClient:
+        """Create the HTTP connection pool for a configuration."""
+        http2 = config.http2
+        if http2 and not _http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        return httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {config.api_key}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            ),
+            timeout=config.request_timeout,
+            http2=http2,
+            transport=self._transport
+        )
     
-    def get_gpus(self) -> List[Dict[str, Any]]:
-        """Get available GPUs from RunPod.
+    @staticmethod
+    def _build_rate_limiter(config: RunPodConfig) -> RateLimiter:
+        """Create the rate limiter for a configuration."""
+        return RateLimiter(
+            rate=config.rate_limit,
+            burst=config.rate_limit_burst,
+            read_rate=config.read_rate_limit,
+            mutation_rate=config.mutation_rate_limit,
+            route_burst=config.route_rate_limit_burst
+        )
+    
+    async def reconfigure(self, config: RunPodConfig) -> None:
+        """Apply a new configuration without interrupting requests in flight.
         
-        Returns:
-            List of GPU objects with details
+        New requests, including retries of requests already in progress,
+        use a new connection pool built from ``config``. The old pool is
+        closed in the background once the requests sent through it have
+        finished, or after the request timeout, so this returns without
+        waiting for them. Retry, rate limit and circuit breaker settings
+        are replaced in place. Cached responses are dropped when the API
+        URL or key changes, since they belong to another account.
+        
+        Args:
+            config: New RunPod configuration
         """
-        response = self.session.get(f"{self.api_base}/gpus")
-        response.raise_for_status()
-        return response.json()
+        old_config, old_session = self.config, self.session
+        
+        # Each attribute is swapped in a single assignment, so a request
+        # sees either the old or the new value, never a partial state
+        self.session = self._build_session(config)
+        self.api_base = config.api_url
+        self.config = config
+        self.retries.policy = RetryPolicy(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            retry_non_idempotent=config.retry_non_idempotent
+        )
+        rate_settings = ("rate_limit", "rate_limit_burst", "read_rate_limit", "mutation_rate_limit", "route_rate_limit_burst")
+        if any(getattr(config, name) != getattr(old_config, name) for name in rate_settings):
+            self.rate_limiter = self._build_rate_limiter(config)
+        self.breakers.configure(config.breaker_failure_threshold, config.breaker_reset_timeout)
+        if config.json_decoder != old_config.json_decoder:
+            self.decoder = create_decoder(config.json_decoder)
+        if (config.api_url, config.api_key) != (old_config.api_url, old_config.api_key):
+            self.cache.invalidate()
+            self.snapshots.clear()
+            self.validators.clear()
+            self._gpu_catalog = None
+        logger.info(f"RunPod client reconfigured with API URL: {self.api_base}")
+        
+        if not self._in_flight.get(old_session):
+            await old_session.aclose()
+            return
+        # Registered before any request can finish, so none is missed
+        drained = self._retired[old_session] = asyncio.Event()
+        task = asyncio.ensure_future(self._close_when_drained(old_session, drained, old_config.request_timeout))
+        self._draining.add(task)
+        task.add_done_callback(self._draining.discard)
+    
+    async def _close_when_drained(self, session: httpx.AsyncClient, drained: asyncio.Event, timeout: float) -> None:
+        """Close a replaced pool once its requests have finished, or after ``timeout``."""
+        try:
+            await asyncio.wait_for(drained.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Closing the previous connection pool with {self._in_flight.get(session, 0)} requests in flight")
+        finally:
+            self._retired.pop(session, None)
+            await session.aclose()
+    
+    def _release_session(self, session: httpx.AsyncClient) -> None:
+        """Record that a request sent through ``session`` has finished."""
+        remaining = self._in_flight[session] - 1
+        if remaining:
+            self._in_flight[session] = remaining
+            return
+        del self._in_flight[session]
+        drained = self._retired.get(session)
+        if drained is not None:
+            drained.set()
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        conditional: bool = False,
+        model: Optional[Type[Model]] = None,
+        allow_stale: bool = False,
+        **kwargs
+    ) -> Any:
+        """Send a request to the RunPod API and decode the JSON response.
+        
+        Concurrent identical GET requests (same method, path and params)
+        are coalesced into one upstream call whose parsed result is shared.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to the base URL
+            conditional: Revalidate with ETag/Last-Modified and reuse the
+                previously parsed body when it has not changed
+            model: Decode the response, a listing, into models of this type
+            allow_stale: Answer a GET with the last known response if the
+                API is unavailable (see ``stale_data_age``)
+            **kwargs: Extra arguments passed to httpx (json, params, ...)
+        
+        Returns:
+            Decoded JSON response body
+        """
+        if method in _COALESCED_METHODS and "json" not in kwargs:
+            key = _request_key(method, path, kwargs.get("params"), model)
+            try:
+                result = await self.singleflight.do(
+                    key,
+                    lambda: self._send(method, path, conditional=conditional, model=model, **kwargs),
+                    group=f"{method} {route_for(path)}",
+                )
+            except Exception as e:
+                if not allow_stale:
+                    raise
+                return self._serve_snapshot(key, e)
+            self.snapshots.put(key, result)
+            return result
+        return await self._send(method, path, model=model, **kwargs)
+    
+    def _serve_snapshot(self, key: str, error: Exception) -> Any:
+        """Return the last known response of a failed read, or re-raise its error.
+        
+        Only outages (5xx, connection errors, open circuits) fall back to a
+        snapshot; the snapshot's age is recorded for ``stale_data_age``.
+        """
+        snapshot = self.snapshots.get(key) if self.config.serve_stale_on_error else None
+        if snapshot is None or not (isinstance(error, CircuitOpenError) or is_outage_error(error)):
+            raise error
+        value, age = snapshot
+        logger.warning(f"{key} failed ({error}); serving last known data from {age:.0f}s ago")
+        _stale_data_age.set(max(age, _stale_data_age.get() or 0.0))
+        return value
+    
+    def stale_data_age(self) -> Optional[float]:
+        """Age in seconds of snapshot data served in the current request.
+        
+        Returns:
+            Age of the oldest snapshot returned instead of live data while
+            the API was unavailable, or None if all data was live
+        """
+        return _stale_data_age.get()
+    
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        conditional: bool = False,
+        model: Optional[Type[Model]] = None,
+        **kwargs
+    ) -> Any:
+        """Send a request to the RunPod API, retrying transient failures.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to the base URL
+            conditional: Send a conditional request (see ``_request``)
+            model: Decode the response into models (see ``_request``)
+            **kwargs: Extra arguments passed to httpx (json, params, ...)
+        
+        Returns:
+            Decoded JSON response body
+        """
+        route = route_for(path)
+        with span(f"runpod {method} {route}", method=method, route=route):
+            return await self.retries.call(
+                method, route, lambda: self._send_once(method, path, conditional, model, **kwargs)
+            )
+    
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        conditional: bool = False,
+        model: Optional[Type[Model]] = None,
+        **kwargs
+    ) -> Any:
+        """Send a single request to the RunPod API and decode the response.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to the base URL
+            conditional: Send a conditional request (see ``_request``)
+            model: Decode the response into models (see ``_request``)
+            **kwargs: Extra arguments passed to httpx (json, params, ...)
+        
+        Returns:
+            Decoded JSON response body
+        """
+        key = _request_key(method, path, kwargs.get("params"), model)
+        route = route_for(path)
+        if conditional:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **self.validators.request_headers(key)}
+        
+        wait = await self.rate_limiter.acquire(method, route)
+        if wait > 1:
+            logger.debug(f"{method} {path} waited {wait:.2f}s for the rate limiter")
+        
+        breaker = self.breakers.get(route)
+        if breaker is not None:
+            breaker.before_call()
+        
+        start = time.perf_counter()
+        status = "error"
+        with span(f"http {method} {route}", path=path) as trace_span:
+            # Read both together, so a concurrent reconfigure() cannot pair
+            # the old pool with the new URL
+            session, api_base = self.session, self.api_base
+            self._in_flight[session] = self._in_flight.get(session, 0) + 1
+            try:
+                response = await session.request(method, f"{api_base}{path}", **kwargs)
+                status = str(response.status_code)
+                if not (conditional and response.status_code == 304):
+                    response.raise_for_status()
+            except asyncio.CancelledError:
+                status = "cancelled"
+                if breaker is not None:
+                    breaker.abort_call()
+                raise
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure(e)
+                raise
+            finally:
+                self._release_session(session)
+                if self.telemetry is not None:
+                    self._record_request(method, route, status, time.perf_counter() - start, wait)
+                if trace_span is not None:
+                    trace_span.set(status=status, ratelimit_wait_ms=round(wait * 1000, 1))
+        
+        if breaker is not None:
+            breaker.record_success()
+        if self.telemetry is not None:
+            self.telemetry.inc("runpod_api_response_bytes_total", len(response.content), method=method, route=route)
+        
+        if conditional:
+            if response.status_code == 304:
+                entry = self.validators.cached_value(key)
+                if entry is not None:
+                    return entry.value
+                # The stored body was evicted meanwhile; fetch it in full
+                kwargs.pop("headers", None)
+                return await self._send_once(method, path, model=model, **kwargs)
+            return self.validators.resolve(key, response, lambda changed: self._decode(changed, model))
+        return self._decode(response, model)
+    
+    def _decode(self, response: httpx.Response, model: Optional[Type[Model]] = None) -> Any:
+        """Decode a response body with the configured decoder."""
+        if model is not None:
+            return self.decoder.decode_list(response.content, model)
+        return self.decoder.loads(response.content)
+    
+    def _record_request(self, method: str, route: str, status: str, seconds: float, wait: float) -> None:
+        """Record the latency of one HTTP request and its rate limiter wait."""
+        self.telemetry.observe("runpod_api_request_seconds", seconds, method=method, route=route, status=status)
+        if wait:
+            self.telemetry.inc("runpod_api_ratelimit_wait_seconds_total", wait, method=method, route=route)
+    
+    async def _cached_request(
+        self,
+        key: str,
+        path: str,
+        ttl: float,
+        conditional: bool = False,
+        model: Optional[Type[Model]] = None,
+        allow_stale: bool = False
+    ) -> Any:
+        """Send a GET request through the catalog cache.
+        
+        A snapshot served during an outage is never cached, so the next
+        call after the API recovers fetches live data again.
+        
+        Args:
+            key: Cache key
+            path: API path relative to the base URL
+            ttl: Seconds the response is considered fresh
+            conditional: Revalidate expired entries with a conditional request
+            model: Decode the response into models (see ``_request``)
+            allow_stale: Fall back to the last known response (see ``_request``)
+        
+        Returns:
+            Decoded JSON response body, possibly served from cache
+        """
+        if model is not None:
+            key = f"{key}:{model.__name__}"
+        with span("cache", key=key) as trace_span:
+            misses = self.cache.stats.misses
+            try:
+                result = await self.cache.get_or_fetch(
+                    key,
+                    lambda: self._request("GET", path, conditional=conditional, model=model),
+                    ttl=ttl,
+                    stale_ttl=self.config.cache_stale_ttl
+                )
+            except Exception as e:
+                if not allow_stale:
+                    raise
+                return self._serve_snapshot(_request_key("GET", path, model=model), e)
+            if trace_span is not None:
+                trace_span.set(hit=self.cache.stats.misses == misses)
+            return result
+    
+    async def _fetch_page(self, path: str, page_size: int, offset: int, allow_stale: bool = False) -> List[Dict[str, Any]]:
+        """Fetch one page of a list endpoint."""
+        page = await self._request("GET", path, allow_stale=allow_stale, params={"limit": page_size, "offset": offset})
+        if isinstance(page, dict):
+            page = page.get("items", page.get("data", []))
+        return page or []
+    
+    async def _paginate(
+        self,
+        path: str,
+        page_size: Optional[int] = None,
+        allow_stale: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the items of a list endpoint page by page.
+        
+        The next page is requested while the current one is being consumed.
+        Paging stops at the first short page; if the API ignores the paging
+        parameters and returns everything at once, that single response is
+        yielded as-is.
+        
+        Args:
+            path: API path of the list endpoint
+            page_size: Items per page (default: config.list_page_size or 100)
+            allow_stale: Fall back to last known pages (see ``_request``)
+        
+        Yields:
+            Items of the collection in API order
+        """
+        page_size = page_size or self.config.list_page_size or _DEFAULT_PAGE_SIZE
+        offset = 0
+        first_id = None
+        next_page = asyncio.ensure_future(self._fetch_page(path, page_size, offset, allow_stale))
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if not page:
+                    break
+                page_first_id = page[0].get("id") if isinstance(page[0], dict) else None
+                if offset and page_first_id is not None and page_first_id == first_id:
+                    # The API ignored the offset and returned the first page again
+                    break
+                if not offset:
+                    first_id = page_first_id
+                if len(page) == page_size:
+                    offset += page_size
+                    next_page = asyncio.ensure_future(self._fetch_page(path, page_size, offset, allow_stale))
+                for item in page:
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
+    async def close(self) -> None:
+        """Close the underlying connection pool and any pools still draining."""
+        draining = list(self._draining)
+        for task in draining:
+            task.cancel()
+        await asyncio.gather(*draining, return_exceptions=True)
+        await self.session.aclose()
+    
+    async def __aenter__(self) -> "RunPodClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
     
-    async def get_gpu_types(self) -> List[Dict[str, Any]]:
+    # GPU related methods
+    
+    async def get_gpu_types(self, allow_stale: bool = False) -> List[Dict[str, Any]]:
         """Get available GPU types from RunPod (async).
         
+        Args:
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             List of GPU type objects with details
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_gpus)
-    
-    # Pod related methods
+        return await self._cached_request("gpu_types", "/gpus", self.config.gpu_cache_ttl, allow_stale=allow_stale)
     
-    def get_pods(self) -> List[Dict[str, Any]]:
-        """Get all pods for the current user.
+    async def get_gpu_catalog(self, allow_stale: bool = False) -> GpuCatalog:
+        """Get an indexed view of the available GPU types (async).
+        
+        The index is rebuilt only when the underlying GPU list changes,
+        i.e. once per catalog refresh.
+        
+        Args:
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
-            List of pod objects with details
+            GpuCatalog over the current GPU types
         """
-        response = self.session.get(f"{self.api_base}/pods")
-        response.raise_for_status()
-        return response.json()
+        gpu_types = await self.get_gpu_types(allow_stale=allow_stale)
+        if self._gpu_catalog is None or self._gpu_catalog.source is not gpu_types:
+            self._gpu_catalog = GpuCatalog(gpu_types or [])
+        return self._gpu_catalog
+    
+    # Pod related methods
     
-    async def get_pods(self) -> List[Dict[str, Any]]:
+    async def get_pods(self, typed: bool = False, allow_stale: bool = False) -> List[Any]:
         """Get all pods for the current user (async).
         
+        Args:
+            typed: Return Pod models holding only the fields resources show
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             List of pod objects with details
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.get_pods())
+        return await self._request(
+            "GET", "/pods", conditional=True, model=Pod if typed else None, allow_stale=allow_stale
+        )
     
-    def get_pod(self, pod_id: str) -> Dict[str, Any]:
-        """Get details for a specific pod.
+    def iter_pods(self, page_size: Optional[int] = None, allow_stale: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all pods page by page (async generator).
         
         Args:
-            pod_id: The ID of the pod to retrieve
-            
+            page_size: Pods per page
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
-            Pod details object
+            Async iterator of pod objects
         """
-        response = self.session.get(f"{self.api_base}/pods/{pod_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._paginate("/pods", page_size, allow_stale)
     
-    async def get_pod(self, pod_id: str) -> Dict[str, Any]:
+    async def get_pod(self, pod_id: str, allow_stale: bool = False) -> Dict[str, Any]:
         """Get details for a specific pod (async).
         
         Args:
             pod_id: The ID of the pod to retrieve
-            
-        Returns:
-            Pod details object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.get_pod(pod_id))
-    
-    def create_pod(self, pod_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new pod with the given configuration.
+            allow_stale: Serve last known data if the API is unavailable
         
-        Args:
-            pod_config: Configuration for the new pod
-            
         Returns:
-            Created pod details
+            Pod details object
         """
-        response = self.session.post(
-            f"{self.api_base}/pods",
-            json=pod_config
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/pods/{pod_id}", allow_stale=allow_stale)
     
     async def create_pod(self, pod_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new pod with the given configuration (async).
         
         Args:
             pod_config: Configuration for the new pod
-            
-        Returns:
-            Created pod details
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.create_pod(pod_config))
-    
-    def start_pod(self, pod_id: str) -> Dict[str, Any]:
-        """Start a stopped pod.
         
-        Args:
-            pod_id: The ID of the pod to start
-            
         Returns:
-            Response data
+            Created pod details
         """
-        response = self.session.post(f"{self.api_base}/pods/{pod_id}/start")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("POST", "/pods", json=pod_config)
     
     async def start_pod(self, pod_id: str) -> Dict[str, Any]:
         """Start a stopped pod (async).
         
         Args:
             pod_id: The ID of the pod to start
-            
-        Returns:
-            Response data
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.start_pod(pod_id))
-    
-    def stop_pod(self, pod_id: str) -> Dict[str, Any]:
-        """Stop a running pod.
         
-        Args:
-            pod_id: The ID of the pod to stop
-            
         Returns:
             Response data
         """
-        response = self.session.post(f"{self.api_base}/pods/{pod_id}/stop")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("POST", f"/pods/{pod_id}/start")
     
     async def stop_pod(self, pod_id: str) -> Dict[str, Any]:
         """Stop a running pod (async).
         
         Args:
             pod_id: The ID of the pod to stop
-            
-        Returns:
-            Response data
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.stop_pod(pod_id))
-    
-    def terminate_pod(self, pod_id: str) -> Dict[str, Any]:
-        """Terminate a pod.
         
-        Args:
-            pod_id: The ID of the pod to terminate
-            
         Returns:
             Response data
         """
-        response = self.session.post(f"{self.api_base}/pods/{pod_id}/terminate")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("POST", f"/pods/{pod_id}/stop")
     
     async def terminate_pod(self, pod_id: str) -> Dict[str, Any]:
         """Terminate a pod (async).
         
         Args:
             pod_id: The ID of the pod to terminate
-            
+        
         Returns:
             Response data
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.terminate_pod(pod_id))
+        return await self._request("POST", f"/pods/{pod_id}/terminate")
     
     # Pod templates
     
-    def get_pod_templates(self) -> List[Dict[str, Any]]:
-        """Get available pod templates.
+    async def get_pod_templates(self, typed: bool = False, allow_stale: bool = False) -> List[Any]:
+        """Get available pod templates (async).
+        
+        Args:
+            typed: Return Template models holding only the fields resources show
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
             List of pod template objects
         """
-        response = self.session.get(f"{self.api_base}/templates")
-        response.raise_for_status()
-        return response.json()
+        return await self._cached_request(
+            "pod_templates", "/templates", self.config.template_cache_ttl, conditional=True,
+            model=Template if typed else None, allow_stale=allow_stale
+        )
     
-    async def get_pod_templates(self) -> List[Dict[str, Any]]:
-        """Get available pod templates (async).
+    def iter_pod_templates(self, page_size: Optional[int] = None, allow_stale: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over pod templates page by page (async generator).
+        
+        Args:
+            page_size: Templates per page
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
-            List of pod template objects
+            Async iterator of pod template objects
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_pod_templates)
+        return self._paginate("/templates", page_size, allow_stale)
     
     # Serverless endpoints
     
-    def get_endpoints(self) -> List[Dict[str, Any]]:
-        """Get all serverless endpoints for the current user.
-        
-        Returns:
-            List of endpoint objects with details
-        """
-        response = self.session.get(f"{self.api_base}/endpoints")
-        response.raise_for_status()
-        return response.json()
-    
-    async def get_endpoints(self) -> List[Dict[str, Any]]:
+    async def get_endpoints(self, typed: bool = False, allow_stale: bool = False) -> List[Any]:
         """Get all serverless endpoints for the current user (async).
         
+        Args:
+            typed: Return Endpoint models holding only the fields resources show
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             List of endpoint objects with details
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_endpoints)
+        return await self._request("GET", "/endpoints", model=Endpoint if typed else None, allow_stale=allow_stale)
     
-    def get_endpoint(self, endpoint_id: str) -> Dict[str, Any]:
-        """Get details for a specific serverless endpoint.
+    def iter_endpoints(self, page_size: Optional[int] = None, allow_stale: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all serverless endpoints page by page (async generator).
         
         Args:
-            endpoint_id: The ID of the endpoint to retrieve
-            
+            page_size: Endpoints per page
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
-            Endpoint details object
+            Async iterator of endpoint objects
         """
-        response = self.session.get(f"{self.api_base}/endpoints/{endpoint_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._paginate("/endpoints", page_size, allow_stale)
     
-    async def get_endpoint(self, endpoint_id: str) -> Dict[str, Any]:
+    async def get_endpoint(self, endpoint_id: str, allow_stale: bool = False) -> Dict[str, Any]:
         """Get details for a specific serverless endpoint (async).
         
         Args:
             endpoint_id: The ID of the endpoint to retrieve
-            
-        Returns:
-            Endpoint details object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.get_endpoint(endpoint_id))
-    
-    def get_endpoint_metrics(self, endpoint_id: str) -> Dict[str, Any]:
-        """Get metrics for a specific serverless endpoint.
+            allow_stale: Serve last known data if the API is unavailable
         
-        Args:
-            endpoint_id: The ID of the endpoint to retrieve metrics for
-            
         Returns:
-            Endpoint metrics object
+            Endpoint details object
         """
-        response = self.session.get(f"{self.api_base}/endpoints/{endpoint_id}/metrics")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/endpoints/{endpoint_id}", allow_stale=allow_stale)
     
-    async def get_endpoint_metrics(self, endpoint_id: str) -> Dict[str, Any]:
+    async def get_endpoint_metrics(self, endpoint_id: str, allow_stale: bool = False) -> Dict[str, Any]:
         """Get metrics for a specific serverless endpoint (async).
         
         Args:
             endpoint_id: The ID of the endpoint to retrieve metrics for
-            
-        Returns:
-            Endpoint metrics object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.get_endpoint_metrics(endpoint_id))
-    
-    def get_serverless_templates(self) -> List[Dict[str, Any]]:
-        """Get available serverless templates.
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
-            List of serverless template objects
+            Endpoint metrics object
         """
-        response = self.session.get(f"{self.api_base}/serverless/templates")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/endpoints/{endpoint_id}/metrics", allow_stale=allow_stale)
     
-    async def get_serverless_templates(self) -> List[Dict[str, Any]]:
+    async def get_serverless_templates(self, typed: bool = False, allow_stale: bool = False) -> List[Any]:
         """Get available serverless templates (async).
         
+        Args:
+            typed: Return Template models holding only the fields resources show
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             List of serverless template objects
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_serverless_templates)
+        return await self._cached_request(
+            "serverless_templates", "/serverless/templates", self.config.template_cache_ttl,
+            model=Template if typed else None, allow_stale=allow_stale
+        )
     
     # Network storage
     
-    def get_network_volumes(self) -> List[Dict[str, Any]]:
-        """Get all network storage volumes for the current user.
-        
-        Returns:
-            List of network volume objects with details
-        """
-        response = self.session.get(f"{self.api_base}/network-volumes")
-        response.raise_for_status()
-        return response.json()
-    
-    async def get_network_volumes(self) -> List[Dict[str, Any]]:
+    async def get_network_volumes(self, typed: bool = False, allow_stale: bool = False) -> List[Any]:
         """Get all network storage volumes for the current user (async).
         
+        Args:
+            typed: Return NetworkVolume models holding only the fields resources show
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             List of network volume objects with details
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_network_volumes)
+        return await self._request(
+            "GET", "/network-volumes", conditional=True, model=NetworkVolume if typed else None,
+            allow_stale=allow_stale
+        )
     
-    def get_network_volume(self, volume_id: str) -> Dict[str, Any]:
-        """Get details for a specific network storage volume.
+    def iter_network_volumes(self, page_size: Optional[int] = None, allow_stale: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all network storage volumes page by page (async generator).
         
         Args:
-            volume_id: The ID of the volume to retrieve
-            
+            page_size: Volumes per page
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
-            Network volume details object
+            Async iterator of network volume objects
         """
-        response = self.session.get(f"{self.api_base}/network-volumes/{volume_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._paginate("/network-volumes", page_size, allow_stale)
     
-    async def get_network_volume(self, volume_id: str) -> Dict[str, Any]:
+    async def get_network_volume(self, volume_id: str, allow_stale: bool = False) -> Dict[str, Any]:
         """Get details for a specific network storage volume (async).
         
         Args:
             volume_id: The ID of the volume to retrieve
-            
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             Network volume details object
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.get_network_volume(volume_id))
+        return await self._request("GET", f"/network-volumes/{volume_id}", allow_stale=allow_stale)
     
     # Account information
     
-    def get_account_info(self) -> Dict[str, Any]:
-        """Get user account information.
-        
-        Returns:
-            Account information object
-        """
-        response = self.session.get(f"{self.api_base}/me")
-        response.raise_for_status()
-        return response.json()
-    
-    async def get_account_info(self) -> Dict[str, Any]:
+    async def get_account_info(self, allow_stale: bool = False) -> Dict[str, Any]:
         """Get user account information (async).
         
+        Args:
+            allow_stale: Serve last known data if the API is unavailable
+        
         Returns:
             Account information object
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_account_info)
+        return await self._request("GET", "/me", allow_stale=allow_stale)
     
-    def get_credit_balance(self) -> float:
-        """Get the current credit balance.
+    async def get_credit_balance(
+        self,
+        account_info: Optional[Dict[str, Any]] = None,
+        allow_stale: bool = False
+    ) -> float:
+        """Get the current credit balance (async).
+        
+        Args:
+            account_info: Already fetched account information to reuse
+                instead of requesting /me again
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
             Credit balance as a float
         """
-        response = self.session.get(f"{self.api_base}/me")
-        response.raise_for_status()
-        return response.json().get("credits", 0.0)
+        if account_info is None:
+            account_info = await self.get_account_info(allow_stale=allow_stale)
+        return account_info.get("credits", 0.0)
     
-    async def get_credit_balance(self) -> float:
-        """Get the current credit balance (async).
+    async def _gather_partial(self, calls: Dict[str, Awaitable[Any]]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Run independent API calls concurrently, tolerating partial failure.
+        
+        Each call is bounded by ``config.aggregate_call_timeout``. The calls
+        run in child tasks, so the age of any snapshot they served is
+        carried back into the caller's context for ``stale_data_age``.
+        
+        Args:
+            calls: Mapping of result name to awaitable
         
         Returns:
-            Credit balance as a float
+            Tuple of (results, errors), both keyed by result name
+        
+        Raises:
+            Exception: The first error if every call failed
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_credit_balance)
-    
-    def get_credits_info(self) -> Dict[str, Any]:
-        """Get detailed credit usage information.
+        timeout = self.config.aggregate_call_timeout
+        names = list(calls)
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(_with_stale_age(calls[name]), timeout) for name in names),
+            return_exceptions=True
+        )
+        
+        results, errors = {}, {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                errors[name] = f"timed out after {timeout:g}s"
+            elif isinstance(outcome, Exception):
+                errors[name] = str(outcome) or type(outcome).__name__
+            else:
+                results[name], age = outcome
+                if age is not None:
+                    _stale_data_age.set(max(age, _stale_data_age.get() or 0.0))
+        
+        if errors:
+            logger.warning(f"Partial results, failed calls: {errors}")
+            if not results:
+                raise next(o for o in outcomes if isinstance(o, Exception))
+        return results, errors
+    
+    async def get_credits_info(self, allow_stale: bool = False) -> Dict[str, Any]:
+        """Get detailed credit usage information (async).
+        
+        The account, pod and endpoint lookups are issued concurrently. If
+        some of them fail, the remaining data is still returned and the
+        failures are listed under "errors".
+        
+        Args:
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
             Credit usage information object
         """
         # This is a placeholder - in a real implementation, this would
         # call the RunPod API to get detailed credit information
-        account_info = self.get_account_info()
-        balance = account_info.get("credits", 0.0)
+        results, errors = await self._gather_partial({
+            "account": self.get_account_info(allow_stale=allow_stale),
+            "pods": self.get_pods(allow_stale=allow_stale),
+            "endpoints": self.get_endpoints(allow_stale=allow_stale),
+        })
+        
+        balance = await self.get_credit_balance(results.get("account") or {})
         
         # Get active pods and their costs
-        pods = self.get_pods()
+        pods = results.get("pods") or []
         active_pods = [p for p in pods if p.get("desiredStatus") == "RUNNING"]
         
         # Get active endpoints and their costs
-        endpoints = self.get_endpoints()
+        endpoints = results.get("endpoints") or []
         
         # Mock detailed credit info
         return {
@@ -428,27 +908,22 @@ class RunPodClient:
             "estimatedMonthlyBurn": sum(p.get("runtime", {}).get("costPerHr", 0) for p in active_pods) * 24 * 30,
             "activePods": active_pods,
             "activeEndpoints": endpoints,
-            "activeVolumes": []
+            "activeVolumes": [],
+            "errors": errors
         }
     
-    async def get_credits_info(self) -> Dict[str, Any]:
-        """Get detailed credit usage information (async).
+    async def get_billing_history(self, allow_stale: bool = False) -> Dict[str, Any]:
+        """Get billing history for the user (async).
         
-        Returns:
-            Credit usage information object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_credits_info)
-    
-    def get_billing_history(self) -> Dict[str, Any]:
-        """Get billing history for the user.
+        Args:
+            allow_stale: Serve last known data if the API is unavailable
         
         Returns:
             Billing history object
         """
         # This is a placeholder - in a real implementation, this would
         # call the RunPod API to get billing history
-        balance = self.get_credit_balance()
+        balance = await self.get_credit_balance(allow_stale=allow_stale)
         
         # Mock billing history
         return {
@@ -482,17 +957,8 @@ class RunPodClient:
             ]
         }
     
-    async def get_billing_history(self) -> Dict[str, Any]:
-        """Get billing history for the user (async).
-        
-        Returns:
-            Billing history object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_billing_history)
-    
-    def get_usage_statistics(self) -> Dict[str, Any]:
-        """Get usage statistics for the user.
+    async def get_usage_statistics(self) -> Dict[str, Any]:
+        """Get usage statistics for the user (async).
         
         Returns:
             Usage statistics object
@@ -519,12 +985,3 @@ class RunPodClient:
                 }
             }
         }
-    
-    async def get_usage_statistics(self) -> Dict[str, Any]:
-        """Get usage statistics for the user (async).
-        
-        Returns:
-            Usage statistics object
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.get_usage_statistics) 
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Conditional request support for the RunPod API client.
+
+Remembers the validators (ETag / Last-Modified) and parsed body of large
+list responses so refreshes can be sent as conditional requests. On a
+304 the previously parsed object is reused; when the server sends no
+validators, a content hash of the body detects unchanged responses.
+Either way an unchanged response yields the identical Python object,
+which lets downstream code skip re-formatting it.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+@dataclass
+class ConditionalEntry:
+    """Validators and parsed body of the last full response."""
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: Optional[str] = None
+
+class ValidatorStore:
+    """Size-bounded store of response validators keyed by request."""
+    
+    def __init__(self, max_entries: int = 256):
+        """Initialize the store.
+        
+        Args:
+            max_entries: Maximum number of responses remembered
+        """
+        self.max_entries = max_entries
+        self.not_modified = 0
+        self.unchanged = 0
+        self.changed = 0
+        self._entries: "OrderedDict[str, ConditionalEntry]" = OrderedDict()
+    
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """Return conditional headers for a request, if validators are known."""
+        entry = self._entries.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+    
+    def cached_value(self, key: str) -> Optional[ConditionalEntry]:
+        """Return the stored entry after a 304 Not Modified response."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.not_modified += 1
+            self._entries.move_to_end(key)
+        return entry
+    
+    def resolve(
+        self,
+        key: str,
+        response: httpx.Response,
+        decode: Optional[Callable[[httpx.Response], Any]] = None
+    ) -> Any:
+        """Decode a full response, reusing the stored object if unchanged.
+        
+        Args:
+            key: Request key
+            response: Successful (2xx) response
+            decode: Decodes a changed body (default: ``response.json()``)
+        
+        Returns:
+            The parsed body; the previously stored object if the body did
+            not change
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+        
+        entry = self._entries.get(key)
+        if entry is not None and entry.digest == digest:
+            self.unchanged += 1
+            entry.etag, entry.last_modified = etag, last_modified
+            self._entries.move_to_end(key)
+            return entry.value
+        
+        self.changed += 1
+        value = decode(response) if decode is not None else response.json()
+        self._entries[key] = ConditionalEntry(value, etag, last_modified, digest)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+    
+    def clear(self) -> None:
+        """Forget every stored validator and body."""
+        self._entries.clear()
+    
+    def snapshot(self) -> Dict[str, int]:
+        """Return revalidation counters for reporting."""
+        return {
+            "entries": len(self._entries),
+            "notModified": self.not_modified,
+            "unchanged": self.unchanged,
+            "changed": self.changed,
+        }
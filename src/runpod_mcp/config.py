@@ -4,9 +4,12 @@ Handles loading and managing API keys, endpoints, and other configuration.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, List
 import json
+import time
+import asyncio
 import logging
+import threading
 from dataclasses import dataclass
 
 @dataclass
@@ -15,6 +18,72 @@ class RunPodConfig:
     api_key: str
     api_url: str = "https://api.runpod.io/v1"
     
+    # HTTP transport settings
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    request_timeout: float = 30.0
+    
+    # JSON decoder for response bodies: auto, msgspec, orjson or stdlib
+    json_decoder: str = "auto"
+    
+    # Catalog cache settings (seconds); a TTL of 0 disables caching
+    gpu_cache_ttl: float = 60.0
+    template_cache_ttl: float = 300.0
+    cache_stale_ttl: float = 300.0
+    cache_max_entries: int = 256
+    
+    # Per-call timeout (seconds) for concurrent aggregation calls
+    aggregate_call_timeout: float = 10.0
+    
+    # Retry settings for transient API failures
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 20.0
+    retry_non_idempotent: bool = False
+    
+    # Client-side rate limits (requests/second); 0 disables a limit
+    rate_limit: float = 10.0
+    rate_limit_burst: int = 20
+    read_rate_limit: float = 0.0
+    mutation_rate_limit: float = 2.0
+    route_rate_limit_burst: int = 5
+    
+    # Circuit breaker settings; a threshold of 0 disables circuit breaking
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+    serve_stale_on_error: bool = True
+    
+    # Background fleet mirror of pods, endpoints and volumes
+    mirror_enabled: bool = False
+    mirror_interval: float = 30.0
+    
+    # Items per page when reading list endpoints page by page; 0 reads each
+    # list in a single request
+    list_page_size: int = 0
+    
+    # Maximum concurrent API calls made by the bulk pod tools
+    bulk_concurrency: int = 8
+    
+    # Background sampling of serverless endpoint metrics
+    metrics_sampler_enabled: bool = False
+    metrics_sample_interval: float = 60.0
+    
+    # Prometheus metrics endpoint; 0 disables it (status://metrics is always on)
+    metrics_port: int = 0
+    metrics_host: str = "127.0.0.1"
+    
+    # Request tracing: fraction of requests traced (0 disables) and where
+    # finished traces are exported (JSON lines file, OTLP/HTTP collector)
+    trace_sample_rate: float = 0.0
+    trace_file: str = ""
+    trace_otlp_endpoint: str = ""
+    
+    # Seconds between checks of the config files for changes; 0 disables
+    # hot reloading
+    config_reload_interval: float = 0.0
+    
     @classmethod
     def from_env(cls) -> 'RunPodConfig':
         """Load configuration from environment variables."""
@@ -24,47 +93,200 @@ class RunPodConfig:
         
         api_url = os.environ.get("RUNPOD_API_URL", "https://api.runpod.io/v1")
         
-        return cls(api_key=api_key, api_url=api_url)
+        return cls(api_key=api_key, api_url=api_url, **_settings_from_env())
     
     @classmethod
     def from_file(cls, config_path: str) -> 'RunPodConfig':
-        """Load configuration from a JSON file."""
+        """Load configuration from a JSON file.
+        
+        Environment variables, including RUNPOD_API_KEY and RUNPOD_API_URL,
+        take precedence over the file; the file's api_key is only required
+        when RUNPOD_API_KEY is not set.
+        """
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
         with open(config_path, 'r') as f:
             config_data = json.load(f)
         
-        api_key = config_data.get("api_key")
+        api_key = os.environ.get("RUNPOD_API_KEY") or config_data.get("api_key")
         if not api_key:
             raise ValueError("api_key is required in config file")
         
-        api_url = config_data.get("api_url", "https://api.runpod.io/v1")
+        api_url = os.environ.get("RUNPOD_API_URL") or config_data.get("api_url", "https://api.runpod.io/v1")
         
-        return cls(api_key=api_key, api_url=api_url)
+        settings = {key: config_data[key] for key in _ENV_SETTINGS if key in config_data}
+        # Environment variables take precedence over the file
+        settings.update(_settings_from_env())
+        
+        return cls(api_key=api_key, api_url=api_url, **settings)
 
-def get_config() -> RunPodConfig:
-    """Get RunPod configuration from environment or config file."""
-    # First try to load from environment
-    try:
-        return RunPodConfig.from_env()
-    except ValueError:
-        pass
-    
-    # Then try to load from default locations
-    config_locations = [
+# Optional settings that can be overridden from the environment,
+# mapped to their environment variable and type
+_ENV_SETTINGS = {
+    "max_connections": ("RUNPOD_MAX_CONNECTIONS", int),
+    "max_keepalive_connections": ("RUNPOD_MAX_KEEPALIVE_CONNECTIONS", int),
+    "keepalive_expiry": ("RUNPOD_KEEPALIVE_EXPIRY", float),
+    "http2": ("RUNPOD_HTTP2", bool),
+    "request_timeout": ("RUNPOD_REQUEST_TIMEOUT", float),
+    "json_decoder": ("RUNPOD_JSON_DECODER", str),
+    "gpu_cache_ttl": ("RUNPOD_GPU_CACHE_TTL", float),
+    "template_cache_ttl": ("RUNPOD_TEMPLATE_CACHE_TTL", float),
+    "cache_stale_ttl": ("RUNPOD_CACHE_STALE_TTL", float),
+    "cache_max_entries": ("RUNPOD_CACHE_MAX_ENTRIES", int),
+    "aggregate_call_timeout": ("RUNPOD_AGGREGATE_CALL_TIMEOUT", float),
+    "retry_max_attempts": ("RUNPOD_RETRY_MAX_ATTEMPTS", int),
+    "retry_base_delay": ("RUNPOD_RETRY_BASE_DELAY", float),
+    "retry_max_delay": ("RUNPOD_RETRY_MAX_DELAY", float),
+    "retry_non_idempotent": ("RUNPOD_RETRY_NON_IDEMPOTENT", bool),
+    "rate_limit": ("RUNPOD_RATE_LIMIT", float),
+    "rate_limit_burst": ("RUNPOD_RATE_LIMIT_BURST", int),
+    "read_rate_limit": ("RUNPOD_READ_RATE_LIMIT", float),
+    "mutation_rate_limit": ("RUNPOD_MUTATION_RATE_LIMIT", float),
+    "route_rate_limit_burst": ("RUNPOD_ROUTE_RATE_LIMIT_BURST", int),
+    "breaker_failure_threshold": ("RUNPOD_BREAKER_FAILURE_THRESHOLD", int),
+    "breaker_reset_timeout": ("RUNPOD_BREAKER_RESET_TIMEOUT", float),
+    "serve_stale_on_error": ("RUNPOD_SERVE_STALE_ON_ERROR", bool),
+    "mirror_enabled": ("RUNPOD_MIRROR", bool),
+    "mirror_interval": ("RUNPOD_MIRROR_INTERVAL", float),
+    "list_page_size": ("RUNPOD_LIST_PAGE_SIZE", int),
+    "bulk_concurrency": ("RUNPOD_BULK_CONCURRENCY", int),
+    "metrics_sampler_enabled": ("RUNPOD_METRICS_SAMPLER", bool),
+    "metrics_sample_interval": ("RUNPOD_METRICS_SAMPLE_INTERVAL", float),
+    "metrics_port": ("RUNPOD_METRICS_PORT", int),
+    "metrics_host": ("RUNPOD_METRICS_HOST", str),
+    "trace_sample_rate": ("RUNPOD_TRACE_SAMPLE_RATE", float),
+    "trace_file": ("RUNPOD_TRACE_FILE", str),
+    "trace_otlp_endpoint": ("RUNPOD_TRACE_OTLP_ENDPOINT", str),
+    "config_reload_interval": ("RUNPOD_CONFIG_RELOAD_INTERVAL", float),
+}
+
+def _settings_from_env() -> Dict[str, Any]:
+    """Read the optional settings that are set in the environment."""
+    settings = {}
+    for key, (env_var, value_type) in _ENV_SETTINGS.items():
+        value = os.environ.get(env_var)
+        if not value:
+            continue
+        try:
+            if value_type is bool:
+                settings[key] = value.strip().lower() in ("1", "true", "yes", "on")
+            else:
+                settings[key] = value_type(value)
+        except ValueError:
+            logging.warning(f"Ignoring invalid value for {env_var}: {value!r}")
+    return settings
+
+def config_locations() -> List[str]:
+    """Return the config file paths probed by get_config(), in order."""
+    return [
         os.path.expanduser("~/.runpod/config.json"),
         os.path.join(os.getcwd(), "runpod_config.json"),
     ]
+
+def get_config() -> RunPodConfig:
+    """Get RunPod configuration from config file and environment.
     
-    for config_path in config_locations:
+    The first config file that loads provides the settings and the
+    environment overrides them. With RUNPOD_API_KEY set no file is needed,
+    but an existing one still supplies every setting the environment
+    leaves unset, so edits to it take effect on reload.
+    """
+    # Settings from the first config file, overridden by the environment
+    for config_path in config_locations():
         if os.path.exists(config_path):
             try:
                 return RunPodConfig.from_file(config_path)
             except Exception as e:
                 logging.warning(f"Failed to load config from {config_path}: {e}")
     
+    # Then the environment alone
+    try:
+        return RunPodConfig.from_env()
+    except ValueError:
+        pass
+    
     raise ValueError(
         "RunPod API key not found. Please set the RUNPOD_API_KEY environment variable "
         "or create a config file at ~/.runpod/config.json or ./runpod_config.json"
-    ) 
\ No newline at end of file
+    ) 
+
+class ConfigStore:
+    """Process-wide configuration, loaded once and swapped on reload.
+    
+    ``get()`` returns the cached config without touching the environment or
+    the disk. ``reload()`` loads the config again off the event loop; if it
+    changed, the new object replaces the old one in a single assignment and
+    listeners (such as RunPodClient.reconfigure) are awaited with it. Code
+    that already holds the old config keeps using it until it is done.
+    """
+    
+    def __init__(self, loader: Callable[[], RunPodConfig] = get_config):
+        """Initialize the store.
+        
+        Args:
+            loader: Function loading the configuration
+        """
+        self._loader = loader
+        self._config: Optional[RunPodConfig] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[RunPodConfig], Awaitable[None]]] = []
+        self.loaded_at: Optional[float] = None
+        self.reloads = 0
+    
+    def get(self) -> RunPodConfig:
+        """Return the current configuration, loading it on first use."""
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self._loader()
+                    self.loaded_at = time.time()
+                config = self._config
+        return config
+    
+    def reset(self) -> None:
+        """Forget the cached configuration, so the next get() loads it again."""
+        with self._lock:
+            self._config = None
+    
+    def add_listener(self, listener: Callable[[RunPodConfig], Awaitable[None]]) -> None:
+        """Register a coroutine function called with each new configuration."""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[RunPodConfig], Awaitable[None]]) -> None:
+        """Unregister a listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    @property
+    def listeners(self) -> int:
+        """Number of registered listeners."""
+        return len(self._listeners)
+    
+    async def reload(self) -> Optional[RunPodConfig]:
+        """Load the configuration again and apply it if it changed.
+        
+        Returns:
+            The new configuration, or None if it did not change
+        
+        Raises:
+            ValueError: If the configuration can no longer be loaded; the
+                current configuration is kept
+        """
+        config = await asyncio.to_thread(self._loader)
+        if config == self._config:
+            return None
+        self._config = config
+        self.loaded_at = time.time()
+        self.reloads += 1
+        logging.info(f"Configuration reloaded ({self.reloads} reloads)")
+        for listener in list(self._listeners):
+            try:
+                await listener(config)
+            except Exception as e:
+                logging.error(f"Failed to apply reloaded configuration: {e}")
+        return config
+
+# Configuration shared by every session of the server process
+config_store = ConfigStore()
\ No newline at end of file
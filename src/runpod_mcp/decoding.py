@@ -0,0 +1,156 @@
+"""
+JSON decoding of RunPod API responses.
+
+``response.json()`` builds a dict for every object and every field of a
+body, although the resources read only a few fields of each pod or
+template. The decoders here parse response bodies with the library
+selected by ``RUNPOD_JSON_DECODER``:
+
+- ``stdlib``: ``json.loads``.
+- ``orjson``: ``orjson.loads``, a faster parser building the same objects.
+- ``msgspec``: a fast parser that decodes listings against a schema built
+  from the model's ``API_FIELDS``. Fields outside the schema are skipped
+  while parsing and never become Python objects.
+- ``auto`` (default): the first of msgspec, orjson and stdlib installed.
+
+``decode_list`` turns a listing into models and ``loads`` decodes any
+other body into plain objects. A body that a faster library rejects, or
+that does not match the schema, is decoded again the standard way, so
+switching decoders never changes what a response decodes to.
+"""
+
+import importlib.util
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, TypedDict
+
+from .models import Model
+
+logger = logging.getLogger(__name__)
+
+# Decoders in the order "auto" prefers them
+DECODERS = ("msgspec", "orjson", "stdlib")
+
+def decoder_available(name: str) -> bool:
+    """Check whether the package behind a decoder is installed, without importing it."""
+    return name == "stdlib" or importlib.util.find_spec(name) is not None
+
+def to_models(data: Any, model: Type[Model]) -> Any:
+    """Decode the objects of a listing into models; other bodies are returned as they are."""
+    if not isinstance(data, list):
+        return data
+    return [model.from_api(item) for item in data if isinstance(item, dict)]
+
+@lru_cache(maxsize=None)
+def schema_for(model: Type[Model]) -> type:
+    """Build a TypedDict of the fields ``model.from_api`` reads."""
+    return _typed_dict(model.__name__, model.API_FIELDS)
+
+def _typed_dict(name: str, fields: Dict[str, Any]) -> type:
+    annotations = {}
+    for key, spec in fields.items():
+        if spec is None:
+            annotations[key] = Any
+        elif isinstance(spec, list):
+            annotations[key] = Optional[List[_typed_dict(f"{name}_{key}", spec[0])]]
+        else:
+            annotations[key] = Optional[_typed_dict(f"{name}_{key}", spec)]
+    return TypedDict(name, annotations, total=False)
+
+class JsonDecoder:
+    """Decodes response bodies with the standard library."""
+    
+    name = "stdlib"
+    
+    def __init__(self):
+        # Bodies the fast path could not decode
+        self.fallbacks = 0
+    
+    def loads(self, content: bytes) -> Any:
+        """Decode a response body into plain objects."""
+        return json.loads(content)
+    
+    def decode_list(self, content: bytes, model: Type[Model]) -> Any:
+        """Decode a listing into models of type ``model``."""
+        return to_models(self.loads(content), model)
+
+class OrjsonDecoder(JsonDecoder):
+    """Decodes response bodies with orjson."""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        super().__init__()
+        import orjson
+        self._loads = orjson.loads
+    
+    def loads(self, content: bytes) -> Any:
+        try:
+            return self._loads(content)
+        except ValueError:
+            # orjson is stricter than json, e.g. about NaN and integers
+            # wider than 64 bits
+            self.fallbacks += 1
+            return json.loads(content)
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes response bodies with msgspec, listings against their schema."""
+    
+    name = "msgspec"
+    
+    def __init__(self):
+        super().__init__()
+        import msgspec
+        self._msgspec = msgspec
+        self._error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        # Typed decoder of each model's listings, built on first use
+        self._typed: Dict[Type[Model], Any] = {}
+    
+    def loads(self, content: bytes) -> Any:
+        try:
+            return self._decoder.decode(content)
+        except self._error:
+            self.fallbacks += 1
+            return json.loads(content)
+    
+    def decode_list(self, content: bytes, model: Type[Model]) -> Any:
+        decoder = self._typed.get(model)
+        if decoder is None:
+            decoder = self._typed[model] = self._msgspec.json.Decoder(List[schema_for(model)])
+        try:
+            items = decoder.decode(content)
+        except self._error:
+            # Not a list of objects of the expected shape (ValidationError
+            # is a DecodeError); decode it without the schema
+            self.fallbacks += 1
+            return to_models(json.loads(content), model)
+        return [model.from_api(item) for item in items]
+
+_DECODER_CLASSES = {
+    "stdlib": JsonDecoder,
+    "orjson": OrjsonDecoder,
+    "msgspec": MsgspecDecoder,
+}
+
+def create_decoder(name: str = "auto") -> JsonDecoder:
+    """Create the decoder selected by ``name``.
+    
+    Args:
+        name: "auto", "msgspec", "orjson" or "stdlib"; a decoder whose
+            package is not installed falls back to stdlib
+    
+    Returns:
+        The decoder
+    """
+    name = (name or "auto").strip().lower()
+    if name == "auto":
+        name = next(candidate for candidate in DECODERS if decoder_available(candidate))
+    elif name not in _DECODER_CLASSES:
+        logger.warning(f"Unknown JSON decoder '{name}'; using stdlib")
+        name = "stdlib"
+    elif not decoder_available(name):
+        logger.warning(f"JSON decoder '{name}' requested but the '{name}' package is not installed; using stdlib")
+        name = "stdlib"
+    return _DECODER_CLASSES[name]()
@@ -1,17 +1,131 @@
 """
 Logging configuration for RunPod MCP.
+
+By default handlers write synchronously from whichever thread logs. In
+queue mode (``--log-queue`` or ``RUNPOD_LOG_QUEUE=1``) loggers only put
+records on a bounded in-memory queue, and a listener thread formats them
+and writes them to stderr and the log file. The event loop thread then
+never blocks on stream writes or file rotation. When the queue is full,
+records are dropped and counted instead of blocking.
+
+With ``--log-json`` (``RUNPOD_LOG_JSON=1``) each record is written as one
+JSON object. Records logged while serving an MCP request carry its
+request id and, when the request is traced, its trace id.
 """
 
 import os
+import json
+import queue
+import atexit
 import logging
 import logging.handlers
+import contextvars
 import sys
 from typing import Optional, Dict, Any
 
+from .tracing import current_span
+
+# Id of the MCP request being served in the current context
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("runpod_request_id", default=None)
+
+# Queue listener and handler of the active queue-based configuration
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_configured = False
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+class RequestContextFilter(logging.Filter):
+    """Attach the current request id and trace id to records."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        span = current_span()
+        record.trace_id = span.trace.trace_id if span is not None else None
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+    
+    # Optional record attributes copied into the JSON object
+    EXTRA_FIELDS = ("request_id", "trace_id", "duration_ms", "uri", "tool", "outcome")
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.EXTRA_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when full."""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting runs on the listener thread; only freeze the message
+        # here so later changes to the arguments do not leak into the log
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+def queue_stats() -> Optional[Dict[str, int]]:
+    """Return queue counters of the queue-based logging mode, if active."""
+    if _queue_handler is None:
+        return None
+    return {
+        "enqueued": _queue_handler.enqueued,
+        "dropped": _queue_handler.dropped,
+        "pending": _queue_handler.queue.qsize(),
+        "capacity": _queue_handler.queue.maxsize,
+    }
+
+def log_queue_samples():
+    """Telemetry collector for the logging queue counters."""
+    stats = queue_stats()
+    if stats is None:
+        return []
+    return [
+        ("runpod_log_records_total", "counter", {"result": "enqueued"}, stats["enqueued"]),
+        ("runpod_log_records_total", "counter", {"result": "dropped"}, stats["dropped"]),
+        ("runpod_log_queue_pending", "gauge", {}, stats["pending"]),
+    ]
+
+def stop_logging_queue() -> None:
+    """Stop the listener thread after it has written every queued record."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    _queue_handler = None
+
 def configure_logging(
     level: int = logging.INFO,
     log_file: Optional[str] = None,
-    log_format: Optional[str] = None
+    log_format: Optional[str] = None,
+    use_queue: Optional[bool] = None,
+    json_format: Optional[bool] = None,
+    queue_size: int = 10000,
+    force: bool = True
 ) -> None:
     """Configure logging for the MCP server.
     
@@ -19,7 +133,19 @@ def configure_logging(
         level: Logging level (default: INFO)
         log_file: Path to log file (default: None, logs to stderr)
         log_format: Log format string (default: timestamp, level, name, message)
+        use_queue: Write records from a listener thread (default: RUNPOD_LOG_QUEUE)
+        json_format: Write records as JSON objects (default: RUNPOD_LOG_JSON)
+        queue_size: Maximum records waiting in the queue before new ones are dropped
+        force: Reconfigure even if logging was already configured
     """
+    global _listener, _queue_handler, _configured
+    if _configured and not force:
+        return
+    _configured = True
+    if use_queue is None:
+        use_queue = _env_flag("RUNPOD_LOG_QUEUE")
+    if json_format is None:
+        json_format = _env_flag("RUNPOD_LOG_JSON")
     if log_format is None:
         log_format = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
     
@@ -28,16 +154,18 @@ def configure_logging(
     root_logger.setLevel(level)
     
     # Clear existing handlers to avoid duplicate logs
+    stop_logging_queue()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
     # Create formatter
-    formatter = logging.Formatter(log_format)
+    formatter = JsonFormatter() if json_format else logging.Formatter(log_format)
+    handlers = []
     
     # Configure console handler
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Configure file handler if log_file is provided
     if log_file:
@@ -48,16 +176,34 @@ def configure_logging(
             backupCount=5
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    if use_queue:
+        _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        _queue_handler.addFilter(RequestContextFilter())
+        root_logger.addHandler(_queue_handler)
+        _listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in handlers:
+            handler.addFilter(RequestContextFilter())
+            root_logger.addHandler(handler)
     
     # Set levels for third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
     
     # Log initial message
     logging.info(f"Logging configured with level {logging.getLevelName(level)}")
     if log_file:
         logging.info(f"Logging to file: {log_file}")
+    if use_queue:
+        logging.info(f"Logging through a queue of up to {queue_size} records")
+
+# Write out queued records when the interpreter exits
+atexit.register(stop_logging_queue)
     
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
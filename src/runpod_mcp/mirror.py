@@ -0,0 +1,217 @@
+"""
+Background fleet mirror for the RunPod MCP server.
+
+Keeps an in-memory copy of the account's pods, serverless endpoints and
+network volumes, refreshed by a periodic full sync plus targeted
+refreshes of single items. Resource handlers read from the mirror, so
+their latency no longer depends on the RunPod API and upstream load
+stays constant no matter how many agents are reading.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class MirroredCollection:
+    """One mirrored collection (pods, endpoints or volumes) indexed by id."""
+    
+    def __init__(self, name: str):
+        """Initialize an empty collection.
+        
+        Args:
+            name: Collection name used in logs and status output
+        """
+        self.name = name
+        self.items: List[Dict[str, Any]] = []
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.synced_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.syncs = 0
+    
+    def replace(self, items: List[Dict[str, Any]]) -> None:
+        """Replace the collection with a full listing."""
+        if items is not self.items:
+            self.items = items or []
+            self.by_id = {str(item["id"]): item for item in self.items if isinstance(item, dict) and "id" in item}
+        self.synced_at = time.monotonic()
+        self.last_error = None
+        self.syncs += 1
+    
+    def upsert(self, item: Dict[str, Any]) -> None:
+        """Insert or update a single item from a targeted refresh."""
+        item_id = str(item.get("id"))
+        self.by_id[item_id] = item
+        # Build a new list so that identity-based render caches notice the change
+        self.items = [item if str(existing.get("id")) == item_id else existing for existing in self.items]
+        if not any(existing is item for existing in self.items):
+            self.items.append(item)
+    
+    def remove(self, item_id: str) -> None:
+        """Drop an item that no longer exists."""
+        if self.by_id.pop(str(item_id), None) is not None:
+            self.items = [item for item in self.items if str(item.get("id")) != str(item_id)]
+    
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful full sync, or None if never synced."""
+        if self.synced_at is None:
+            return None
+        return time.monotonic() - self.synced_at
+
+class FleetMirror:
+    """In-memory mirror of pods, endpoints and network volumes."""
+    
+    def __init__(self, client, interval: float = 30.0, max_staleness: Optional[float] = None):
+        """Initialize the mirror.
+        
+        Args:
+            client: RunPodClient used to fetch data
+            interval: Seconds between full syncs
+            max_staleness: Age after which mirrored data is no longer served
+                (default: three sync intervals)
+        """
+        self.client = client
+        self.interval = interval
+        self.max_staleness = max_staleness if max_staleness is not None else interval * 3
+        self.collections: Dict[str, MirroredCollection] = {
+            "pods": MirroredCollection("pods"),
+            "endpoints": MirroredCollection("endpoints"),
+            "volumes": MirroredCollection("volumes"),
+        }
+        # The client's stale snapshot fallback is left off, so an outage
+        # is recorded in last_error and the mirrored data keeps aging
+        # instead of being refreshed from a snapshot
+        self._listers: Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]] = {
+            "pods": client.get_pods,
+            "endpoints": client.get_endpoints,
+            "volumes": client.get_network_volumes,
+        }
+        self._getters: Dict[str, Callable[[str], Awaitable[Dict[str, Any]]]] = {
+            "pods": client.get_pod,
+            "endpoints": client.get_endpoint,
+            "volumes": client.get_network_volume,
+        }
+        self._listeners: List[Callable[[Dict[str, MirroredCollection]], Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    def add_listener(self, listener: Callable[[Dict[str, MirroredCollection]], Any]) -> None:
+        """Call ``listener`` with the collections after every full sync."""
+        self._listeners.append(listener)
+    
+    async def start(self) -> None:
+        """Start the background sync task, which syncs right away.
+        
+        Startup does not wait for the first sync; until it completes,
+        nothing is served from the mirror and readers use the API.
+        """
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+        logger.info(f"Fleet mirror started (sync every {self.interval:g}s)")
+    
+    async def stop(self) -> None:
+        """Stop the background sync task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Fleet mirror stopped")
+    
+    def request_sync(self) -> None:
+        """Ask the background task to run a full sync now."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _run(self) -> None:
+        while True:
+            await self.sync()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+    
+    async def sync(self) -> None:
+        """Fetch every collection concurrently and replace the mirrored data."""
+        names = list(self._listers)
+        results = await asyncio.gather(
+            *(self._listers[name]() for name in names),
+            return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            collection = self.collections[name]
+            if isinstance(result, Exception):
+                collection.last_error = str(result) or type(result).__name__
+                logger.warning(f"Fleet mirror sync of {name} failed: {collection.last_error}")
+            else:
+                collection.replace(result)
+        
+        for listener in self._listeners:
+            try:
+                result = listener(self.collections)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Fleet mirror listener failed: {e}")
+    
+    async def refresh(self, kind: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Refresh a single item, e.g. after it was created or changed.
+        
+        Args:
+            kind: "pods", "endpoints" or "volumes"
+            item_id: ID of the item
+        
+        Returns:
+            The refreshed item, or None if it no longer exists
+        """
+        collection = self.collections[kind]
+        try:
+            item = await self._getters[kind](item_id)
+        except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status == 404:
+                collection.remove(item_id)
+                return None
+            raise
+        if item:
+            collection.upsert(item)
+        return item
+    
+    def fresh(self, kind: str) -> bool:
+        """Whether mirrored data for a collection may be served."""
+        age = self.collections[kind].age()
+        return age is not None and age <= self.max_staleness
+    
+    def list(self, kind: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the mirrored items, or None if the data is not fresh."""
+        if not self.fresh(kind):
+            return None
+        return self.collections[kind].items
+    
+    def get(self, kind: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return a mirrored item, or None if unknown or not fresh."""
+        if not self.fresh(kind):
+            return None
+        return self.collections[kind].by_id.get(str(item_id))
+    
+    def age(self, kind: str) -> Optional[float]:
+        """Seconds since a collection was last fully synced."""
+        return self.collections[kind].age()
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return mirror freshness for reporting."""
+        return {
+            name: {
+                "items": len(collection.items),
+                "ageSeconds": collection.age(),
+                "fresh": self.fresh(name),
+                "syncs": collection.syncs,
+                "lastError": collection.last_error,
+            }
+            for name, collection in self.collections.items()
+        }
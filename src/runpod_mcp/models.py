@@ -0,0 +1,291 @@
+"""
+Compact models of the RunPod objects the resources display.
+
+API responses are nested dicts holding every field RunPod returns, and the
+resource handlers used to read the few they display through chains of
+``.get()`` calls with defaults. The classes here keep only those fields,
+in ``__slots__``, with the same defaults already applied. A decoded pod
+is a fraction of the size of its dict, and handlers read plain
+attributes.
+
+Each class decodes one API object with ``from_api``. ``coerce`` also
+accepts an object that is already decoded, so callers work with either.
+``API_FIELDS`` lists the API fields ``from_api`` reads, so that a decoder
+can skip the others while parsing (see ``decoding.py``). Each key maps to
+None for a plain value, to the fields of a nested object, or to a
+one-item list holding the fields of the objects in a list.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+def _dict(value: Any) -> Dict[str, Any]:
+    """Return ``value`` if it is a dict, otherwise an empty one."""
+    return value if isinstance(value, dict) else {}
+
+def _dicts(value: Any) -> Iterable[Dict[str, Any]]:
+    """Return the dicts in a list field, skipping anything else."""
+    if not value or not isinstance(value, (list, tuple)):
+        return ()
+    return (item for item in value if isinstance(item, dict))
+
+def _decode_all(model: type, value: Any) -> tuple:
+    """Decode the dicts in a list field; most are empty, which stays cheap."""
+    if not value:
+        return ()
+    return tuple(model.from_api(item) for item in _dicts(value))
+
+class Model:
+    """Base class of the slotted models."""
+    
+    __slots__ = ()
+    
+    API_FIELDS: Dict[str, Any] = {}
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Model":
+        """Decode an API object."""
+        raise NotImplementedError
+    
+    @classmethod
+    def coerce(cls, item: Any) -> "Model":
+        """Return ``item`` decoded, unless it already is."""
+        return item if isinstance(item, cls) else cls.from_api(item)
+    
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class EnvVar(Model):
+    """An environment variable; ``value`` is None if it is not set."""
+    
+    __slots__ = ("key", "value")
+    
+    API_FIELDS = {"key": None, "value": None}
+    
+    def __init__(self, key: str, value: Optional[str] = None):
+        self.key = key
+        self.value = value
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "EnvVar":
+        return cls(data["key"], data.get("value"))
+    
+    @property
+    def sensitive(self) -> bool:
+        """Whether the value looks like a credential that must not be shown."""
+        key = str(self.key).lower()
+        return "api_key" in key or "password" in key or "secret" in key
+    
+    @classmethod
+    def decode_all(cls, value: Any) -> Tuple["EnvVar", ...]:
+        """Decode an ``env`` list, skipping entries without a key."""
+        if not value:
+            return ()
+        return tuple(cls.from_api(item) for item in _dicts(value) if "key" in item)
+
+class Port(Model):
+    """An exposed port of a pod or template."""
+    
+    __slots__ = ("name", "ip", "public_port", "container_port")
+    
+    API_FIELDS = {"name": None, "ip": None, "publicPort": None, "containerPort": None}
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Port":
+        port = cls.__new__(cls)
+        port.name = data.get("name", "Unknown")
+        port.ip = data.get("ip", "Unknown")
+        port.public_port = data.get("publicPort", "Unknown")
+        port.container_port = data.get("containerPort", "Unknown")
+        return port
+
+class VolumeMount(Model):
+    """A volume mounted into a pod or template container."""
+    
+    __slots__ = ("name", "mount_path")
+    
+    API_FIELDS = {"name": None, "mountPath": None}
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "VolumeMount":
+        mount = cls.__new__(cls)
+        mount.name = data.get("name", "Unknown")
+        mount.mount_path = data.get("mountPath", "Unknown")
+        return mount
+
+class Pod(Model):
+    """A pod; uptime and cost are 0 while it has no runtime."""
+    
+    __slots__ = (
+        "id", "name", "gpu_name", "gpu_count", "status", "machine_id", "image", "disk_gb", "memory_gb",
+        "uptime_seconds", "cost_per_hr", "ports", "volume_mounts", "env",
+    )
+    
+    API_FIELDS = {
+        "id": None, "name": None, "gpuDisplayName": None, "gpuCount": None, "desiredStatus": None, "machineId": None,
+        "container": {"image": None, "diskInGb": None, "memoryInGb": None},
+        "runtime": {"uptimeInSeconds": None, "costPerHr": None},
+        "ports": [Port.API_FIELDS], "volumeMounts": [VolumeMount.API_FIELDS], "env": [EnvVar.API_FIELDS],
+    }
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Pod":
+        pod = cls.__new__(cls)
+        runtime = _dict(data.get("runtime"))
+        container = _dict(data.get("container"))
+        pod.id = data.get("id", "Unknown ID")
+        pod.name = data.get("name", "Unnamed Pod")
+        pod.gpu_name = data.get("gpuDisplayName", "Unknown GPU")
+        pod.gpu_count = data.get("gpuCount", 1)
+        pod.status = data.get("desiredStatus", "UNKNOWN")
+        pod.machine_id = data.get("machineId", "Unknown")
+        pod.image = container.get("image", "Unknown")
+        pod.disk_gb = container.get("diskInGb", 0)
+        pod.memory_gb = container.get("memoryInGb", 0)
+        pod.uptime_seconds = runtime.get("uptimeInSeconds", 0)
+        pod.cost_per_hr = runtime.get("costPerHr", 0)
+        pod.ports = _decode_all(Port, data.get("ports"))
+        pod.volume_mounts = _decode_all(VolumeMount, data.get("volumeMounts"))
+        pod.env = EnvVar.decode_all(data.get("env"))
+        return pod
+    
+    @property
+    def uptime(self) -> str:
+        """Uptime as hours and minutes, e.g. ``3h 24m``."""
+        return f"{self.uptime_seconds // 3600}h {(self.uptime_seconds % 3600) // 60}m"
+
+class Template(Model):
+    """A pod or serverless template."""
+    
+    __slots__ = ("id", "name", "description", "image", "command", "ports", "volume_mounts", "env")
+    
+    API_FIELDS = {
+        "id": None, "name": None, "description": None, "container": {"image": None, "command": None},
+        "ports": [Port.API_FIELDS], "volumeMounts": [VolumeMount.API_FIELDS], "env": [EnvVar.API_FIELDS],
+    }
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Template":
+        template = cls.__new__(cls)
+        container = _dict(data.get("container"))
+        template.id = data.get("id", "Unknown ID")
+        template.name = data.get("name", "Unnamed Template")
+        template.description = data.get("description", "No description available")
+        template.image = container.get("image", "Unknown")
+        template.command = container.get("command", "")
+        template.ports = _decode_all(Port, data.get("ports"))
+        template.volume_mounts = _decode_all(VolumeMount, data.get("volumeMounts"))
+        template.env = EnvVar.decode_all(data.get("env"))
+        return template
+
+class GpuType(Model):
+    """A GPU type with its pricing and availability."""
+    
+    __slots__ = (
+        "id", "name", "memory_gb", "min_bid_price", "on_demand_price", "available", "secure_cloud",
+        "datacenter", "reliability",
+    )
+    
+    API_FIELDS = {
+        "id": None, "displayName": None, "memoryInGb": None, "price": {"minimumBidPrice": None, "onDemandPrice": None},
+        "available": None, "secureCloud": None, "datacenter": None, "reliability": None,
+    }
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "GpuType":
+        gpu = cls.__new__(cls)
+        price = _dict(data.get("price"))
+        gpu.id = data.get("id")
+        gpu.name = data.get("displayName", "Unknown GPU")
+        gpu.memory_gb = data.get("memoryInGb", "unknown")
+        gpu.min_bid_price = price.get("minimumBidPrice", "N/A")
+        gpu.on_demand_price = price.get("onDemandPrice", "N/A")
+        gpu.available = bool(data.get("available", False))
+        gpu.secure_cloud = bool(data.get("secureCloud", False))
+        gpu.datacenter = data.get("datacenter", "Unknown")
+        gpu.reliability = data.get("reliability", "Unknown")
+        return gpu
+
+class Endpoint(Model):
+    """A serverless endpoint with the image and env of its template."""
+    
+    __slots__ = (
+        "id", "name", "status", "workers_running", "workers_max", "idle_timeout", "scaler_type", "gpu_ids",
+        "gpu_count", "container_disk", "container_memory", "network_volume_id", "cost_per_hour", "image", "env",
+        "queue_type", "queue_size",
+    )
+    
+    API_FIELDS = {
+        "id": None, "name": None, "status": None, "workersRunning": None, "workersMax": None, "idleTimeout": None,
+        "scalerType": None, "gpuIds": None, "gpuCount": None, "containerDisk": None, "containerMemory": None,
+        "networkVolumeId": None, "costPerHour": None, "queueType": None, "queueSize": None,
+        "template": {"container": {"image": None}, "env": [EnvVar.API_FIELDS]},
+    }
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Endpoint":
+        endpoint = cls.__new__(cls)
+        template = _dict(data.get("template"))
+        endpoint.id = data.get("id", "Unknown ID")
+        endpoint.name = data.get("name", "Unnamed Endpoint")
+        endpoint.status = data.get("status", "UNKNOWN")
+        endpoint.workers_running = data.get("workersRunning", 0)
+        endpoint.workers_max = data.get("workersMax", 0)
+        endpoint.idle_timeout = data.get("idleTimeout", 0)
+        endpoint.scaler_type = data.get("scalerType", "Unknown")
+        endpoint.gpu_ids = tuple(data.get("gpuIds", ("Unknown",)) or ())
+        endpoint.gpu_count = data.get("gpuCount", 1)
+        endpoint.container_disk = data.get("containerDisk", 0)
+        endpoint.container_memory = data.get("containerMemory", 0)
+        endpoint.network_volume_id = data.get("networkVolumeId", "None")
+        endpoint.cost_per_hour = data.get("costPerHour", 0)
+        endpoint.image = _dict(template.get("container")).get("image", "Unknown")
+        endpoint.env = EnvVar.decode_all(template.get("env"))
+        endpoint.queue_type = data.get("queueType", "Unknown")
+        endpoint.queue_size = data.get("queueSize", 0)
+        return endpoint
+    
+    @property
+    def gpu_type(self) -> str:
+        """The first GPU type the endpoint runs on."""
+        return self.gpu_ids[0] if self.gpu_ids else "Unknown"
+
+class NetworkVolume(Model):
+    """A network volume; attached pods and endpoints are (id, name) pairs."""
+    
+    __slots__ = (
+        "id", "name", "size_gb", "status", "storage_type", "cost_per_hr", "region", "created_at", "pods",
+        "endpoints",
+    )
+    
+    API_FIELDS = {
+        "id": None, "name": None, "sizeGB": None, "status": None, "storageType": None, "costPerHr": None,
+        "region": None, "createdAt": None, "pods": [{"id": None, "name": None}], "endpoints": [{"id": None, "name": None}],
+    }
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "NetworkVolume":
+        volume = cls.__new__(cls)
+        volume.id = data.get("id", "Unknown ID")
+        volume.name = data.get("name", "Unnamed Volume")
+        volume.size_gb = data.get("sizeGB", 0)
+        volume.status = data.get("status", "UNKNOWN")
+        volume.storage_type = data.get("storageType", "Network Storage")
+        volume.cost_per_hr = data.get("costPerHr", 0)
+        volume.region = data.get("region", "Unknown")
+        volume.created_at = data.get("createdAt", "Unknown")
+        volume.pods = tuple(
+            (pod.get("id", "Unknown"), pod.get("name", "Unnamed Pod")) for pod in _dicts(data.get("pods"))
+        )
+        volume.endpoints = tuple(
+            (endpoint.get("id", "Unknown"), endpoint.get("name", "Unnamed Endpoint"))
+            for endpoint in _dicts(data.get("endpoints"))
+        )
+        return volume
@@ -0,0 +1,158 @@
+"""
+Client-side rate limiting for the RunPod API client.
+
+Paces outgoing requests with async token buckets: one global bucket
+shared by every request plus one bucket per route, with separate limits
+for reads and mutations. Waiting callers are served in FIFO order.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+@dataclass
+class BucketStats:
+    """Queueing counters for a token bucket."""
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    
+    def record(self, wait: float) -> None:
+        """Record one acquisition and the time spent waiting for it."""
+        self.acquired += 1
+        if wait > 0.001:
+            self.delayed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary."""
+        return {
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "avgWait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "maxWait": self.max_wait,
+        }
+
+class TokenBucket:
+    """Async token bucket with FIFO queueing.
+    
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Callers queue on an asyncio lock, which wakes waiters in order, so a
+    burst of callers is served fairly instead of racing for tokens.
+    """
+    
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of stored tokens
+            clock: Monotonic clock function
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.stats = BucketStats()
+        self._clock = clock
+        self._updated = clock()
+        self.queued = 0
+        # Created on first use so the lock binds to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+    
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if necessary.
+        
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = self._clock()
+        self.queued += 1
+        try:
+            async with self._lock:
+                self._refill()
+                if self.tokens < 1:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    self._refill()
+                self.tokens -= 1
+        finally:
+            self.queued -= 1
+        wait = self._clock() - start
+        self.stats.record(wait)
+        return wait
+
+class RateLimiter:
+    """Global plus per-route token buckets for API requests."""
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        read_rate: float = 0.0,
+        mutation_rate: float = 0.0,
+        route_burst: int = 5
+    ):
+        """Initialize the rate limiter.
+        
+        A rate of 0 disables the corresponding bucket.
+        
+        Args:
+            rate: Global requests per second
+            burst: Global burst size
+            read_rate: Requests per second for each read (GET) route
+            mutation_rate: Requests per second for each mutating route
+            route_burst: Burst size of the per-route buckets
+        """
+        self.global_bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self.read_rate = read_rate
+        self.mutation_rate = mutation_rate
+        self.route_burst = route_burst
+        self.routes: Dict[str, TokenBucket] = {}
+    
+    def _route_bucket(self, method: str, route: str) -> Optional[TokenBucket]:
+        rate = self.read_rate if method in ("GET", "HEAD") else self.mutation_rate
+        if rate <= 0:
+            return None
+        key = f"{method} {route}"
+        bucket = self.routes.get(key)
+        if bucket is None:
+            bucket = self.routes[key] = TokenBucket(rate, self.route_burst)
+        return bucket
+    
+    async def acquire(self, method: str, route: str) -> float:
+        """Wait until a request on the given route may be sent.
+        
+        Args:
+            method: HTTP method of the request
+            route: Route template of the request
+        
+        Returns:
+            Total seconds spent waiting
+        """
+        wait = 0.0
+        bucket = self._route_bucket(method, route)
+        if bucket is not None:
+            wait += await bucket.acquire()
+        if self.global_bucket is not None:
+            wait += await self.global_bucket.acquire()
+        return wait
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return queueing statistics for reporting."""
+        buckets = {}
+        if self.global_bucket is not None:
+            buckets["global"] = self.global_bucket
+        buckets.update(self.routes)
+        return {
+            name: {**bucket.stats.as_dict(), "rate": bucket.rate, "queued": bucket.queued}
+            for name, bucket in buckets.items()
+        }
@@ -0,0 +1,100 @@
+"""
+Config file watcher for the RunPod MCP server.
+
+Polls the modification time, size and inode of the config files every few
+seconds. The ``stat`` calls run in a worker thread, so a slow or network
+file system never blocks the event loop. When any of them changes, for
+example because a file was edited, replaced or created, the config store
+reloads the configuration. Polling works the same on every platform and
+file system; a watcher that is a few seconds late is fine for config
+edits.
+"""
+
+import asyncio
+import logging
+import os
+from typing import List, Optional, Tuple
+
+from .config import ConfigStore, config_locations
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime in ns, size, inode) of a watched file; None fields if missing
+Fingerprint = Tuple[str, Optional[int], Optional[int], Optional[int]]
+
+def fingerprint(paths: List[str]) -> List[Fingerprint]:
+    """Return what identifies the current version of each file."""
+    result = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            result.append((path, None, None, None))
+            continue
+        result.append((path, st.st_mtime_ns, st.st_size, st.st_ino))
+    return result
+
+class ConfigWatcher:
+    """Reloads the configuration when the config files change."""
+    
+    def __init__(self, store: ConfigStore, interval: float = 5.0, paths: Optional[List[str]] = None):
+        """Initialize the watcher.
+        
+        Args:
+            store: Config store to reload
+            interval: Seconds between checks
+            paths: Files to watch (default: the locations get_config() probes)
+        """
+        self.store = store
+        self.interval = interval
+        self.paths = paths if paths is not None else config_locations()
+        self.checks = 0
+        self.failures = 0
+        self._state: Optional[List[Fingerprint]] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the watcher is polling."""
+        return self._task is not None
+    
+    async def start(self) -> None:
+        """Start watching in the background."""
+        if self._task is not None:
+            return
+        self._state = await asyncio.to_thread(fingerprint, self.paths)
+        self._task = asyncio.ensure_future(self._run())
+        logger.info(f"Watching {', '.join(self.paths)} for config changes (every {self.interval:g}s)")
+    
+    async def stop(self) -> None:
+        """Stop watching."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+    
+    async def check(self) -> bool:
+        """Reload the configuration if a watched file changed.
+        
+        Returns:
+            True if a new configuration was applied
+        """
+        self.checks += 1
+        state = await asyncio.to_thread(fingerprint, self.paths)
+        if state == self._state:
+            return False
+        self._state = state
+        try:
+            return await self.store.reload() is not None
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Failed to reload configuration, keeping the current one: {e}")
+            return False
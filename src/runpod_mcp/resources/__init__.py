@@ -11,6 +11,7 @@ from .pods import register_pod_resources
 from .serverless import register_serverless_resources
 from .storage import register_storage_resources
 from .account import register_account_resources
+from .changes import register_change_resources
 
 def register_all_resources(mcp_server):
     """Register all RunPod MCP resources with the MCP server."""
@@ -18,4 +19,5 @@ def register_all_resources(mcp_server):
     register_pod_resources(mcp_server)
     register_serverless_resources(mcp_server)
     register_storage_resources(mcp_server)
-    register_account_resources(mcp_server) 
\ No newline at end of file
+    register_account_resources(mcp_server)
+    register_change_resources(mcp_server) 
\ No newline at end of file
@@ -10,6 +10,8 @@ import json
 from datetime import datetime, timedelta
 
 from ..logging_config import get_logger
+from ..models import Endpoint, NetworkVolume, Pod
+from .formatting import with_stale_notice
 
 logger = get_logger(__name__)
 
@@ -37,7 +39,7 @@ def register_account_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get account info from RunPod
-            account = await client.get_account_info()
+            account = await client.get_account_info(allow_stale=True)
             
             if not account:
                 return "Failed to retrieve account information."
@@ -59,7 +61,7 @@ def register_account_resources(mcp_server):
                 f"Credits Balance: ${credits:.2f}",
             ]
             
-            return "\n".join(formatted_info)
+            return with_stale_notice(client, "\n".join(formatted_info))
         except Exception as e:
             logger.error(f"Error fetching account info: {e}")
             return f"Error fetching account information: {str(e)}"
@@ -83,7 +85,7 @@ def register_account_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get credit info from RunPod
-            credits_info = await client.get_credits_info()
+            credits_info = await client.get_credits_info(allow_stale=True)
             
             if not credits_info:
                 return "Failed to retrieve credits information."
@@ -100,18 +102,19 @@ def register_account_resources(mcp_server):
                 days_until_empty = int((current_balance / estimated_monthly_burn) * 30)
             
             # Get active resources that are consuming credits
-            active_pods = credits_info.get("activePods", [])
-            active_endpoints = credits_info.get("activeEndpoints", [])
-            active_volumes = credits_info.get("activeVolumes", [])
+            active_pods = [Pod.coerce(pod) for pod in credits_info.get("activePods", [])]
+            active_endpoints = [Endpoint.coerce(endpoint) for endpoint in credits_info.get("activeEndpoints", [])]
+            active_volumes = [NetworkVolume.coerce(volume) for volume in credits_info.get("activeVolumes", [])]
+            errors = credits_info.get("errors", {})
             
             # Calculate total hourly burn rate
             hourly_burn = 0
             for pod in active_pods:
-                hourly_burn += pod.get("costPerHr", 0)
+                hourly_burn += pod.cost_per_hr
             for endpoint in active_endpoints:
-                hourly_burn += endpoint.get("costPerHour", 0)
+                hourly_burn += endpoint.cost_per_hour
             for volume in active_volumes:
-                hourly_burn += volume.get("costPerHr", 0)
+                hourly_burn += volume.cost_per_hr
             
             # Format the response
             formatted_info = [
@@ -134,27 +137,27 @@ def register_account_resources(mcp_server):
                 formatted_info.append("")
                 formatted_info.append("## Active Pods")
                 for pod in active_pods:
-                    name = pod.get("name", "Unnamed Pod")
-                    cost = pod.get("costPerHr", 0)
-                    formatted_info.append(f"- {name}: ${cost:.2f}/hr")
+                    formatted_info.append(f"- {pod.name}: ${pod.cost_per_hr:.2f}/hr")
             
             if active_endpoints:
                 formatted_info.append("")
                 formatted_info.append("## Active Serverless Endpoints")
                 for endpoint in active_endpoints:
-                    name = endpoint.get("name", "Unnamed Endpoint")
-                    cost = endpoint.get("costPerHour", 0)
-                    formatted_info.append(f"- {name}: ${cost:.2f}/hr")
+                    formatted_info.append(f"- {endpoint.name}: ${endpoint.cost_per_hour:.2f}/hr")
             
             if active_volumes:
                 formatted_info.append("")
                 formatted_info.append("## Active Storage Volumes")
                 for volume in active_volumes:
-                    name = volume.get("name", "Unnamed Volume")
-                    cost = volume.get("costPerHr", 0)
-                    formatted_info.append(f"- {name}: ${cost:.2f}/hr")
+                    formatted_info.append(f"- {volume.name}: ${volume.cost_per_hr:.2f}/hr")
             
-            return "\n".join(formatted_info)
+            if errors:
+                formatted_info.append("")
+                formatted_info.append("## Partial Data")
+                for source, error in errors.items():
+                    formatted_info.append(f"- Could not fetch {source}: {error}")
+            
+            return with_stale_notice(client, "\n".join(formatted_info))
         except Exception as e:
             logger.error(f"Error fetching credits info: {e}")
             return f"Error fetching credits information: {str(e)}"
@@ -177,7 +180,7 @@ def register_account_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get billing history from RunPod
-            billing_history = await client.get_billing_history()
+            billing_history = await client.get_billing_history(allow_stale=True)
             
             if not billing_history:
                 return "Failed to retrieve billing history."
@@ -264,7 +267,7 @@ def register_account_resources(mcp_server):
                     
                     formatted_info.append(f"- {method_type} ending in {last_four}{' (Default)' if is_default else ''}")
             
-            return "\n".join(formatted_info)
+            return with_stale_notice(client, "\n".join(formatted_info))
         except Exception as e:
             logger.error(f"Error fetching billing history: {e}")
             return f"Error fetching billing history: {str(e)}"
@@ -339,7 +342,7 @@ def register_account_resources(mcp_server):
                     f"- Month-over-Month Change: {percent_change:.1f}% {'increase' if percent_change >= 0 else 'decrease'}",
                 ])
             
-            return "\n".join(formatted_info)
+            return with_stale_notice(client, "\n".join(formatted_info))
         except Exception as e:
             logger.error(f"Error fetching usage statistics: {e}")
             return f"Error fetching usage statistics: {str(e)}" 
\ No newline at end of file
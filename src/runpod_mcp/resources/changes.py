@@ -0,0 +1,60 @@
+"""
+Change feed resources for the RunPod MCP server.
+
+This module provides a resource for reading the changes to pods,
+endpoints and network volumes since a cursor, so that watchers do not
+have to re-read whole listings.
+"""
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+def register_change_resources(mcp_server):
+    """Register change feed resources with the MCP server."""
+    
+    @mcp_server.resource("changes://since/{cursor}")
+    async def changes_since(cursor: str) -> str:
+        """
+        Get the changes to pods, endpoints and volumes after a cursor.
+        
+        Parameters:
+        - cursor: The last cursor seen, or 0 to read every retained change
+        
+        Returns one line per change (created, status changed, cost changed,
+        terminated) and the cursor to pass on the next read.
+        
+        Example:
+        ```
+        Next cursor: 42
+        [41] pods v6abc123def status_changed: RUNNING -> EXITED
+        [42] pods v6abc123def cost_changed: 0.69 -> 0
+        ```
+        """
+        try:
+            context = mcp_server.get_run_context()
+            feed = context.get("change_feed")
+            
+            if not feed:
+                return "Error: the change feed requires the fleet mirror. Set RUNPOD_MIRROR=1 or pass --mirror to enable it."
+            
+            try:
+                after = int(cursor)
+            except ValueError:
+                return f"Error: invalid cursor '{cursor}'. Use a number returned as 'Next cursor'."
+            
+            events, complete = feed.since(after)
+            lines = [f"Next cursor: {feed.cursor}"]
+            if not complete:
+                lines.append(
+                    "> Note: older changes after this cursor were dropped. "
+                    "Re-read the full listings before continuing from the next cursor."
+                )
+            if not events:
+                lines.append("No changes.")
+            lines.extend(event.describe() for event in events)
+            
+            return "\n".join(lines)
+        except Exception as e:
+            logger.error(f"Error fetching changes since {cursor}: {e}")
+            return f"Error fetching changes: {str(e)}"
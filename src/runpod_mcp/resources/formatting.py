@@ -0,0 +1,127 @@
+"""
+Shared formatting helpers for RunPod MCP resources.
+"""
+
+def format_age(seconds: float) -> str:
+    """Format a duration in seconds as a short human-readable string."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+
+def with_stale_notice(client, text: str) -> str:
+    """Prefix resource output with a notice if it was served from a snapshot.
+    
+    When the RunPod API is unavailable the client may answer with the last
+    known data; this makes the age of that data visible to the reader.
+    """
+    age = client.stale_data_age()
+    if age is None:
+        return text
+    return (
+        f"> Note: the RunPod API is currently unavailable. "
+        f"Showing last known data from {format_age(age)} ago.\n\n{text}"
+    )
+
+async def read_listing(context, fetch, iterate=None):
+    """Read a listing from the API, page by page if paging is configured.
+    
+    Args:
+        context: Server run context
+        fetch: Coroutine function that reads the whole listing
+        iterate: Function returning an async iterator over the listing's pages
+    
+    Returns:
+        A list of items, or an async iterator of items when paging is enabled
+    """
+    config = context.get("config")
+    if iterate is not None and config is not None and config.list_page_size > 0:
+        return iterate()
+    return await fetch()
+
+async def read_collection(context, kind: str, fetch, iterate=None):
+    """Read a pod/endpoint/volume listing, preferring the fleet mirror.
+    
+    Args:
+        context: Server run context
+        kind: Mirrored collection name ("pods", "endpoints" or "volumes")
+        fetch: Coroutine function that reads the listing from the API
+        iterate: Function returning an async iterator over the listing's pages
+    
+    Returns:
+        Tuple of (items, mirror age in seconds or None if read from the API);
+        items is an async iterator when it is read page by page
+    """
+    mirror = context.get("fleet_mirror")
+    if mirror is not None:
+        items = mirror.list(kind)
+        if items is not None:
+            return items, mirror.age(kind)
+    return await read_listing(context, fetch, iterate), None
+
+async def iterate_items(items):
+    """Iterate over a list or an async iterator of items."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items or ():
+            yield item
+
+async def read_item(context, kind: str, item_id: str, fetch):
+    """Read a single pod/endpoint/volume, preferring the fleet mirror.
+    
+    Items the mirror does not know yet are fetched through a targeted
+    refresh so that they are mirrored from then on.
+    
+    Returns:
+        Tuple of (item or None, mirror age in seconds or None if read from the API)
+    """
+    mirror = context.get("fleet_mirror")
+    if mirror is not None and mirror.fresh(kind):
+        item = mirror.get(kind, item_id)
+        if item is not None:
+            return item, mirror.age(kind)
+        return await mirror.refresh(kind, item_id), None
+    return await fetch(item_id), None
+
+def format_env(env) -> list:
+    """Format decoded environment variables as list lines, hiding credentials."""
+    lines = []
+    for e in env:
+        if e.sensitive:
+            lines.append(f"- {e.key}: ******")
+        else:
+            lines.append(f"- {e.key}: {e.value if e.value is not None else 'Not set'}")
+    return lines
+
+def with_mirror_notice(text: str, age) -> str:
+    """Append the age of mirrored data to resource output."""
+    if age is None:
+        return text
+    return f"{text}\n\n_Served from the fleet mirror, synced {format_age(age)} ago._"
+
+class RenderMemo:
+    """Remembers the text rendered for the most recent source object.
+    
+    The client returns the identical object when a list response has not
+    changed, so an identity check is enough to skip re-formatting it.
+    """
+    
+    def __init__(self):
+        self._source = None
+        self._text = None
+    
+    def get(self, source):
+        """Return the rendered text if ``source`` is the last rendered object."""
+        if source is not None and source is self._source:
+            return self._text
+        return None
+    
+    def put(self, source, text: str) -> str:
+        """Remember the text rendered for ``source`` and return it."""
+        self._source = source
+        self._text = text
+        return text
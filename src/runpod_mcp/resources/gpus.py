@@ -9,6 +9,8 @@ import json
 from typing import Dict, Any, List, Optional
 
 from ..logging_config import get_logger
+from ..models import GpuType
+from .formatting import with_stale_notice
 
 logger = get_logger(__name__)
 
@@ -39,24 +41,22 @@ def register_gpu_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get GPU types from RunPod
-            gpu_types = await client.get_gpu_types()
+            gpu_types = await client.get_gpu_types(allow_stale=True)
             
             if not gpu_types:
                 return "No GPU types found or unable to retrieve GPU information."
             
             # Format the GPU information for human readability
             formatted_results = []
-            for gpu in gpu_types:
-                name = gpu.get("displayName", "Unknown GPU")
-                vram = gpu.get("memoryInGb", "unknown")
-                price = gpu.get("price", {}).get("minimumBidPrice", "N/A")
-                availability = "Available" if gpu.get("available", False) else "Not available"
+            for item in gpu_types:
+                gpu = GpuType.coerce(item)
+                availability = "Available" if gpu.available else "Not available"
                 
                 formatted_results.append(
-                    f"{name}: {vram}GB VRAM, ${price}/hr - {availability}"
+                    f"{gpu.name}: {gpu.memory_gb}GB VRAM, ${gpu.min_bid_price}/hr - {availability}"
                 )
             
-            return "\n".join(formatted_results)
+            return with_stale_notice(client, "\n".join(formatted_results))
         except Exception as e:
             logger.error(f"Error fetching available GPUs: {e}")
             return f"Error fetching available GPUs: {str(e)}"
@@ -79,52 +79,81 @@ def register_gpu_resources(mcp_server):
             if not client:
                 return "Error: RunPod client not available. Please check API key configuration."
             
-            # Get all GPU types first
-            gpu_types = await client.get_gpu_types()
+            # Get the indexed GPU catalog
+            catalog = await client.get_gpu_catalog(allow_stale=True)
             
-            if not gpu_types:
+            if not catalog:
                 return "No GPU types found or unable to retrieve GPU information."
             
-            # Find the requested GPU
-            gpu = None
-            for g in gpu_types:
-                if g.get("id") == gpu_id or g.get("displayName").lower() == gpu_id.lower():
-                    gpu = g
-                    break
+            # Find the requested GPU by id, name or alias
+            item = catalog.lookup(gpu_id)
             
-            if not gpu:
+            if not item:
                 return f"GPU type '{gpu_id}' not found. Use 'gpus://available' to see all available types."
             
-            # Format detailed GPU information
-            name = gpu.get("displayName", "Unknown GPU")
-            vram = gpu.get("memoryInGb", "unknown")
-            price = gpu.get("price", {}).get("minimumBidPrice", "N/A")
-            on_demand_price = gpu.get("price", {}).get("onDemandPrice", "N/A")
-            secure_cloud = gpu.get("secureCloud", False)
-            datacenter = gpu.get("datacenter", "Unknown")
-            reliability = gpu.get("reliability", "Unknown")
-            
+            gpu = GpuType.coerce(item)
             details = [
-                f"# {name} Detailed Specifications",
-                f"- Memory: {vram}GB VRAM",
-                f"- Minimum Bid Price: ${price}/hr",
-                f"- On-Demand Price: ${on_demand_price}/hr",
-                f"- Secure Cloud: {'Yes' if secure_cloud else 'No'}",
-                f"- Datacenter: {datacenter}",
-                f"- Reliability: {reliability}",
+                f"# {gpu.name} Detailed Specifications",
+                f"- Memory: {gpu.memory_gb}GB VRAM",
+                f"- Minimum Bid Price: ${gpu.min_bid_price}/hr",
+                f"- On-Demand Price: ${gpu.on_demand_price}/hr",
+                f"- Secure Cloud: {'Yes' if gpu.secure_cloud else 'No'}",
+                f"- Datacenter: {gpu.datacenter}",
+                f"- Reliability: {gpu.reliability}",
             ]
             
             # Add availability info
-            if gpu.get("available", False):
+            if gpu.available:
                 details.append("- Status: Currently Available")
             else:
                 details.append("- Status: Not Currently Available")
             
-            return "\n".join(details)
+            return with_stale_notice(client, "\n".join(details))
         except Exception as e:
             logger.error(f"Error fetching GPU details for {gpu_id}: {e}")
             return f"Error fetching GPU details: {str(e)}"
     
+    @mcp_server.resource("gpus://cloud/{cloud_type}")
+    async def gpus_by_cloud(cloud_type: str) -> str:
+        """
+        Get the GPU types offered in a specific cloud.
+        
+        Parameters:
+        - cloud_type: Either "secure" or "community"
+        
+        Returns the GPU types available in the given cloud, ordered by VRAM.
+        """
+        try:
+            context = mcp_server.get_run_context()
+            client = context.get("runpod_client")
+            
+            if not client:
+                return "Error: RunPod client not available. Please check API key configuration."
+            
+            cloud_type = cloud_type.lower()
+            if cloud_type not in ("secure", "community"):
+                return f"Unknown cloud type: {cloud_type}. Available types: secure, community"
+            
+            catalog = await client.get_gpu_catalog(allow_stale=True)
+            gpus = sorted(catalog.filter(cloud=cloud_type), key=lambda g: g.get("memoryInGb") or 0)
+            
+            if not gpus:
+                return f"No GPU types found in the {cloud_type} cloud."
+            
+            formatted_results = [f"# GPUs in {cloud_type.capitalize()} Cloud"]
+            for item in gpus:
+                gpu = GpuType.coerce(item)
+                availability = "Available" if gpu.available else "Not available"
+                
+                formatted_results.append(
+                    f"- {gpu.name}: {gpu.memory_gb}GB VRAM, ${gpu.min_bid_price}/hr - {availability}"
+                )
+            
+            return with_stale_notice(client, "\n".join(formatted_results))
+        except Exception as e:
+            logger.error(f"Error fetching GPUs for {cloud_type} cloud: {e}")
+            return f"Error fetching GPUs by cloud: {str(e)}"
+    
     @mcp_server.resource("gpus://recommended/{workload_type}")
     async def recommended_gpus(workload_type: str) -> str:
         """
@@ -144,7 +173,7 @@ def register_gpu_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get all GPU types
-            gpu_types = await client.get_gpu_types()
+            gpu_types = await client.get_gpu_types(allow_stale=True)
             
             if not gpu_types:
                 return "No GPU types found or unable to retrieve GPU information."
@@ -9,12 +9,21 @@ from typing import Dict, Any, List, Optional
 import json
 
 from ..logging_config import get_logger
+from ..models import Pod, Template
+from .formatting import (
+    RenderMemo, format_env, iterate_items, read_collection, read_item, read_listing,
+    with_mirror_notice, with_stale_notice
+)
 
 logger = get_logger(__name__)
 
 def register_pod_resources(mcp_server):
     """Register pod-related resources with the MCP server."""
     
+    # Unchanged list responses are the same object, so their text is reused
+    pod_list_memo = RenderMemo()
+    template_list_memo = RenderMemo()
+    
     @mcp_server.resource("pods://list")
     async def list_pods() -> str:
         """
@@ -45,38 +54,34 @@ def register_pod_resources(mcp_server):
             if not client:
                 return "Error: RunPod client not available. Please check API key configuration."
             
-            # Get pods from RunPod
-            pods = await client.get_pods()
+            # Get pods from the fleet mirror or RunPod
+            pods, mirror_age = await read_collection(
+                context, "pods", lambda: client.get_pods(typed=True, allow_stale=True),
+                lambda: client.iter_pods(allow_stale=True)
+            )
             
-            if not pods:
-                return "No pods found in your account."
+            rendered = pod_list_memo.get(pods)
+            if rendered is not None:
+                return with_mirror_notice(with_stale_notice(client, rendered), mirror_age)
             
             # Format the pod information
             formatted_results = []
-            for pod in pods:
-                pod_id = pod.get("id", "Unknown ID")
-                name = pod.get("name", "Unnamed Pod")
-                gpu_name = pod.get("gpuDisplayName", "Unknown GPU")
-                status = pod.get("desiredStatus", "UNKNOWN")
-                runtime = pod.get("runtime", {}).get("uptimeInSeconds", 0)
-                cost = pod.get("runtime", {}).get("costPerHr", 0)
-                
-                # Convert runtime to human-readable format
-                hours = runtime // 3600
-                minutes = (runtime % 3600) // 60
-                runtime_str = f"{hours}h {minutes}m"
-                
-                # Format the pod information
+            async for item in iterate_items(pods):
+                pod = Pod.coerce(item)
                 formatted_results.append(
-                    f"Pod ID: {pod_id}\n"
-                    f"Name: {name}\n"
-                    f"GPU: {gpu_name}\n"
-                    f"Status: {status}\n"
-                    f"Uptime: {runtime_str}\n"
-                    f"Cost: ${cost:.2f}/hr\n"
+                    f"Pod ID: {pod.id}\n"
+                    f"Name: {pod.name}\n"
+                    f"GPU: {pod.gpu_name}\n"
+                    f"Status: {pod.status}\n"
+                    f"Uptime: {pod.uptime}\n"
+                    f"Cost: ${pod.cost_per_hr:.2f}/hr\n"
                 )
             
-            return "\n".join(formatted_results)
+            if not formatted_results:
+                return "No pods found in your account."
+            
+            rendered = pod_list_memo.put(pods, "\n".join(formatted_results))
+            return with_mirror_notice(with_stale_notice(client, rendered), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching pods: {e}")
             return f"Error fetching pods: {str(e)}"
@@ -104,55 +109,27 @@ def register_pod_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get pod details
-            pod = await client.get_pod(pod_id)
+            item, mirror_age = await read_item(
+                context, "pods", pod_id, lambda item_id: client.get_pod(item_id, allow_stale=True)
+            )
             
-            if not pod:
+            if not item:
                 return f"Pod with ID '{pod_id}' not found."
             
-            # Format detailed pod information
-            name = pod.get("name", "Unnamed Pod")
-            gpu_name = pod.get("gpuDisplayName", "Unknown GPU")
-            gpu_count = pod.get("gpuCount", 1)
-            status = pod.get("desiredStatus", "UNKNOWN")
-            machine_id = pod.get("machineId", "Unknown")
-            env = pod.get("env", [])
-            
-            # Networking info
-            networks = pod.get("ports", [])
-            network_info = []
-            for network in networks:
-                network_info.append(f"- {network.get('name', 'Unknown')}: {network.get('ip', 'Unknown')}:{network.get('publicPort', 'Unknown')}")
-            
-            # Storage volumes
-            volumes = pod.get("volumeMounts", [])
-            volume_info = []
-            for volume in volumes:
-                volume_info.append(f"- {volume.get('name', 'Unknown')}: {volume.get('mountPath', 'Unknown')}")
-            
-            # Runtime info
-            runtime = pod.get("runtime", {})
-            uptime = runtime.get("uptimeInSeconds", 0)
-            hours = uptime // 3600
-            minutes = (uptime % 3600) // 60
-            uptime_str = f"{hours}h {minutes}m"
-            cost_per_hr = runtime.get("costPerHr", 0)
-            
-            # Container info
-            container = pod.get("container", {})
-            image = container.get("image", "Unknown")
-            disk_in_gb = container.get("diskInGb", 0)
-            memory_in_gb = container.get("memoryInGb", 0)
+            pod = Pod.coerce(item)
+            network_info = [f"- {port.name}: {port.ip}:{port.public_port}" for port in pod.ports]
+            volume_info = [f"- {mount.name}: {mount.mount_path}" for mount in pod.volume_mounts]
             
             # Assemble the details
             details = [
-                f"# Pod: {name} ({pod_id})",
+                f"# Pod: {pod.name} ({pod_id})",
                 f"## Configuration",
-                f"- Status: {status}",
-                f"- GPU: {gpu_count}x {gpu_name}",
-                f"- Machine ID: {machine_id}",
-                f"- Container Image: {image}",
-                f"- Disk: {disk_in_gb} GB",
-                f"- Memory: {memory_in_gb} GB",
+                f"- Status: {pod.status}",
+                f"- GPU: {pod.gpu_count}x {pod.gpu_name}",
+                f"- Machine ID: {pod.machine_id}",
+                f"- Container Image: {pod.image}",
+                f"- Disk: {pod.disk_gb} GB",
+                f"- Memory: {pod.memory_gb} GB",
                 f"",
                 f"## Networking",
             ]
@@ -171,17 +148,17 @@ def register_pod_resources(mcp_server):
             
             details.append("")
             details.append("## Runtime")
-            details.append(f"- Uptime: {uptime_str}")
-            details.append(f"- Cost: ${cost_per_hr:.2f}/hr")
+            details.append(f"- Uptime: {pod.uptime}")
+            details.append(f"- Cost: ${pod.cost_per_hr:.2f}/hr")
             
-            if env:
+            if pod.env:
                 details.append("")
                 details.append("## Environment Variables")
-                for e in env:
-                    if isinstance(e, dict) and "key" in e:
-                        details.append(f"- {e.get('key')}: {e.get('value', '******') if e.get('key', '').lower() != 'runpod_api_key' else '******'}")
+                for e in pod.env:
+                    hidden = e.value is None or e.key.lower() == "runpod_api_key"
+                    details.append(f"- {e.key}: {'******' if hidden else e.value}")
             
-            return "\n".join(details)
+            return with_mirror_notice(with_stale_notice(client, "\n".join(details)), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching pod details for {pod_id}: {e}")
             return f"Error fetching pod details: {str(e)}"
@@ -205,29 +182,29 @@ def register_pod_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get templates from RunPod
-            templates = await client.get_pod_templates()
+            templates = await read_listing(
+                context, lambda: client.get_pod_templates(typed=True, allow_stale=True),
+                lambda: client.iter_pod_templates(allow_stale=True)
+            )
             
-            if not templates:
-                return "No pod templates found."
+            rendered = template_list_memo.get(templates)
+            if rendered is not None:
+                return with_stale_notice(client, rendered)
             
             # Format the template information
             formatted_results = []
-            for template in templates:
-                template_id = template.get("id", "Unknown ID")
-                name = template.get("name", "Unnamed Template")
-                container = template.get("container", {})
-                image = container.get("image", "Unknown")
-                description = template.get("description", "No description available")
-                
-                formatted_results.append(
-                    f"## {name} (ID: {template_id})",
-                    f"- Image: {image}",
-                    f"- Description: {description}",
+            async for item in iterate_items(templates):
+                template = Template.coerce(item)
+                formatted_results.extend([
+                    f"## {template.name} (ID: {template.id})",
+                    f"- Image: {template.image}",
+                    f"- Description: {template.description}",
                     ""
-                )
+                ])
             
             if formatted_results:
-                return "# Available Pod Templates\n\n" + "\n".join(formatted_results)
+                rendered = "# Available Pod Templates\n\n" + "\n".join(formatted_results)
+                return with_stale_notice(client, template_list_memo.put(templates, rendered))
             else:
                 return "No pod templates found."
         except Exception as e:
@@ -254,66 +231,52 @@ def register_pod_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get templates from RunPod
-            templates = await client.get_pod_templates()
+            templates = await read_listing(
+                context, lambda: client.get_pod_templates(typed=True, allow_stale=True),
+                lambda: client.iter_pod_templates(allow_stale=True)
+            )
             
-            if not templates:
-                return "No pod templates found."
-            
-            # Find the requested template
+            # Find the requested template, reading no further pages once found
             template = None
-            for t in templates:
-                if t.get("id") == template_id:
-                    template = t
+            async for t in iterate_items(templates):
+                if (t.id if isinstance(t, Template) else t.get("id")) == template_id:
+                    template = Template.coerce(t)
                     break
+            if hasattr(templates, "aclose"):
+                await templates.aclose()
             
             if not template:
                 return f"Template with ID '{template_id}' not found. Use 'pods://templates' to see available templates."
             
-            # Format detailed template information
-            name = template.get("name", "Unnamed Template")
-            description = template.get("description", "No description available")
-            container = template.get("container", {})
-            image = container.get("image", "Unknown")
-            cmd = container.get("command", "")
-            env = template.get("env", [])
-            volumes = template.get("volumeMounts", [])
-            ports = template.get("ports", [])
-            
             details = [
-                f"# Template: {name} ({template_id})",
+                f"# Template: {template.name} ({template_id})",
                 f"",
                 f"## Description",
-                f"{description}",
+                f"{template.description}",
                 f"",
                 f"## Container Configuration",
-                f"- Image: {image}",
-                f"- Command: {cmd}" if cmd else "- Command: None specified",
+                f"- Image: {template.image}",
+                f"- Command: {template.command}" if template.command else "- Command: None specified",
             ]
             
-            if ports:
+            if template.ports:
                 details.append("")
                 details.append("## Network Ports")
-                for port in ports:
-                    details.append(f"- {port.get('name', 'Unknown')}: {port.get('containerPort', 'Unknown')}")
+                for port in template.ports:
+                    details.append(f"- {port.name}: {port.container_port}")
             
-            if volumes:
+            if template.volume_mounts:
                 details.append("")
                 details.append("## Volume Mounts")
-                for volume in volumes:
-                    details.append(f"- {volume.get('name', 'Unknown')}: {volume.get('mountPath', 'Unknown')}")
+                for mount in template.volume_mounts:
+                    details.append(f"- {mount.name}: {mount.mount_path}")
             
-            if env:
+            if template.env:
                 details.append("")
                 details.append("## Environment Variables")
-                for e in env:
-                    if isinstance(e, dict) and "key" in e:
-                        # Don't display API keys or sensitive information
-                        if "api_key" in e.get("key", "").lower() or "password" in e.get("key", "").lower() or "secret" in e.get("key", "").lower():
-                            details.append(f"- {e.get('key')}: ******")
-                        else:
-                            details.append(f"- {e.get('key')}: {e.get('value', 'Not set')}")
+                details.extend(format_env(template.env))
             
-            return "\n".join(details)
+            return with_stale_notice(client, "\n".join(details))
         except Exception as e:
             logger.error(f"Error fetching template details for {template_id}: {e}")
             return f"Error fetching template details: {str(e)}" 
\ No newline at end of file
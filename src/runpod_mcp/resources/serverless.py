@@ -9,6 +9,9 @@ from typing import Dict, Any, List, Optional
 import json
 
 from ..logging_config import get_logger
+from ..models import Endpoint, Template
+from ..sampler import WINDOWS
+from .formatting import format_env, iterate_items, read_collection, read_item, with_mirror_notice, with_stale_notice
 
 logger = get_logger(__name__)
 
@@ -45,33 +48,29 @@ def register_serverless_resources(mcp_server):
             if not client:
                 return "Error: RunPod client not available. Please check API key configuration."
             
-            # Get endpoints from RunPod
-            endpoints = await client.get_endpoints()
-            
-            if not endpoints:
-                return "No serverless endpoints found in your account."
+            # Get endpoints from the fleet mirror or RunPod
+            endpoints, mirror_age = await read_collection(
+                context, "endpoints", lambda: client.get_endpoints(typed=True, allow_stale=True),
+                lambda: client.iter_endpoints(allow_stale=True)
+            )
             
             # Format the endpoint information
             formatted_results = []
-            for endpoint in endpoints:
-                endpoint_id = endpoint.get("id", "Unknown ID")
-                name = endpoint.get("name", "Unnamed Endpoint")
-                status = endpoint.get("status", "UNKNOWN")
-                workers = endpoint.get("workersRunning", 0)
-                workers_max = endpoint.get("workersMax", 0)
-                gpu_type = endpoint.get("gpuIds", ["Unknown"])[0] if endpoint.get("gpuIds") else "Unknown"
-                cost_per_hour = endpoint.get("costPerHour", 0)
-                
+            async for item in iterate_items(endpoints):
+                endpoint = Endpoint.coerce(item)
                 formatted_results.append(
-                    f"Endpoint ID: {endpoint_id}\n"
-                    f"Name: {name}\n"
-                    f"Status: {status}\n"
-                    f"Workers: {workers}/{workers_max}\n"
-                    f"GPU: {gpu_type}\n"
-                    f"Cost: ${cost_per_hour:.2f}/hr\n"
+                    f"Endpoint ID: {endpoint.id}\n"
+                    f"Name: {endpoint.name}\n"
+                    f"Status: {endpoint.status}\n"
+                    f"Workers: {endpoint.workers_running}/{endpoint.workers_max}\n"
+                    f"GPU: {endpoint.gpu_type}\n"
+                    f"Cost: ${endpoint.cost_per_hour:.2f}/hr\n"
                 )
             
-            return "\n".join(formatted_results)
+            if not formatted_results:
+                return "No serverless endpoints found in your account."
+            
+            return with_mirror_notice(with_stale_notice(client, "\n".join(formatted_results)), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching serverless endpoints: {e}")
             return f"Error fetching serverless endpoints: {str(e)}"
@@ -98,82 +97,56 @@ def register_serverless_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get endpoint details
-            endpoint = await client.get_endpoint(endpoint_id)
+            item, mirror_age = await read_item(
+                context, "endpoints", endpoint_id, lambda item_id: client.get_endpoint(item_id, allow_stale=True)
+            )
             
-            if not endpoint:
+            if not item:
                 return f"Endpoint with ID '{endpoint_id}' not found."
             
-            # Format detailed endpoint information
-            name = endpoint.get("name", "Unnamed Endpoint")
-            status = endpoint.get("status", "UNKNOWN")
-            workers_running = endpoint.get("workersRunning", 0)
-            workers_max = endpoint.get("workersMax", 0)
-            workers_idle = endpoint.get("idleTimeout", 0)
-            workers_scaling = endpoint.get("scalerType", "Unknown")
-            gpu_types = endpoint.get("gpuIds", ["Unknown"])
-            gpu_count = endpoint.get("gpuCount", 1)
-            container_disk = endpoint.get("containerDisk", 0)
-            container_memory = endpoint.get("containerMemory", 0)
-            network_volume = endpoint.get("networkVolumeId", "None")
-            cost_per_hour = endpoint.get("costPerHour", 0)
-            
-            # Container info
-            template = endpoint.get("template", {})
-            container = template.get("container", {})
-            image = container.get("image", "Unknown")
-            env = template.get("env", [])
-            
-            # Queue info
-            queue_type = endpoint.get("queueType", "Unknown")
-            queue_size = endpoint.get("queueSize", 0)
+            endpoint = Endpoint.coerce(item)
             
             # Format the details
             details = [
-                f"# Endpoint: {name} ({endpoint_id})",
+                f"# Endpoint: {endpoint.name} ({endpoint_id})",
                 f"",
                 f"## Status",
-                f"- Current Status: {status}",
-                f"- Workers Running: {workers_running}/{workers_max}",
-                f"- Worker Idle Timeout: {workers_idle} seconds",
-                f"- Scaling Strategy: {workers_scaling}",
-                f"- Queue Type: {queue_type}",
-                f"- Queue Size: {queue_size}",
+                f"- Current Status: {endpoint.status}",
+                f"- Workers Running: {endpoint.workers_running}/{endpoint.workers_max}",
+                f"- Worker Idle Timeout: {endpoint.idle_timeout} seconds",
+                f"- Scaling Strategy: {endpoint.scaler_type}",
+                f"- Queue Type: {endpoint.queue_type}",
+                f"- Queue Size: {endpoint.queue_size}",
                 f"",
                 f"## Hardware Configuration",
-                f"- GPU Type: {', '.join(gpu_types)}",
-                f"- GPU Count per Worker: {gpu_count}",
-                f"- Container Disk: {container_disk} GB",
-                f"- Container Memory: {container_memory} GB",
+                f"- GPU Type: {', '.join(endpoint.gpu_ids)}",
+                f"- GPU Count per Worker: {endpoint.gpu_count}",
+                f"- Container Disk: {endpoint.container_disk} GB",
+                f"- Container Memory: {endpoint.container_memory} GB",
             ]
             
-            if network_volume and network_volume != "None":
-                details.append(f"- Network Volume: {network_volume}")
+            if endpoint.network_volume_id and endpoint.network_volume_id != "None":
+                details.append(f"- Network Volume: {endpoint.network_volume_id}")
             
             details.extend([
                 f"",
                 f"## Container Configuration",
-                f"- Image: {image}",
+                f"- Image: {endpoint.image}",
             ])
             
-            if env:
+            if endpoint.env:
                 details.append("")
                 details.append("## Environment Variables")
-                for e in env:
-                    if isinstance(e, dict) and "key" in e:
-                        # Don't display API keys or sensitive information
-                        if "api_key" in e.get("key", "").lower() or "password" in e.get("key", "").lower() or "secret" in e.get("key", "").lower():
-                            details.append(f"- {e.get('key')}: ******")
-                        else:
-                            details.append(f"- {e.get('key')}: {e.get('value', 'Not set')}")
+                details.extend(format_env(endpoint.env))
             
             details.extend([
                 f"",
                 f"## Cost",
-                f"- Cost per Hour: ${cost_per_hour:.2f}/hr",
-                f"- Estimated Daily Cost (at max workers): ${cost_per_hour * 24 * workers_max:.2f}",
+                f"- Cost per Hour: ${endpoint.cost_per_hour:.2f}/hr",
+                f"- Estimated Daily Cost (at max workers): ${endpoint.cost_per_hour * 24 * endpoint.workers_max:.2f}",
             ])
             
-            return "\n".join(details)
+            return with_mirror_notice(with_stale_notice(client, "\n".join(details)), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching endpoint details for {endpoint_id}: {e}")
             return f"Error fetching endpoint details: {str(e)}"
@@ -200,7 +173,7 @@ def register_serverless_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get endpoint metrics
-            metrics = await client.get_endpoint_metrics(endpoint_id)
+            metrics = await client.get_endpoint_metrics(endpoint_id, allow_stale=True)
             
             if not metrics:
                 return f"No metrics available for endpoint with ID '{endpoint_id}'."
@@ -242,11 +215,116 @@ def register_serverless_resources(mcp_server):
                     f"- Credit Spent: ${credit_spent:.2f}",
                 ])
             
-            return "\n".join(details)
+            return with_stale_notice(client, "\n".join(details))
         except Exception as e:
             logger.error(f"Error fetching endpoint metrics for {endpoint_id}: {e}")
             return f"Error fetching endpoint metrics: {str(e)}"
     
+    def get_sampler():
+        context = mcp_server.get_run_context()
+        return context.get("metrics_sampler")
+    
+    def check_window(window: str) -> Optional[str]:
+        if window not in WINDOWS:
+            return f"Error: unknown window '{window}'. Use one of: {', '.join(WINDOWS)}."
+        return None
+    
+    @mcp_server.resource("serverless://endpoint/{endpoint_id}/metrics/{window}")
+    async def endpoint_metrics_window(endpoint_id: str, window: str) -> str:
+        """
+        Get sampled metrics statistics for a serverless endpoint over a window.
+        
+        Parameters:
+        - endpoint_id: The ID of the endpoint
+        - window: The time window: 5m, 1h or 24h
+        
+        Returns request and failure rates, and the average and p50/p95/p99
+        of response time and worker utilization over the window.
+        Requires the metrics sampler (RUNPOD_METRICS_SAMPLER=1).
+        """
+        try:
+            sampler = get_sampler()
+            if not sampler:
+                return "Error: the metrics sampler is disabled. Set RUNPOD_METRICS_SAMPLER=1 or pass --metrics-sampler to enable it."
+            
+            error = check_window(window)
+            if error:
+                return error
+            
+            summary = sampler.summary(endpoint_id, window)
+            if not summary or not summary["samples"]:
+                return f"No metrics samples for endpoint '{endpoint_id}' in the last {window} yet."
+            
+            name = sampler.names.get(endpoint_id, "Unnamed Endpoint")
+            response_time = summary["response_time"]
+            utilization = summary["utilization"]
+            details = [
+                f"# Metrics for Endpoint: {name} ({endpoint_id}), last {window}",
+                f"",
+                f"- Samples: {summary['samples']} (every {sampler.interval:g}s)",
+                f"- Requests/sec: {summary['requestsPerSec']:.3f}",
+                f"- Failures/sec: {summary['failuresPerSec']:.3f}",
+                f"",
+                f"## Response Time (seconds)",
+                f"- Average: {response_time['avg']:.2f}",
+                f"- p50 / p95 / p99: {response_time['p50']:.2f} / {response_time['p95']:.2f} / {response_time['p99']:.2f}",
+                f"",
+                f"## Worker Utilization",
+                f"- Average: {utilization['avg'] * 100:.1f}%",
+                f"- p50 / p95 / p99: {utilization['p50'] * 100:.1f}% / {utilization['p95'] * 100:.1f}% / {utilization['p99'] * 100:.1f}%",
+            ]
+            
+            return "\n".join(details)
+        except Exception as e:
+            logger.error(f"Error summarizing endpoint metrics for {endpoint_id}: {e}")
+            return f"Error summarizing endpoint metrics: {str(e)}"
+    
+    @mcp_server.resource("serverless://metrics/{window}")
+    async def all_endpoint_metrics(window: str) -> str:
+        """
+        Get sampled metrics statistics for every serverless endpoint over a window.
+        
+        Parameters:
+        - window: The time window: 5m, 1h or 24h
+        
+        Returns one row per endpoint with request and failure rates, p95
+        response time and average utilization over the window.
+        Requires the metrics sampler (RUNPOD_METRICS_SAMPLER=1).
+        """
+        try:
+            sampler = get_sampler()
+            if not sampler:
+                return "Error: the metrics sampler is disabled. Set RUNPOD_METRICS_SAMPLER=1 or pass --metrics-sampler to enable it."
+            
+            error = check_window(window)
+            if error:
+                return error
+            
+            rows = []
+            for endpoint_id in sorted(sampler.rings):
+                summary = sampler.summary(endpoint_id, window)
+                if not summary or not summary["samples"]:
+                    continue
+                rows.append(
+                    f"| {endpoint_id} | {sampler.names.get(endpoint_id, '')} | "
+                    f"{summary['requestsPerSec']:.3f} | {summary['failuresPerSec']:.3f} | "
+                    f"{summary['response_time']['p95']:.2f}s | {summary['utilization']['avg'] * 100:.1f}% |"
+                )
+            
+            if not rows:
+                return f"No endpoint metrics samples in the last {window} yet."
+            
+            lines = [
+                f"# Serverless Endpoint Metrics, last {window}",
+                "",
+                "| Endpoint ID | Name | Requests/sec | Failures/sec | p95 Response | Avg Utilization |",
+                "|---|---|---|---|---|---|",
+            ]
+            return "\n".join(lines + rows)
+        except Exception as e:
+            logger.error(f"Error summarizing endpoint metrics: {e}")
+            return f"Error summarizing endpoint metrics: {str(e)}"
+    
     @mcp_server.resource("serverless://templates")
     async def serverless_templates() -> str:
         """
@@ -266,7 +344,7 @@ def register_serverless_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get serverless templates from RunPod
-            templates = await client.get_serverless_templates()
+            templates = await client.get_serverless_templates(typed=True, allow_stale=True)
             
             if not templates:
                 return "No serverless templates found."
@@ -275,21 +353,16 @@ def register_serverless_resources(mcp_server):
             formatted_results = []
             formatted_results.append("# Available Serverless Templates\n")
             
-            for template in templates:
-                template_id = template.get("id", "Unknown ID")
-                name = template.get("name", "Unnamed Template")
-                container = template.get("container", {})
-                image = container.get("image", "Unknown")
-                description = template.get("description", "No description available")
-                
+            for item in templates:
+                template = Template.coerce(item)
                 formatted_results.extend([
-                    f"## {name} (ID: {template_id})",
-                    f"- Image: {image}",
-                    f"- Description: {description}",
+                    f"## {template.name} (ID: {template.id})",
+                    f"- Image: {template.image}",
+                    f"- Description: {template.description}",
                     ""
                 ])
             
-            return "\n".join(formatted_results)
+            return with_stale_notice(client, "\n".join(formatted_results))
         except Exception as e:
             logger.error(f"Error fetching serverless templates: {e}")
             return f"Error fetching serverless templates: {str(e)}" 
\ No newline at end of file
@@ -9,12 +9,19 @@ from typing import Dict, Any, List, Optional
 import json
 
 from ..logging_config import get_logger
+from ..models import NetworkVolume
+from .formatting import (
+    RenderMemo, iterate_items, read_collection, read_item, with_mirror_notice, with_stale_notice
+)
 
 logger = get_logger(__name__)
 
 def register_storage_resources(mcp_server):
     """Register storage-related resources with the MCP server."""
     
+    # Unchanged list responses are the same object, so their text is reused
+    volume_list_memo = RenderMemo()
+    
     @mcp_server.resource("storage://volumes")
     async def list_volumes() -> str:
         """
@@ -45,32 +52,34 @@ def register_storage_resources(mcp_server):
             if not client:
                 return "Error: RunPod client not available. Please check API key configuration."
             
-            # Get volumes from RunPod
-            volumes = await client.get_network_volumes()
+            # Get volumes from the fleet mirror or RunPod
+            volumes, mirror_age = await read_collection(
+                context, "volumes", lambda: client.get_network_volumes(typed=True, allow_stale=True),
+                lambda: client.iter_network_volumes(allow_stale=True)
+            )
             
-            if not volumes:
-                return "No network storage volumes found in your account."
+            rendered = volume_list_memo.get(volumes)
+            if rendered is not None:
+                return with_mirror_notice(with_stale_notice(client, rendered), mirror_age)
             
             # Format the volume information
             formatted_results = []
-            for volume in volumes:
-                volume_id = volume.get("id", "Unknown ID")
-                name = volume.get("name", "Unnamed Volume")
-                size_gb = volume.get("sizeGB", 0)
-                status = volume.get("status", "UNKNOWN")
-                storage_type = volume.get("storageType", "Network Storage")
-                cost = volume.get("costPerHr", 0)
-                
+            async for item in iterate_items(volumes):
+                volume = NetworkVolume.coerce(item)
                 formatted_results.append(
-                    f"Volume ID: {volume_id}\n"
-                    f"Name: {name}\n"
-                    f"Size: {size_gb} GB\n"
-                    f"Type: {storage_type}\n"
-                    f"Status: {status}\n"
-                    f"Cost: ${cost:.2f}/hr\n"
+                    f"Volume ID: {volume.id}\n"
+                    f"Name: {volume.name}\n"
+                    f"Size: {volume.size_gb} GB\n"
+                    f"Type: {volume.storage_type}\n"
+                    f"Status: {volume.status}\n"
+                    f"Cost: ${volume.cost_per_hr:.2f}/hr\n"
                 )
             
-            return "\n".join(formatted_results)
+            if not formatted_results:
+                return "No network storage volumes found in your account."
+            
+            rendered = volume_list_memo.put(volumes, "\n".join(formatted_results))
+            return with_mirror_notice(with_stale_notice(client, rendered), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching network volumes: {e}")
             return f"Error fetching network volumes: {str(e)}"
@@ -97,57 +106,46 @@ def register_storage_resources(mcp_server):
                 return "Error: RunPod client not available. Please check API key configuration."
             
             # Get volume details
-            volume = await client.get_network_volume(volume_id)
+            item, mirror_age = await read_item(
+                context, "volumes", volume_id, lambda item_id: client.get_network_volume(item_id, allow_stale=True)
+            )
             
-            if not volume:
+            if not item:
                 return f"Volume with ID '{volume_id}' not found."
             
-            # Format detailed volume information
-            name = volume.get("name", "Unnamed Volume")
-            size_gb = volume.get("sizeGB", 0)
-            status = volume.get("status", "UNKNOWN")
-            storage_type = volume.get("storageType", "Network Storage")
-            cost = volume.get("costPerHr", 0)
-            region = volume.get("region", "Unknown")
-            created_at = volume.get("createdAt", "Unknown")
-            attached_pods = volume.get("pods", [])
-            attached_endpoints = volume.get("endpoints", [])
+            volume = NetworkVolume.coerce(item)
             
             # Format the details
             details = [
-                f"# Volume: {name} ({volume_id})",
+                f"# Volume: {volume.name} ({volume_id})",
                 f"",
                 f"## Configuration",
-                f"- Status: {status}",
-                f"- Size: {size_gb} GB",
-                f"- Type: {storage_type}",
-                f"- Region: {region}",
-                f"- Created: {created_at}",
+                f"- Status: {volume.status}",
+                f"- Size: {volume.size_gb} GB",
+                f"- Type: {volume.storage_type}",
+                f"- Region: {volume.region}",
+                f"- Created: {volume.created_at}",
                 f"",
                 f"## Cost",
-                f"- Cost per Hour: ${cost:.2f}/hr",
-                f"- Estimated Monthly Cost: ${cost * 24 * 30:.2f}",
+                f"- Cost per Hour: ${volume.cost_per_hr:.2f}/hr",
+                f"- Estimated Monthly Cost: ${volume.cost_per_hr * 24 * 30:.2f}",
             ]
             
             # Add attached pods
-            if attached_pods:
+            if volume.pods:
                 details.append("")
                 details.append("## Attached Pods")
-                for pod in attached_pods:
-                    pod_id = pod.get("id", "Unknown")
-                    pod_name = pod.get("name", "Unnamed Pod")
+                for pod_id, pod_name in volume.pods:
                     details.append(f"- {pod_name} (ID: {pod_id})")
             
             # Add attached endpoints
-            if attached_endpoints:
+            if volume.endpoints:
                 details.append("")
                 details.append("## Attached Serverless Endpoints")
-                for endpoint in attached_endpoints:
-                    endpoint_id = endpoint.get("id", "Unknown")
-                    endpoint_name = endpoint.get("name", "Unnamed Endpoint")
+                for endpoint_id, endpoint_name in volume.endpoints:
                     details.append(f"- {endpoint_name} (ID: {endpoint_id})")
             
-            return "\n".join(details)
+            return with_mirror_notice(with_stale_notice(client, "\n".join(details)), mirror_age)
         except Exception as e:
             logger.error(f"Error fetching volume details for {volume_id}: {e}")
             return f"Error fetching volume details: {str(e)}"
@@ -0,0 +1,155 @@
+"""
+Retry policy for the RunPod API client.
+
+Retries transient failures (throttling, gateway errors, connection
+problems) with exponential backoff and decorrelated jitter, honoring
+the server's Retry-After header, and fails fast on errors that a retry
+cannot fix.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Methods that are safe to repeat
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+@dataclass
+class RetryPolicy:
+    """Settings that decide whether and when a failed request is retried."""
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_non_idempotent: bool = False
+    retry_statuses: frozenset = frozenset({408, 429, 500, 502, 503, 504})
+    fatal_statuses: frozenset = frozenset({400, 401, 403, 404, 422})
+    
+    def should_retry(self, method: str, error: Exception) -> bool:
+        """Decide whether a failed request may be retried.
+        
+        A 429 is retried for every method because the server rejected the
+        request before processing it; other failures are only retried for
+        idempotent methods unless ``retry_non_idempotent`` is set.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status in self.fatal_statuses or status not in self.retry_statuses:
+                return False
+            if status == 429:
+                return True
+        elif not isinstance(error, httpx.TransportError):
+            return False
+        
+        return method.upper() in IDEMPOTENT_METHODS or self.retry_non_idempotent
+    
+    def next_delay(self, previous: float, rng: random.Random) -> float:
+        """Compute the next backoff using decorrelated jitter."""
+        return min(self.max_delay, rng.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the Retry-After delay of a response in seconds, if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+@dataclass
+class RouteRetryStats:
+    """Retry counters for a single API route."""
+    requests: int = 0
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain dictionary."""
+        return dict(self.__dict__)
+
+class RetryEngine:
+    """Run API calls under a RetryPolicy and keep per-route counters."""
+    
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: Optional[random.Random] = None
+    ):
+        """Initialize the retry engine.
+        
+        Args:
+            policy: Retry policy to apply
+            sleep: Coroutine used to wait between attempts
+            rng: Random number generator for jitter
+        """
+        self.policy = policy
+        self.stats: Dict[str, RouteRetryStats] = defaultdict(RouteRetryStats)
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+    
+    async def call(self, method: str, route: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Call ``fn``, retrying transient failures.
+        
+        Args:
+            method: HTTP method of the request
+            route: Route template used for the per-route counters
+            fn: Coroutine function performing one attempt
+        
+        Returns:
+            The result of the first successful attempt
+        """
+        stats = self.stats[f"{method} {route}"]
+        stats.requests += 1
+        delay = self.policy.base_delay
+        attempt = 1
+        
+        while True:
+            try:
+                result = await fn()
+            except Exception as e:
+                if attempt >= self.policy.max_attempts or not self.policy.should_retry(method, e):
+                    if attempt > 1:
+                        stats.exhausted += 1
+                    raise
+                
+                delay = self.policy.next_delay(delay, self._rng)
+                if isinstance(e, httpx.HTTPStatusError):
+                    retry_after = parse_retry_after(e.response)
+                    if retry_after is not None:
+                        if retry_after > self.policy.max_delay:
+                            stats.exhausted += 1
+                            raise
+                        delay = max(delay, retry_after)
+                
+                stats.retries += 1
+                attempt += 1
+                logger.warning(
+                    f"{method} {route} failed ({e}); retrying in {delay:.2f}s "
+                    f"(attempt {attempt}/{self.policy.max_attempts})"
+                )
+                await self._sleep(delay)
+                continue
+            
+            if attempt > 1:
+                stats.recovered += 1
+            return result
+    
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Return per-route retry counters for reporting."""
+        return {route: stats.as_dict() for route, stats in self.stats.items()}
@@ -0,0 +1,226 @@
+"""
+Serverless endpoint metrics sampler for the RunPod MCP server.
+
+Periodically records every endpoint's metrics into a fixed-size ring
+buffer per endpoint and summarizes them over time windows: estimated
+request and failure rates, averages and p50/p95/p99 of response time and worker
+utilization. Samples are stored in ``array('d')`` columns, so a full day
+of samples for hundreds of endpoints stays compact and window summaries
+run over contiguous slices of floats.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Summary windows in seconds
+WINDOWS = {"5m": 300, "1h": 3600, "24h": 86400}
+
+# Recorded columns and the endpoint metrics field each one is read from
+_FIELDS = {
+    "requests": "totalRequests",
+    "failures": "failureCount",
+    "response_time": "averageResponseTime",
+    "utilization": "utilization",
+}
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Return the nearest-rank percentile ``q`` (0-100) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+def rolling_increase(values) -> float:
+    """Estimate the new events behind samples of a rolling-window total.
+    
+    ``totalRequests`` and ``failureCount`` count the last 24 hours, so they
+    drop as old requests age out. Each interval contributes its growth,
+    clipped at zero: an interval's arrivals minus what aged out of the
+    total. This never exceeds the true number of arrivals, and it
+    underestimates them while old traffic is aging out.
+    """
+    increase = 0.0
+    for previous, current in zip(values, values[1:]):
+        increase += max(current - previous, 0.0)
+    return increase
+
+class MetricRing:
+    """Fixed-size ring buffer of metric samples for one endpoint."""
+    
+    def __init__(self, capacity: int):
+        """Initialize the ring.
+        
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        self.capacity = capacity
+        self.count = 0
+        self._head = 0
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in _FIELDS}
+    
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        """Record one sample, overwriting the oldest when full."""
+        self.timestamps[self._head] = timestamp
+        for name, column in self.columns.items():
+            column[self._head] = float(values.get(name) or 0.0)
+        self._head = (self._head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def _ordered(self, column: array) -> array:
+        """Return a column's samples from oldest to newest."""
+        if self.count < self.capacity:
+            return column[:self.count]
+        return column[self._head:] + column[:self._head]
+    
+    def window(self, seconds: float, now: Optional[float] = None) -> Dict[str, array]:
+        """Return the samples of the last ``seconds`` as ordered columns."""
+        timestamps = self._ordered(self.timestamps)
+        cutoff = (now if now is not None else time.time()) - seconds
+        # Timestamps are ascending, so find the first sample in the window
+        lo, hi = 0, len(timestamps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[mid] < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        result = {"timestamps": timestamps[lo:]}
+        for name, column in self.columns.items():
+            result[name] = self._ordered(column)[lo:]
+        return result
+
+def summarize_window(samples: Dict[str, array]) -> Dict[str, Any]:
+    """Summarize the samples of one window.
+    
+    Returns:
+        Sample count, request and failure rates per second (estimated from
+        rolling totals, see ``rolling_increase``), and the average and
+        p50/p95/p99 of response time and utilization
+    """
+    timestamps = samples["timestamps"]
+    n = len(timestamps)
+    summary: Dict[str, Any] = {"samples": n}
+    span = timestamps[-1] - timestamps[0] if n > 1 else 0.0
+    summary["requestsPerSec"] = rolling_increase(samples["requests"]) / span if span else 0.0
+    summary["failuresPerSec"] = rolling_increase(samples["failures"]) / span if span else 0.0
+    for name in ("response_time", "utilization"):
+        values = sorted(samples[name])
+        summary[name] = {
+            "avg": sum(values) / n if n else 0.0,
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+    return summary
+
+class EndpointSampler:
+    """Samples serverless endpoint metrics in the background."""
+    
+    def __init__(
+        self,
+        client,
+        interval: float = 60.0,
+        retention: float = WINDOWS["24h"],
+        concurrency: int = 8,
+        clock: Callable[[], float] = time.time
+    ):
+        """Initialize the sampler.
+        
+        Args:
+            client: RunPodClient used to fetch endpoints and metrics
+            interval: Seconds between samples
+            retention: Seconds of samples kept per endpoint
+            concurrency: Maximum concurrent metrics requests per round
+            clock: Wall clock function
+        """
+        self.client = client
+        self.interval = interval
+        self.capacity = max(2, int(retention / interval) + 1)
+        self.concurrency = concurrency
+        self.rings: Dict[str, MetricRing] = {}
+        self.names: Dict[str, str] = {}
+        self.rounds = 0
+        self.errors = 0
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start sampling in the background."""
+        self._task = asyncio.ensure_future(self._run())
+        logger.info(f"Endpoint metrics sampler started (every {self.interval:g}s)")
+    
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sample()
+            except Exception as e:
+                logger.warning(f"Endpoint metrics sampling failed: {e}")
+            await asyncio.sleep(self.interval)
+    
+    async def sample(self) -> None:
+        """Record one sample of every endpoint's metrics.
+        
+        Fetches go without the client's stale snapshot fallback. During an
+        outage the round, or an endpoint's sample, is skipped, so old
+        metrics never enter the rings with a current timestamp.
+        """
+        endpoints = await self.client.get_endpoints() or []
+        ids = [str(endpoint.get("id")) for endpoint in endpoints if endpoint.get("id")]
+        for endpoint in endpoints:
+            if endpoint.get("id"):
+                self.names[str(endpoint["id"])] = endpoint.get("name") or ""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def fetch(endpoint_id: str):
+            async with semaphore:
+                return await self.client.get_endpoint_metrics(endpoint_id)
+        
+        results = await asyncio.gather(*(fetch(endpoint_id) for endpoint_id in ids), return_exceptions=True)
+        now = self._clock()
+        for endpoint_id, metrics in zip(ids, results):
+            if isinstance(metrics, Exception) or not metrics:
+                self.errors += 1
+                continue
+            self.record(endpoint_id, metrics, now)
+        
+        # Drop endpoints that no longer exist
+        for endpoint_id in set(self.rings) - set(ids):
+            del self.rings[endpoint_id]
+            self.names.pop(endpoint_id, None)
+        self.rounds += 1
+    
+    def record(self, endpoint_id: str, metrics: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        """Record a metrics response for an endpoint."""
+        ring = self.rings.get(endpoint_id)
+        if ring is None:
+            ring = self.rings[endpoint_id] = MetricRing(self.capacity)
+        values = {name: metrics.get(field) for name, field in _FIELDS.items()}
+        ring.append(timestamp if timestamp is not None else self._clock(), values)
+    
+    def summary(self, endpoint_id: str, window: str) -> Optional[Dict[str, Any]]:
+        """Summarize an endpoint's samples over a window ("5m", "1h" or "24h").
+        
+        Returns:
+            The window summary, or None if the endpoint has no samples
+        """
+        ring = self.rings.get(endpoint_id)
+        if ring is None or ring.count == 0:
+            return None
+        return summarize_window(ring.window(WINDOWS[window], self._clock()))
@@ -4,70 +4,458 @@ Main MCP server implementation for RunPod integration.
 
 import os
 import sys
+import asyncio
 import logging
 import argparse
+from collections import ChainMap
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Mapping, Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from .config import get_config, RunPodConfig
+from .config import config_store, RunPodConfig
 from .client import RunPodClient
-from .logging_config import configure_logging, get_logger
+from .mirror import FleetMirror
+from .changes import ChangeFeed, ResourceSubscriptions
+from .waiter import PodStatePoller
+from .sampler import EndpointSampler
+from .telemetry import Telemetry, client_collector, instrument_server
+from .tracing import Tracer
+from .reload import ConfigWatcher
+from .logging_config import configure_logging, get_logger, log_queue_samples
 from .resources import register_all_resources
+from .tools import register_all_tools
 
 logger = get_logger(__name__)
 
-# Create MCP server
-mcp = FastMCP("RunPod MCP")
+# Process-wide latency histograms and counters
+telemetry = Telemetry()
+telemetry.add_collector(log_queue_samples)
+
+# Process-wide request tracer, configured when the shared runtime starts
+tracer = Tracer()
+
+class SharedRuntime:
+    """RunPod client and background services shared by every session.
+    
+    Under the SSE and streamable HTTP transports the FastMCP lifespan runs
+    once per session. Sharing one client, fleet mirror and change feed
+    keeps request coalescing, rate limiting and mirror polling
+    process-wide, so upstream load does not grow with the number of
+    connected agents. The first session starts the runtime and the last
+    one to end stops it.
+    """
+    
+    def __init__(self, config: RunPodConfig):
+        """Create the client and services without starting them.
+        
+        Args:
+            config: Configuration for the client and services
+        """
+        self.client = RunPodClient(config, telemetry=telemetry)
+        self.mirror = None
+        self.feed = None
+        if config.mirror_enabled:
+            self.mirror = FleetMirror(self.client, interval=config.mirror_interval)
+            self.feed = ChangeFeed()
+            self.mirror.add_listener(self.feed.observe)
+        self.sampler = None
+        if config.metrics_sampler_enabled:
+            self.sampler = EndpointSampler(self.client, interval=config.metrics_sample_interval)
+        self.poller = PodStatePoller(self.client)
+        self.config_watcher: Optional[ConfigWatcher] = None
+        self.sessions = 0
+        self._collector = client_collector(self.client)
+        self.context: Dict[str, Any] = {
+            "runpod_client": self.client,
+            "config": config,
+            "fleet_mirror": self.mirror,
+            "change_feed": self.feed,
+            "pod_poller": self.poller,
+            "metrics_sampler": self.sampler,
+        }
+    
+    async def start(self) -> None:
+        """Start the background services."""
+        config = self.context["config"]
+        tracer.configure(config)
+        telemetry.add_collector(self._collector)
+        if config.metrics_port:
+            try:
+                telemetry.serve_http(config.metrics_host, config.metrics_port)
+            except OSError as e:
+                logger.error(f"Failed to start the metrics endpoint on port {config.metrics_port}: {e}")
+        config_store.add_listener(self.apply_config)
+        if self.mirror is not None:
+            await self.mirror.start()
+        if self.sampler is not None:
+            await self.sampler.start()
+        if config.config_reload_interval > 0:
+            self.config_watcher = ConfigWatcher(config_store, interval=config.config_reload_interval)
+            await self.config_watcher.start()
+    
+    async def apply_config(self, new_config: RunPodConfig) -> None:
+        """Apply a reloaded configuration to the shared client."""
+        await self.client.reconfigure(new_config)
+        self.context["config"] = new_config
+    
+    async def close(self) -> None:
+        """Stop the background services and close the client."""
+        # The metrics endpoint is stopped first and without awaiting, so
+        # that it is shut down even when the session's teardown is cancelled
+        telemetry.stop_http()
+        config_store.remove_listener(self.apply_config)
+        telemetry.remove_collector(self._collector)
+        if self.config_watcher is not None:
+            await self.config_watcher.stop()
+        await asyncio.to_thread(tracer.flush)
+        await self.poller.close()
+        if self.sampler is not None:
+            await self.sampler.stop()
+        if self.mirror is not None:
+            await self.mirror.stop()
+        await self.client.close()
+
+# Process-wide runtime, started by the first session and stopped by the last
+runtime: Optional[SharedRuntime] = None
 
 # Server context for maintaining a RunPod client instance
 @asynccontextmanager
-async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Mapping[str, Any]]:
     """Server lifespan context manager for initializing resources."""
+    global runtime
     try:
-        # Set up logging
-        configure_logging()
-        logger.info("Starting RunPod MCP server")
+        # Set up logging, unless main() already configured it
+        configure_logging(force=False)
+        logger.info("Starting RunPod MCP session")
+        
+        shared = runtime
+        if shared is None:
+            # Initialize RunPod client
+            try:
+                shared = SharedRuntime(config_store.get())
+                logger.info("RunPod client initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize RunPod client: {e}")
+                # We still yield an empty context to allow the server to start
+                # even if the RunPod client fails to initialize
+                yield {}
+                return
+            # Published before starting, so sessions arriving meanwhile share it
+            runtime = shared
+            shared.sessions += 1
+            await shared.start()
+        else:
+            shared.sessions += 1
+        
+        # Subscriptions are the only per-session state; they listen to the
+        # shared change feed until the session ends
+        subscriptions = None
+        if shared.feed is not None:
+            subscriptions = ResourceSubscriptions()
+            shared.feed.add_listener(subscriptions.notify)
         
-        # Initialize RunPod client
         try:
-            config = get_config()
-            client = RunPodClient(config)
-            logger.info("RunPod client initialized successfully")
-            yield {"runpod_client": client, "config": config}
-        except Exception as e:
-            logger.error(f"Failed to initialize RunPod client: {e}")
-            # We still yield an empty context to allow the server to start
-            # even if the RunPod client fails to initialize
-            yield {}
+            yield ChainMap({"subscriptions": subscriptions}, shared.context)
+        finally:
+            if subscriptions is not None:
+                shared.feed.remove_listener(subscriptions.notify)
+            shared.sessions -= 1
+            if shared.sessions == 0:
+                if runtime is shared:
+                    runtime = None
+                await shared.close()
     finally:
-        logger.info("Shutting down RunPod MCP server")
+        logger.info("Shutting down RunPod MCP session")
+
+# Create MCP server
+mcp = FastMCP("RunPod MCP", lifespan=server_lifespan)
+
+def get_run_context() -> Mapping[str, Any]:
+    """Return the lifespan context (RunPod client, config, ...) of the current request."""
+    try:
+        return mcp.get_context().request_context.lifespan_context or {}
+    except (LookupError, ValueError):
+        # Called outside of a request
+        return {}
 
-# Set the server lifespan
-mcp.lifespan = server_lifespan
+# Resource handlers look up the lifespan context through the server object
+mcp.get_run_context = get_run_context
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe_resource(uri) -> None:
+    """Record a client's subscription to updates of a resource."""
+    subscriptions = get_run_context().get("subscriptions")
+    if subscriptions is None:
+        raise ValueError("Resource subscriptions require the fleet mirror. Set RUNPOD_MIRROR=1 or pass --mirror to enable it.")
+    subscriptions.subscribe(str(uri), mcp._mcp_server.request_context.session)
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe_resource(uri) -> None:
+    """Remove a client's subscription to updates of a resource."""
+    subscriptions = get_run_context().get("subscriptions")
+    if subscriptions is not None:
+        subscriptions.unsubscribe(str(uri), mcp._mcp_server.request_context.session)
+
+_server_capabilities = mcp._mcp_server.get_capabilities
+
+def get_capabilities(*args, **kwargs):
+    """Return the server capabilities, advertising resource subscriptions.
+    
+    The low-level server always reports ``subscribe=False``. Subscriptions
+    are served from the change feed, so they are advertised only when the
+    fleet mirror is enabled.
+    """
+    capabilities = _server_capabilities(*args, **kwargs)
+    if capabilities.resources is not None:
+        try:
+            capabilities.resources.subscribe = config_store.get().mirror_enabled
+        except ValueError:
+            # No configuration yet; the runtime will have no mirror either
+            capabilities.resources.subscribe = False
+    return capabilities
+
+mcp._mcp_server.get_capabilities = get_capabilities
 
 # Register basic server status resources
 @mcp.resource("status://version")
 def get_version() -> str:
     """Return the version of the RunPod MCP server."""
-    from runpod_mcp import __version__
+    from . import __version__
     return f"RunPod MCP Server v{__version__}"
 
 @mcp.resource("status://config")
 def get_config_status() -> str:
     """Return the configuration status of the RunPod MCP server."""
     try:
-        config = get_config()
-        return (
+        config = config_store.get()
+        status = (
             f"RunPod MCP Server is configured with API URL: {config.api_url}\n"
             f"API Key: {'configured' if config.api_key else 'not configured'}"
         )
+        config_watcher = runtime.config_watcher if runtime is not None else None
+        if config_watcher is not None:
+            status += (
+                f"\nHot Reload: every {config_watcher.interval:g}s "
+                f"({config_store.reloads} reloads, {config_watcher.failures} failed)"
+            )
+        client = mcp.get_run_context().get("runpod_client")
+        if client is not None:
+            status += f"\nJSON Decoder: {client.decoder.name} ({client.decoder.fallbacks} fallbacks)"
+        return status
     except Exception as e:
         return f"RunPod MCP Server configuration error: {e}"
 
-# Register all RunPod-specific resources
+@mcp.resource("status://cache")
+def get_cache_status() -> str:
+    """Return hit/miss statistics for the RunPod client's catalog cache."""
+    try:
+        context = mcp.get_run_context()
+        client = context.get("runpod_client")
+        
+        if not client:
+            return "Error: RunPod client not available. Please check API key configuration."
+        
+        stats = client.cache.snapshot()
+        revalidation = client.validators.snapshot()
+        totals = stats["totals"]
+        lines = [
+            "# RunPod Client Cache",
+            f"- Entries: {stats['entries']}/{stats['maxEntries']}",
+            f"- Hits: {totals['hits']}",
+            f"- Stale Hits: {totals['stale_hits']}",
+            f"- Misses: {totals['misses']}",
+            f"- Background Refreshes: {totals['refreshes']} ({totals['refresh_errors']} failed)",
+            f"- Evictions: {totals['evictions']}",
+            "",
+            "## Conditional Revalidation",
+            f"- Tracked Responses: {revalidation['entries']}",
+            f"- Not Modified (304): {revalidation['notModified']}",
+            f"- Unchanged Bodies: {revalidation['unchanged']}",
+            f"- Changed Bodies: {revalidation['changed']}",
+        ]
+        
+        for key, key_stats in sorted(stats["keys"].items()):
+            age = key_stats["ageSeconds"]
+            lines.append("")
+            lines.append(f"## {key}")
+            lines.append(f"- Hits: {key_stats['hits']} (stale: {key_stats['stale_hits']})")
+            lines.append(f"- Misses: {key_stats['misses']}")
+            lines.append(f"- Age: {f'{age:.1f}s' if age is not None else 'not cached'}")
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching cache status: {e}")
+        return f"Error fetching cache status: {str(e)}"
+
+@mcp.resource("status://coalescing")
+def get_coalescing_status() -> str:
+    """Return how many identical in-flight API requests were coalesced."""
+    try:
+        context = mcp.get_run_context()
+        client = context.get("runpod_client")
+        
+        if not client:
+            return "Error: RunPod client not available. Please check API key configuration."
+        
+        stats = client.singleflight.snapshot()
+        lines = [
+            "# RunPod Request Coalescing",
+            f"- Upstream Calls: {stats['calls']}",
+            f"- Collapsed Calls: {stats['collapsed']}",
+            f"- In Flight: {stats['inflight']}",
+        ]
+        
+        if stats["collapsedByGroup"]:
+            lines.append("")
+            lines.append("## Collapsed by Route")
+            for route, count in sorted(stats["collapsedByGroup"].items(), key=lambda item: -item[1]):
+                lines.append(f"- {route}: {count}")
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching coalescing status: {e}")
+        return f"Error fetching coalescing status: {str(e)}"
+
+@mcp.resource("status://retries")
+def get_retry_status() -> str:
+    """Return per-route retry counters for RunPod API calls."""
+    try:
+        context = mcp.get_run_context()
+        client = context.get("runpod_client")
+        
+        if not client:
+            return "Error: RunPod client not available. Please check API key configuration."
+        
+        stats = client.retries.snapshot()
+        if not stats:
+            return "No RunPod API requests have been made yet."
+        
+        lines = ["# RunPod API Retries"]
+        for route, route_stats in sorted(stats.items()):
+            lines.append(
+                f"- {route}: {route_stats['requests']} requests, {route_stats['retries']} retries, "
+                f"{route_stats['recovered']} recovered, {route_stats['exhausted']} gave up"
+            )
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching retry status: {e}")
+        return f"Error fetching retry status: {str(e)}"
+
+@mcp.resource("status://ratelimit")
+def get_rate_limit_status() -> str:
+    """Return client-side rate limiter queueing statistics."""
+    try:
+        context = mcp.get_run_context()
+        client = context.get("runpod_client")
+        
+        if not client:
+            return "Error: RunPod client not available. Please check API key configuration."
+        
+        stats = client.rate_limiter.snapshot()
+        if not stats:
+            return "Client-side rate limiting is disabled."
+        
+        lines = ["# RunPod Client Rate Limiter"]
+        for name, bucket in stats.items():
+            lines.append(
+                f"- {name} ({bucket['rate']:g} req/s): {bucket['acquired']} requests, "
+                f"{bucket['delayed']} delayed, avg wait {bucket['avgWait'] * 1000:.1f}ms, "
+                f"max wait {bucket['maxWait'] * 1000:.1f}ms, {bucket['queued']} queued"
+            )
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching rate limit status: {e}")
+        return f"Error fetching rate limit status: {str(e)}"
+
+@mcp.resource("status://breakers")
+def get_breaker_status() -> str:
+    """Return the circuit breaker state for each RunPod API route group."""
+    try:
+        context = mcp.get_run_context()
+        client = context.get("runpod_client")
+        
+        if not client:
+            return "Error: RunPod client not available. Please check API key configuration."
+        
+        stats = client.breakers.snapshot()
+        if not stats:
+            return "No RunPod API requests have been made yet."
+        
+        lines = ["# RunPod API Circuit Breakers"]
+        for group, breaker in sorted(stats.items()):
+            lines.append(
+                f"- {group}: {breaker['state'].upper()} ({breaker['failures']} consecutive failures, "
+                f"opened {breaker['timesOpened']} times, {breaker['rejected']} calls rejected)"
+            )
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching circuit breaker status: {e}")
+        return f"Error fetching circuit breaker status: {str(e)}"
+
+@mcp.resource("status://mirror")
+def get_mirror_status() -> str:
+    """Return the freshness of the background fleet mirror."""
+    try:
+        context = mcp.get_run_context()
+        mirror = context.get("fleet_mirror")
+        
+        if not mirror:
+            return "The fleet mirror is disabled. Set RUNPOD_MIRROR=1 or pass --mirror to enable it."
+        
+        lines = [f"# Fleet Mirror (sync every {mirror.interval:g}s)"]
+        for name, stats in mirror.snapshot().items():
+            age = stats["ageSeconds"]
+            synced = f"synced {age:.1f}s ago" if age is not None else "never synced"
+            line = f"- {name}: {stats['items']} items, {synced}, {stats['syncs']} syncs"
+            if not stats["fresh"]:
+                line += " (stale, reading from the API)"
+            if stats["lastError"]:
+                line += f", last error: {stats['lastError']}"
+            lines.append(line)
+        
+        feed = context.get("change_feed")
+        subscriptions = context.get("subscriptions")
+        if feed and subscriptions is not None:
+            lines.extend([
+                "",
+                "## Change Feed",
+                f"- Latest cursor: {feed.cursor} ({len(feed.events)} changes retained)",
+                f"- Subscriptions: {subscriptions.count()} ({subscriptions.sent} notifications sent)",
+            ])
+        
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error fetching mirror status: {e}")
+        return f"Error fetching mirror status: {str(e)}"
+
+@mcp.resource("status://metrics")
+def get_metrics_status() -> str:
+    """Return latency histograms and counters for resources, tools and API calls."""
+    try:
+        return telemetry.render_markdown()
+    except Exception as e:
+        logger.error(f"Error fetching metrics: {e}")
+        return f"Error fetching metrics: {str(e)}"
+
+@mcp.resource("status://traces")
+def get_trace_status() -> str:
+    """Return the slowest recently traced requests as span trees."""
+    try:
+        return tracer.render_markdown()
+    except Exception as e:
+        logger.error(f"Error fetching traces: {e}")
+        return f"Error fetching traces: {str(e)}"
+
+# Register all RunPod-specific resources and tools
 register_all_resources(mcp)
+register_all_tools(mcp)
+
+# Time and trace every resource read and tool call
+instrument_server(mcp, telemetry, tracer)
 
 def parse_args():
     """Parse command-line arguments."""
@@ -90,11 +478,121 @@ def parse_args():
         "--log-file",
         help="Log file path (default: logs to stderr only)"
     )
+    parser.add_argument(
+        "--log-queue",
+        action="store_true",
+        help="Write logs from a background thread through a bounded queue"
+    )
+    parser.add_argument(
+        "--log-queue-size",
+        type=int,
+        default=10000,
+        help="Log records the queue holds before new records are dropped (default: 10000)"
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Write logs as JSON objects with request ids and durations"
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        help="Maximum number of pooled HTTP connections to the RunPod API (default: 20)"
+    )
+    parser.add_argument(
+        "--keepalive-expiry",
+        type=float,
+        help="Seconds an idle keep-alive connection is kept open (default: 30)"
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Enable HTTP/2 multiplexing (requires the 'h2' package)"
+    )
+    parser.add_argument(
+        "--json-decoder",
+        choices=["auto", "msgspec", "orjson", "stdlib"],
+        help="Library used to decode API responses (default: auto, the fastest installed)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="Maximum RunPod API requests per second across all routes, 0 to disable (default: 10)"
+    )
+    parser.add_argument(
+        "--rate-limit-burst",
+        type=int,
+        help="Number of requests allowed in a burst above the rate limit (default: 20)"
+    )
+    parser.add_argument(
+        "--read-rate-limit",
+        type=float,
+        help="Maximum requests per second for each read route, 0 to disable (default: 0)"
+    )
+    parser.add_argument(
+        "--mutation-rate-limit",
+        type=float,
+        help="Maximum requests per second for each mutating route, 0 to disable (default: 2)"
+    )
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="Keep a background mirror of pods, endpoints and volumes and serve reads from it"
+    )
+    parser.add_argument(
+        "--mirror-interval",
+        type=float,
+        help="Seconds between full syncs of the fleet mirror (default: 30)"
+    )
+    parser.add_argument(
+        "--metrics-sampler",
+        action="store_true",
+        help="Sample serverless endpoint metrics in the background for windowed statistics"
+    )
+    parser.add_argument(
+        "--metrics-sample-interval",
+        type=float,
+        help="Seconds between endpoint metrics samples (default: 60)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on this port (default: disabled)"
+    )
+    parser.add_argument(
+        "--trace-sample-rate",
+        type=float,
+        help="Fraction of requests to trace, 0 to disable (default: 0)"
+    )
+    parser.add_argument(
+        "--trace-file",
+        help="Append finished traces to this file as JSON lines"
+    )
+    parser.add_argument(
+        "--trace-otlp-endpoint",
+        help="Send finished traces to this OTLP/HTTP collector, e.g. http://localhost:4318"
+    )
+    parser.add_argument(
+        "--config-reload-interval",
+        type=float,
+        help="Reload the config file when it changes, checking every N seconds (default: disabled)"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse", "streamable-http"],
+        default="stdio",
+        help="MCP transport to serve (default: stdio)"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host to bind the sse and streamable-http transports to (default: 127.0.0.1)"
+    )
     parser.add_argument(
         "--port",
         type=int,
         default=8001,  # Using 8001 to avoid conflict with other services
-        help="Port to run the server on (default: 8001)"
+        help="Port for the sse and streamable-http transports (default: 8001)"
     )
     return parser.parse_args()
 
@@ -107,13 +605,55 @@ def main():
         os.environ["RUNPOD_API_KEY"] = args.api_key
     if args.api_url:
         os.environ["RUNPOD_API_URL"] = args.api_url
+    if args.max_connections:
+        os.environ["RUNPOD_MAX_CONNECTIONS"] = str(args.max_connections)
+    if args.keepalive_expiry is not None:
+        os.environ["RUNPOD_KEEPALIVE_EXPIRY"] = str(args.keepalive_expiry)
+    if args.http2:
+        os.environ["RUNPOD_HTTP2"] = "1"
+    if args.json_decoder:
+        os.environ["RUNPOD_JSON_DECODER"] = args.json_decoder
+    if args.rate_limit is not None:
+        os.environ["RUNPOD_RATE_LIMIT"] = str(args.rate_limit)
+    if args.rate_limit_burst is not None:
+        os.environ["RUNPOD_RATE_LIMIT_BURST"] = str(args.rate_limit_burst)
+    if args.read_rate_limit is not None:
+        os.environ["RUNPOD_READ_RATE_LIMIT"] = str(args.read_rate_limit)
+    if args.mutation_rate_limit is not None:
+        os.environ["RUNPOD_MUTATION_RATE_LIMIT"] = str(args.mutation_rate_limit)
+    if args.mirror:
+        os.environ["RUNPOD_MIRROR"] = "1"
+    if args.mirror_interval is not None:
+        os.environ["RUNPOD_MIRROR_INTERVAL"] = str(args.mirror_interval)
+    if args.metrics_sampler:
+        os.environ["RUNPOD_METRICS_SAMPLER"] = "1"
+    if args.metrics_sample_interval is not None:
+        os.environ["RUNPOD_METRICS_SAMPLE_INTERVAL"] = str(args.metrics_sample_interval)
+    if args.metrics_port is not None:
+        os.environ["RUNPOD_METRICS_PORT"] = str(args.metrics_port)
+    if args.trace_sample_rate is not None:
+        os.environ["RUNPOD_TRACE_SAMPLE_RATE"] = str(args.trace_sample_rate)
+    if args.trace_file:
+        os.environ["RUNPOD_TRACE_FILE"] = args.trace_file
+    if args.trace_otlp_endpoint:
+        os.environ["RUNPOD_TRACE_OTLP_ENDPOINT"] = args.trace_otlp_endpoint
+    if args.config_reload_interval is not None:
+        os.environ["RUNPOD_CONFIG_RELOAD_INTERVAL"] = str(args.config_reload_interval)
         
     # Configure logging
     log_level = getattr(logging, args.log_level.upper())
-    configure_logging(level=log_level, log_file=args.log_file)
+    configure_logging(
+        level=log_level,
+        log_file=args.log_file,
+        use_queue=args.log_queue or None,
+        json_format=args.log_json or None,
+        queue_size=args.log_queue_size
+    )
     
     # Run the server
-    mcp.run(port=args.port)
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    mcp.run(transport=args.transport)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Single-flight request coalescing for the RunPod API client.
+
+Concurrent callers asking for the same key share one in-flight call and
+its result instead of each issuing their own upstream request.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key.
+    
+    The shared call runs in its own task, so a caller that is cancelled
+    does not cancel the work other callers are waiting on.
+    """
+    
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.collapsed = 0
+        self.collapsed_by_group: Dict[str, int] = defaultdict(int)
+    
+    def __len__(self) -> int:
+        return len(self._inflight)
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], group: Optional[str] = None) -> Any:
+        """Run ``fn`` unless a call with the same key is already in flight.
+        
+        Args:
+            key: Identifies equivalent calls
+            fn: Coroutine function performing the call
+            group: Name under which collapsed calls are counted (default:
+                the key). Keys that embed IDs should be counted under a
+                fixed group, such as their route, so the counts stay bounded.
+        
+        Returns:
+            The result of the (possibly shared) call
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.collapsed += 1
+            self.collapsed_by_group[group if group is not None else str(key)] += 1
+            return await asyncio.shield(future)
+        
+        self.calls += 1
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        future.add_done_callback(lambda f: self._done(key, f))
+        return await asyncio.shield(future)
+    
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        """Forget a finished call and mark its exception as retrieved."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return coalescing counters for reporting."""
+        return {
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+            "inflight": len(self._inflight),
+            "collapsedByGroup": dict(self.collapsed_by_group),
+        }
@@ -0,0 +1,381 @@
+"""
+Latency histograms and counters for the RunPod MCP server.
+
+Every MCP resource read and tool call, and every HTTP request the
+RunPodClient sends, is recorded into fixed-bucket histograms keyed by a
+low-cardinality label set (resource URI template, tool name, API route and
+status). Recording is a bisect and two additions, so it stays off the
+profile of the hot path. Counters owned by other components (retries,
+cache hits, coalescing) are not duplicated: collectors read them only when
+metrics are rendered.
+
+Metrics are rendered as markdown for the ``status://metrics`` resource and
+in the Prometheus text exposition format for the optional HTTP endpoint.
+"""
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Label sets are stored as sorted tuples of (name, value) pairs
+Labels = Tuple[Tuple[str, str], ...]
+
+# A collected sample: (metric name, type, labels, value)
+Sample = Tuple[str, str, Dict[str, str], float]
+
+_HELP = {
+    "runpod_mcp_resource_seconds": "Time spent reading MCP resources",
+    "runpod_mcp_tool_seconds": "Time spent in MCP tool calls",
+    "runpod_api_request_seconds": "Time spent in RunPod API HTTP requests",
+    "runpod_api_response_bytes_total": "Bytes received from the RunPod API",
+    "runpod_api_ratelimit_wait_seconds_total": "Time RunPod API requests waited for the rate limiter",
+    "runpod_api_retries_total": "RunPod API requests retried after a transient failure",
+    "runpod_api_retries_exhausted_total": "RunPod API requests that failed after all retries",
+    "runpod_cache_requests_total": "Catalog cache lookups by result",
+    "runpod_coalesced_requests_total": "Identical in-flight API requests served by another call",
+    "runpod_not_modified_total": "Conditional API requests answered with 304 Not Modified",
+}
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+    
+    __slots__ = ("bounds", "counts", "sum", "count")
+    
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        # The last bucket counts values above the largest bound
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0-1) by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                if i == len(self.bounds):
+                    return lower
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in labels]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+class Telemetry:
+    """Registry of histograms, counters and collectors."""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize an empty registry.
+        
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.started_at = time.time()
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._http: Optional["ThreadingHTTPServer"] = None
+    
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a value into the histogram ``name`` with the given labels."""
+        key = (name, _labels(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+    
+    def inc(self, name: str, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` to the counter ``name`` with the given labels."""
+        key = (name, _labels(labels))
+        self.counters[key] = self.counters.get(key, 0.0) + amount
+    
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Register a function returning samples to include when rendering."""
+        self._collectors.append(collector)
+    
+    def remove_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Unregister a collector."""
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+    
+    def collect(self) -> List[Sample]:
+        """Return the counters and the samples of all collectors.
+        
+        Samples with the same name and labels, e.g. from the clients of
+        several sessions, are summed.
+        """
+        totals: Dict[Tuple[str, Labels], List[Any]] = {}
+        for (name, labels), value in list(self.counters.items()):
+            totals[(name, labels)] = ["counter", value]
+        for collector in list(self._collectors):
+            try:
+                for name, kind, labels, value in collector():
+                    entry = totals.setdefault((name, _labels(labels)), [kind, 0.0])
+                    entry[1] += value
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        return [(name, kind, dict(labels), value) for (name, labels), (kind, value) in totals.items()]
+    
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        families: Dict[str, List[Tuple[Labels, Histogram]]] = {}
+        for (name, labels), histogram in list(self.histograms.items()):
+            families.setdefault(name, []).append((labels, histogram))
+        for name in sorted(families):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(families[name], key=lambda item: item[0]):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        
+        samples: Dict[str, List[Sample]] = {}
+        for sample in self.collect():
+            samples.setdefault(sample[0], []).append(sample)
+        for name in sorted(samples):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} {samples[name][0][1]}")
+            for _, _, labels, value in sorted(samples[name], key=lambda sample: sorted(sample[2].items())):
+                lines.append(f"{name}{_format_labels(sorted(labels.items()))} {value:g}")
+        return "\n".join(lines) + "\n"
+    
+    def render_markdown(self) -> str:
+        """Render a human-readable summary for the status://metrics resource."""
+        lines = ["# RunPod MCP Metrics", f"- Collecting for: {time.time() - self.started_at:.0f}s"]
+        sections = [
+            ("MCP Resources", "runpod_mcp_resource_seconds", ("resource", "outcome")),
+            ("MCP Tools", "runpod_mcp_tool_seconds", ("tool", "outcome")),
+            ("RunPod API Requests", "runpod_api_request_seconds", ("method", "route", "status")),
+        ]
+        for title, name, columns in sections:
+            rows = [(dict(labels), h) for (n, labels), h in list(self.histograms.items()) if n == name]
+            if not rows:
+                continue
+            lines.extend(["", f"## {title}", ""])
+            header = [column.capitalize() for column in columns] + ["Count", "Avg", "p50", "p95", "p99"]
+            lines.append("| " + " | ".join(header) + " |")
+            lines.append("|" + "---|" * len(header))
+            for labels, histogram in sorted(rows, key=lambda row: -row[1].sum):
+                cells = [labels.get(column, "") for column in columns]
+                cells += [
+                    str(histogram.count),
+                    _format_seconds(histogram.sum / histogram.count),
+                    _format_seconds(histogram.quantile(0.5)),
+                    _format_seconds(histogram.quantile(0.95)),
+                    _format_seconds(histogram.quantile(0.99)),
+                ]
+                lines.append("| " + " | ".join(cells) + " |")
+        
+        samples = self.collect()
+        if samples:
+            lines.extend(["", "## Counters"])
+            for name, _, labels, value in sorted(samples, key=lambda sample: (sample[0], sorted(sample[2].items()))):
+                label_text = ", ".join(f"{key}={val}" for key, val in sorted(labels.items()))
+                lines.append(f"- {name}{f' ({label_text})' if label_text else ''}: {value:g}")
+        return "\n".join(lines)
+    
+    def serve_http(self, host: str = "127.0.0.1", port: int = 9464) -> "ThreadingHTTPServer":
+        """Serve ``/metrics`` in the Prometheus format from a background thread.
+        
+        Rendering runs on the HTTP thread, never on the event loop. Calling
+        this again while a server is running returns the running server.
+        """
+        if self._http is not None:
+            return self._http
+        # Imported here so that processes without the endpoint never load it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        telemetry = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = telemetry.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        
+        self._http = ThreadingHTTPServer((host, port), Handler)
+        self._http.daemon_threads = True
+        # A short poll interval keeps stop_http from blocking for long
+        threading.Thread(
+            target=self._http.serve_forever, kwargs={"poll_interval": 0.1}, name="metrics-http", daemon=True
+        ).start()
+        logger.info(f"Serving Prometheus metrics on http://{host}:{self._http.server_address[1]}/metrics")
+        return self._http
+    
+    def stop_http(self) -> None:
+        """Stop the Prometheus endpoint, if running.
+        
+        Blocks until the serving thread has noticed, which takes at most
+        its poll interval of 0.1s.
+        """
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+
+def client_collector(client) -> Callable[[], List[Sample]]:
+    """Return a collector reading the counters a RunPodClient already keeps."""
+    def collect() -> List[Sample]:
+        samples: List[Sample] = []
+        for key, stats in client.retries.snapshot().items():
+            method, _, route = key.partition(" ")
+            labels = {"method": method, "route": route}
+            samples.append(("runpod_api_retries_total", "counter", labels, stats["retries"]))
+            samples.append(("runpod_api_retries_exhausted_total", "counter", labels, stats["exhausted"]))
+        totals = client.cache.snapshot()["totals"]
+        for result in ("hits", "stale_hits", "misses"):
+            samples.append(("runpod_cache_requests_total", "counter", {"result": result}, totals[result]))
+        samples.append(("runpod_coalesced_requests_total", "counter", {}, client.singleflight.collapsed))
+        samples.append(("runpod_not_modified_total", "counter", {}, client.validators.not_modified))
+        return samples
+    return collect
+
+def _template_pattern(uri_template: str) -> "re.Pattern[str]":
+    parts = re.split(r"{\w+}", uri_template)
+    return re.compile("[^/]+".join(re.escape(part) for part in parts) + "$")
+
+def instrument_server(mcp, telemetry: Telemetry, tracer=None) -> None:
+    """Time every resource read and tool call served by a FastMCP server.
+    
+    Resource reads are labeled with their URI template, so reads of
+    different pods share one histogram. Calls of tools that are not
+    registered are labeled "unknown". With a tracer, each sampled read or
+    call also opens the root span of a trace.
+    """
+    import mcp.types as types
+    
+    from .logging_config import request_id_var
+    from .tracing import add_tail_span
+    
+    server = mcp._mcp_server
+    read_handler = server.request_handlers[types.ReadResourceRequest]
+    call_handler = server.request_handlers[types.CallToolRequest]
+    patterns: List[Tuple["re.Pattern[str]", str]] = []
+    labels: Dict[str, str] = {}
+    tool_names: Set[str] = set()
+    
+    async def resource_label(uri: str) -> str:
+        label = labels.get(uri)
+        if label is not None:
+            return label
+        if not patterns:
+            for resource in await mcp.list_resources():
+                patterns.append((re.compile(re.escape(str(resource.uri)) + "$"), str(resource.uri)))
+            for template in await mcp.list_resource_templates():
+                patterns.append((_template_pattern(template.uriTemplate), template.uriTemplate))
+        label = next((name for pattern, name in patterns if pattern.match(uri)), "unknown")
+        # Only keep static URIs; templated ones would grow without bound
+        if label == uri:
+            labels[uri] = label
+        return label
+    
+    async def tool_label(name: str) -> str:
+        if not tool_names:
+            tool_names.update(tool.name for tool in await mcp.list_tools())
+        # Names come from the client; unknown ones would grow without bound
+        return name if name in tool_names else "unknown"
+    
+    def set_request_id() -> None:
+        try:
+            request_id_var.set(str(server.request_context.request_id))
+        except LookupError:
+            pass
+    
+    async def read_resource(req):
+        set_request_id()
+        uri = str(req.params.uri)
+        label = await resource_label(uri)
+        start = time.perf_counter()
+        outcome = "exception"
+        trace = tracer.start_trace(f"resource {label}", uri=uri) if tracer is not None else nullcontext()
+        try:
+            with trace as root:
+                result = await read_handler(req)
+                contents = result.root.contents
+                text = getattr(contents[0], "text", "") if contents else ""
+                outcome = "error" if text.startswith("Error") else "ok"
+                if root is not None:
+                    add_tail_span("format")
+                    root.set(outcome=outcome)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            telemetry.observe("runpod_mcp_resource_seconds", seconds, resource=label, outcome=outcome)
+            logger.debug(
+                f"Read {uri} ({outcome}) in {seconds * 1000:.1f}ms",
+                extra={"uri": uri, "outcome": outcome, "duration_ms": round(seconds * 1000, 3)}
+            )
+    
+    async def call_tool(req):
+        set_request_id()
+        start = time.perf_counter()
+        outcome = "exception"
+        trace = tracer.start_trace(f"tool {req.params.name}") if tracer is not None else nullcontext()
+        try:
+            with trace as root:
+                result = await call_handler(req)
+                content = result.root.content
+                text = getattr(content[0], "text", "") if content else ""
+                outcome = "error" if result.root.isError or text.startswith("Error") else "ok"
+                if root is not None:
+                    add_tail_span("format")
+                    root.set(outcome=outcome)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            label = await tool_label(req.params.name)
+            telemetry.observe("runpod_mcp_tool_seconds", seconds, tool=label, outcome=outcome)
+            logger.debug(
+                f"Called {req.params.name} ({outcome}) in {seconds * 1000:.1f}ms",
+                extra={"tool": req.params.name, "outcome": outcome, "duration_ms": round(seconds * 1000, 3)}
+            )
+    
+    server.request_handlers[types.ReadResourceRequest] = read_resource
+    server.request_handlers[types.CallToolRequest] = call_tool
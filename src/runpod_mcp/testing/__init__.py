@@ -0,0 +1,8 @@
+"""
+Testing utilities for the RunPod MCP server.
+
+This package contains a local fake of the RunPod REST API for running
+the server, tests and benchmarks without a RunPod account.
+"""
+
+from .fake_api import FakeFleet, FakeRunPodAPI, FaultConfig, LatencyModel
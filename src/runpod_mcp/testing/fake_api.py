@@ -0,0 +1,448 @@
+"""
+Local fake RunPod REST API for offline testing and benchmarking.
+
+Serves the routes used by RunPodClient from a generated in-memory fleet,
+with configurable fleet size, latency distribution, error rate and 429
+injection. Point the server at it with RUNPOD_API_URL:
+
+    python -m src.runpod_mcp.testing.fake_api --port 8765 --pods 500 \\
+        --latency lognormal:40:0.5 --error-rate 0.01 --throttle-rate 0.02
+    RUNPOD_API_KEY=fake RUNPOD_API_URL=http://127.0.0.1:8765/v1 python -m src.runpod_mcp.server
+
+Only the standard library is used, so it runs anywhere the tests do.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+_GPU_TYPES = [
+    ("NVIDIA GeForce RTX 4090", 24, 0.69, 0.44),
+    ("NVIDIA GeForce RTX 3090", 24, 0.43, 0.22),
+    ("NVIDIA RTX A6000", 48, 0.76, 0.49),
+    ("NVIDIA A40", 48, 0.79, 0.39),
+    ("NVIDIA A100 80GB PCIe", 80, 1.64, 1.19),
+    ("NVIDIA H100 80GB HBM3", 80, 3.99, 2.69),
+]
+
+class LatencyModel:
+    """Response latency distribution parsed from a spec string.
+    
+    Specs: "0" (none), "<ms>" (fixed), "uniform:<lo_ms>:<hi_ms>" or
+    "lognormal:<median_ms>:<sigma>".
+    """
+    
+    def __init__(self, spec: str = "0", rng: Optional[random.Random] = None):
+        self.spec = spec
+        self._rng = rng or random.Random()
+        parts = str(spec).split(":")
+        self.kind = parts[0] if len(parts) > 1 else "fixed"
+        self.params = [float(p) for p in (parts[1:] if len(parts) > 1 else parts)]
+        if self.kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec!r}")
+    
+    def sample(self) -> float:
+        """Return one latency in seconds."""
+        if self.kind == "uniform":
+            return self._rng.uniform(self.params[0], self.params[1]) / 1000
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return median * self._rng.lognormvariate(0.0, sigma) / 1000
+        return self.params[0] / 1000
+
+@dataclass
+class FaultConfig:
+    """Injected faults: random 5xx errors, 429s and an optional request rate cap."""
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    max_rps: float = 0.0
+    retry_after: float = 1.0
+
+def _rolling_requests(rate: float, now: float, window: float, period: float = 5000.0) -> float:
+    """Requests in ``(now - window, now]`` at ``rate * (1 + 0.5 * sin(2*pi*t / period))`` per second."""
+    def arrivals(t: float) -> float:
+        return rate * (t - 0.5 * period / (2 * math.pi) * math.cos(2 * math.pi * t / period))
+    return arrivals(now) - arrivals(now - window)
+
+class FakeFleet:
+    """Generated, mutable RunPod account state."""
+    
+    def __init__(
+        self,
+        pods: int = 50,
+        endpoints: int = 10,
+        volumes: int = 10,
+        templates: int = 20,
+        seed: int = 0,
+        boot_seconds: float = 5.0
+    ):
+        """Generate a fleet.
+        
+        Args:
+            pods: Number of pods
+            endpoints: Number of serverless endpoints
+            volumes: Number of network volumes
+            templates: Number of pod templates
+            seed: Random seed, so fleets are reproducible
+            boot_seconds: Seconds a started pod stays without a runtime
+        """
+        rng = random.Random(seed)
+        self.boot_seconds = boot_seconds
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.gpus = [
+            {
+                "id": name, "displayName": name, "memoryInGb": memory,
+                "securePrice": secure, "communityPrice": community,
+                "secureCloud": True, "communityCloud": True,
+                "lowestPrice": {"minimumBidPrice": community, "uninterruptablePrice": secure},
+            }
+            for name, memory, secure, community in _GPU_TYPES
+        ]
+        self.pods: Dict[str, Dict[str, Any]] = {}
+        for i in range(pods):
+            gpu = rng.choice(_GPU_TYPES)
+            running = rng.random() < 0.7
+            pod = {
+                "id": f"pod{i:05d}", "name": f"{rng.choice(['train', 'infer', 'dev'])}-{i}",
+                "gpuDisplayName": gpu[0], "gpuTypeId": gpu[0], "gpuCount": rng.choice([1, 1, 2, 4]),
+                "desiredStatus": "RUNNING" if running else "EXITED",
+                "machineId": f"m{rng.randrange(10000)}", "costPerHr": gpu[2],
+                "container": {"image": "runpod/pytorch:2.1.0", "diskInGb": 50, "memoryInGb": 62},
+                "ports": [{"name": "http", "ip": "10.0.0.1", "publicPort": 8888}],
+                "volumeMounts": [], "env": [],
+                "runtime": {"uptimeInSeconds": rng.randrange(86400), "costPerHr": gpu[2]} if running else None,
+            }
+            self.pods[pod["id"]] = pod
+        self.templates = [
+            {
+                "id": f"tpl{i:04d}", "name": f"Template {i}", "description": "Generated template",
+                "container": {"image": f"runpod/image-{i}:latest"}, "env": [], "ports": [], "volumeMounts": [],
+            }
+            for i in range(templates)
+        ]
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        for i in range(endpoints):
+            endpoint = {
+                "id": f"ep{i:04d}", "name": f"endpoint-{i}", "status": "READY",
+                "workersRunning": rng.randrange(4), "workersMax": 4,
+                "gpuIds": [rng.choice(_GPU_TYPES)[0]], "costPerHour": round(rng.uniform(0.2, 3.0), 2),
+                "template": {"container": {"image": "runpod/worker:latest"}, "env": []},
+            }
+            self.endpoints[endpoint["id"]] = endpoint
+        self.volumes: Dict[str, Dict[str, Any]] = {
+            f"vol{i:04d}": {
+                "id": f"vol{i:04d}", "name": f"volume-{i}", "sizeGB": rng.choice([50, 100, 500]),
+                "status": "READY", "storageType": "Network Storage", "costPerHr": 0.01,
+                "region": "US-OR-1", "createdAt": "2024-01-01T00:00:00Z", "pods": [], "endpoints": [],
+            }
+            for i in range(volumes)
+        }
+        self._boots: Dict[str, float] = {}
+        self._next_pod = pods
+    
+    def list_pods(self) -> List[Dict[str, Any]]:
+        """Return all pods, giving booted pods their runtime."""
+        now = time.time()
+        for pod_id, started in list(self._boots.items()):
+            if now - started >= self.boot_seconds and pod_id in self.pods:
+                self.pods[pod_id]["runtime"] = {"uptimeInSeconds": 0, "costPerHr": self.pods[pod_id]["costPerHr"]}
+                del self._boots[pod_id]
+        return list(self.pods.values())
+    
+    def create_pod(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a pod from a create request."""
+        pod_id = f"pod{self._next_pod:05d}"
+        self._next_pod += 1
+        gpu = config.get("gpuTypeId") or _GPU_TYPES[0][0]
+        pod = {
+            "id": pod_id, "name": config.get("name") or pod_id, "gpuDisplayName": gpu, "gpuTypeId": gpu,
+            "gpuCount": config.get("gpuCount", 1), "desiredStatus": "RUNNING", "costPerHr": 0.69,
+            "container": {"image": config.get("imageName", "runpod/pytorch:2.1.0")},
+            "ports": [], "volumeMounts": [], "env": [], "runtime": None,
+        }
+        self.pods[pod_id] = pod
+        self._boots[pod_id] = time.time()
+        return pod
+    
+    def set_pod_state(self, pod_id: str, action: str) -> Optional[Dict[str, Any]]:
+        """Apply start/stop/terminate to a pod."""
+        pod = self.pods.get(pod_id)
+        if pod is None:
+            return None
+        if action == "start":
+            pod["desiredStatus"] = "RUNNING"
+            pod["runtime"] = None
+            self._boots[pod_id] = time.time()
+        elif action == "stop":
+            pod["desiredStatus"] = "EXITED"
+            pod["runtime"] = None
+        elif action == "terminate":
+            del self.pods[pod_id]
+            self._boots.pop(pod_id, None)
+            return {"id": pod_id, "desiredStatus": "TERMINATED"}
+        return pod
+    
+    def endpoint_metrics(self, endpoint_id: str) -> Optional[Dict[str, Any]]:
+        """Return metrics with request counts over the last 24 hours.
+        
+        Traffic follows a cycle of a little under an hour and a half, so
+        the rolling totals rise and fall like those of a real endpoint.
+        """
+        endpoint = self.endpoints.get(endpoint_id)
+        if endpoint is None:
+            return None
+        elapsed = time.time() - self.started_at
+        seed = int(hashlib.md5(endpoint_id.encode()).hexdigest()[:6], 16)
+        rng = random.Random(seed + int(elapsed))
+        rate = 1 + seed % 20
+        total = int(_rolling_requests(rate, seed % 5000 + elapsed, 86400.0))
+        return {
+            "name": endpoint["name"], "totalRequests": total,
+            "successCount": int(total * 0.98), "failureCount": total - int(total * 0.98),
+            "averageResponseTime": rng.lognormvariate(0.0, 0.4), "utilization": rng.random(),
+            "creditSpent": total * 0.0001,
+        }
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY keep-alive
+    # responses wait on delayed ACKs and every request takes ~40ms
+    disable_nagle_algorithm = True
+    server: "_FakeHTTPServer"
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_GET(self):
+        self._dispatch("GET")
+    
+    def do_POST(self):
+        self._dispatch("POST")
+    
+    def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = b"" if status == 304 else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _dispatch(self, method: str) -> None:
+        api = self.server.api
+        url = urlsplit(self.path)
+        path = re.sub(r"^/v1", "", url.path).rstrip("/") or "/"
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"null") if length else None
+        
+        api.record(method, path)
+        time.sleep(api.latency.sample())
+        
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._send(401, {"error": "missing API key"})
+        fault = api.inject_fault()
+        if fault is not None:
+            return self._send(*fault)
+        
+        with api.fleet.lock:
+            status, body = api.route(method, path, payload)
+        if status != 200 or method != "GET":
+            return self._send(status, body)
+        
+        if isinstance(body, list):
+            query = parse_qs(url.query)
+            if "limit" in query:
+                offset = int(query.get("offset", ["0"])[0])
+                body = body[offset:offset + int(query["limit"][0])]
+        data = json.dumps(body).encode()
+        etag = '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, None, {"ETag": etag})
+        self._send(200, body, {"ETag": etag})
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    api: "FakeRunPodAPI"
+
+class FakeRunPodAPI:
+    """Threaded HTTP server answering like the RunPod REST API."""
+    
+    def __init__(
+        self,
+        fleet: Optional[FakeFleet] = None,
+        latency: str = "0",
+        faults: Optional[FaultConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0
+    ):
+        """Initialize the fake API.
+        
+        Args:
+            fleet: Account state to serve (default: a generated 50-pod fleet)
+            latency: Latency distribution spec, see LatencyModel
+            faults: Error and throttling injection settings
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            seed: Random seed for latency and fault injection
+        """
+        self.fleet = fleet or FakeFleet()
+        self._rng = random.Random(seed)
+        self.latency = LatencyModel(latency, self._rng)
+        self.faults = faults or FaultConfig()
+        self.requests: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._httpd = _FakeHTTPServer((host, port), _Handler)
+        self._httpd.api = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL to use as RUNPOD_API_URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+    
+    def start(self) -> "FakeRunPodAPI":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-runpod-api", daemon=True
+        )
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+    
+    def __enter__(self) -> "FakeRunPodAPI":
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def record(self, method: str, path: str) -> None:
+        """Count a request under its route template."""
+        route = re.sub(r"/(pod|ep|vol|tpl)\d+", r"/{id}", path)
+        with self._stats_lock:
+            self.requests[f"{method} {route}"] += 1
+    
+    def total_requests(self) -> int:
+        """Return the number of requests served so far."""
+        with self._stats_lock:
+            return sum(self.requests.values())
+    
+    def inject_fault(self) -> Optional[Tuple[int, Any, Dict[str, str]]]:
+        """Decide whether to fail this request, returning (status, body, headers)."""
+        faults = self.faults
+        retry_after = {"Retry-After": f"{faults.retry_after:g}"}
+        with self._stats_lock:
+            if faults.max_rps > 0:
+                now = time.monotonic()
+                if now - self._window_start >= 1.0:
+                    self._window_start, self._window_count = now, 0
+                self._window_count += 1
+                if self._window_count > faults.max_rps:
+                    return 429, {"error": "rate limit exceeded"}, retry_after
+            roll = self._rng.random()
+        if roll < faults.throttle_rate:
+            return 429, {"error": "rate limit exceeded"}, retry_after
+        if roll < faults.throttle_rate + faults.error_rate:
+            return 503, {"error": "service unavailable"}, {}
+        return None
+    
+    def route(self, method: str, path: str, payload: Any) -> Tuple[int, Any]:
+        """Answer a request from the fleet state."""
+        fleet = self.fleet
+        parts = path.strip("/").split("/")
+        not_found = (404, {"error": f"{path} not found"})
+        
+        if method == "GET":
+            if path == "/gpus":
+                return 200, fleet.gpus
+            if path == "/pods":
+                return 200, fleet.list_pods()
+            if path == "/templates":
+                return 200, fleet.templates
+            if path == "/serverless/templates":
+                return 200, fleet.templates[: max(1, len(fleet.templates) // 2)]
+            if path == "/endpoints":
+                return 200, list(fleet.endpoints.values())
+            if path == "/network-volumes":
+                return 200, list(fleet.volumes.values())
+            if path == "/me":
+                return 200, {"id": "user-fake", "email": "fake@example.com", "credits": 125.5, "spendLimit": 500}
+            if len(parts) == 2 and parts[0] == "pods":
+                fleet.list_pods()
+                pod = fleet.pods.get(parts[1])
+                return (200, pod) if pod else not_found
+            if len(parts) == 2 and parts[0] == "endpoints":
+                endpoint = fleet.endpoints.get(parts[1])
+                return (200, endpoint) if endpoint else not_found
+            if len(parts) == 3 and parts[0] == "endpoints" and parts[2] == "metrics":
+                metrics = fleet.endpoint_metrics(parts[1])
+                return (200, metrics) if metrics else not_found
+            if len(parts) == 2 and parts[0] == "network-volumes":
+                volume = fleet.volumes.get(parts[1])
+                return (200, volume) if volume else not_found
+        elif method == "POST":
+            if path == "/pods":
+                return 200, fleet.create_pod(payload or {})
+            if len(parts) == 3 and parts[0] == "pods" and parts[2] in ("start", "stop", "terminate"):
+                pod = fleet.set_pod_state(parts[1], parts[2])
+                return (200, pod) if pod else not_found
+        return not_found
+
+def main():
+    """Run the fake API from the command line."""
+    parser = argparse.ArgumentParser(description="Fake RunPod API for offline testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--pods", type=int, default=50, help="Number of pods (default: 50)")
+    parser.add_argument("--endpoints", type=int, default=10, help="Number of serverless endpoints (default: 10)")
+    parser.add_argument("--volumes", type=int, default=10, help="Number of network volumes (default: 10)")
+    parser.add_argument("--templates", type=int, default=20, help="Number of pod templates (default: 20)")
+    parser.add_argument(
+        "--latency", default="0",
+        help="Latency: <ms>, uniform:<lo_ms>:<hi_ms> or lognormal:<median_ms>:<sigma> (default: 0)"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="Answer 429 above this many requests/second")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+    
+    fleet = FakeFleet(args.pods, args.endpoints, args.volumes, args.templates, seed=args.seed)
+    faults = FaultConfig(args.error_rate, args.throttle_rate, args.max_rps)
+    api = FakeRunPodAPI(fleet, args.latency, faults, args.host, args.port, args.seed)
+    print(f"Fake RunPod API listening; set RUNPOD_API_URL={api.url}", flush=True)
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+Tools module for the RunPod MCP server.
+
+This module contains implementations of MCP tools that act on RunPod
+entities, such as starting, stopping and terminating pods.
+"""
+
+from .pods import register_pod_tools
+
+def register_all_tools(mcp_server):
+    """Register all RunPod MCP tools with the MCP server."""
+    register_pod_tools(mcp_server)
@@ -0,0 +1,212 @@
+"""
+Pod lifecycle tools for the RunPod MCP server.
+
+This module provides tools for starting, stopping and terminating many
+pods at once, selected by ID or by name prefix, GPU type and status, and
+for waiting until pods reach a state.
+"""
+
+import time
+from typing import List, Optional
+
+from ..bulk import concurrency_limit, format_results, run_bulk, select_pods
+from ..logging_config import get_logger
+from ..resources.formatting import read_collection
+
+logger = get_logger(__name__)
+
+def register_pod_tools(mcp_server):
+    """Register pod lifecycle tools with the MCP server."""
+    
+    async def bulk_action(
+        verb: str,
+        action_name: str,
+        pod_ids: Optional[List[str]],
+        name_prefix: Optional[str],
+        gpu_type: Optional[str],
+        status: Optional[str],
+        concurrency: Optional[int],
+        dry_run: bool,
+        live: bool = False
+    ) -> str:
+        """Select pods and run ``action_name`` on them.
+        
+        With ``live``, selectors are matched against a fresh pod listing
+        rather than the fleet mirror or a stale snapshot, so that a
+        destructive action never hits pods that no longer match.
+        """
+        try:
+            context = mcp_server.get_run_context()
+            client = context.get("runpod_client")
+            
+            if not client:
+                return "Error: RunPod client not available. Please check API key configuration."
+            
+            if not (pod_ids or name_prefix or gpu_type or status):
+                return "Error: pass pod_ids or at least one selector (name_prefix, gpu_type, status)."
+            
+            limit = concurrency_limit(concurrency, client.config.bulk_concurrency)
+            
+            pods = []
+            if live and (name_prefix or gpu_type or status):
+                pods = await client.get_pods()
+            elif name_prefix or gpu_type or status or context.get("fleet_mirror"):
+                pods, _ = await read_collection(context, "pods", client.get_pods)
+            selected = select_pods(pods or [], pod_ids, name_prefix, gpu_type, status)
+            
+            if not selected:
+                return "No pods match the given IDs and selectors."
+            
+            if dry_run:
+                lines = [f"# Dry run: would {verb} {len(selected)} pods", ""]
+                lines.extend(f"- {pod.get('id')} {pod.get('name') or ''}".rstrip() for pod in selected)
+                return "\n".join(lines)
+            
+            logger.info(f"Bulk {verb} of {len(selected)} pods (concurrency {limit})")
+            start = time.monotonic()
+            results = await run_bulk(getattr(client, action_name), selected, limit)
+            elapsed = time.monotonic() - start
+            
+            mirror = context.get("fleet_mirror")
+            if mirror:
+                mirror.request_sync()
+            
+            return format_results(verb, results, elapsed)
+        except Exception as e:
+            logger.error(f"Error during bulk {verb}: {e}")
+            return f"Error during bulk {verb}: {str(e)}"
+    
+    @mcp_server.tool()
+    async def start_pods(
+        pod_ids: Optional[List[str]] = None,
+        name_prefix: Optional[str] = None,
+        gpu_type: Optional[str] = None,
+        status: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        dry_run: bool = False
+    ) -> str:
+        """
+        Start many pods at once.
+        
+        Select pods by ID and/or by selectors; all given criteria must match.
+        
+        Parameters:
+        - pod_ids: IDs of the pods to start
+        - name_prefix: Start pods whose name starts with this prefix
+        - gpu_type: Start pods on this GPU type (e.g. "RTX 4090")
+        - status: Start pods with this status (e.g. EXITED)
+        - concurrency: Maximum concurrent API calls (default and upper limit: 8)
+        - dry_run: Only list the pods that would be started
+        
+        Returns a per-pod result table with timings and any failures.
+        """
+        return await bulk_action("start", "start_pod", pod_ids, name_prefix, gpu_type, status, concurrency, dry_run)
+    
+    @mcp_server.tool()
+    async def stop_pods(
+        pod_ids: Optional[List[str]] = None,
+        name_prefix: Optional[str] = None,
+        gpu_type: Optional[str] = None,
+        status: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        dry_run: bool = False
+    ) -> str:
+        """
+        Stop many pods at once.
+        
+        Select pods by ID and/or by selectors; all given criteria must match.
+        
+        Parameters:
+        - pod_ids: IDs of the pods to stop
+        - name_prefix: Stop pods whose name starts with this prefix
+        - gpu_type: Stop pods on this GPU type (e.g. "A100 80GB")
+        - status: Stop pods with this status (e.g. RUNNING)
+        - concurrency: Maximum concurrent API calls (default and upper limit: 8)
+        - dry_run: Only list the pods that would be stopped
+        
+        Returns a per-pod result table with timings and any failures.
+        """
+        return await bulk_action(
+            "stop", "stop_pod", pod_ids, name_prefix, gpu_type, status, concurrency, dry_run, live=True
+        )
+    
+    @mcp_server.tool()
+    async def terminate_pods(
+        pod_ids: Optional[List[str]] = None,
+        name_prefix: Optional[str] = None,
+        gpu_type: Optional[str] = None,
+        status: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        dry_run: bool = False
+    ) -> str:
+        """
+        Terminate many pods at once. Terminated pods and their container
+        disks are deleted permanently; use dry_run first to check the selection.
+        
+        Select pods by ID and/or by selectors; all given criteria must match.
+        
+        Parameters:
+        - pod_ids: IDs of the pods to terminate
+        - name_prefix: Terminate pods whose name starts with this prefix
+        - gpu_type: Terminate pods on this GPU type
+        - status: Terminate pods with this status (e.g. EXITED)
+        - concurrency: Maximum concurrent API calls (default and upper limit: 8)
+        - dry_run: Only list the pods that would be terminated
+        
+        Returns a per-pod result table with timings and any failures.
+        """
+        return await bulk_action(
+            "terminate", "terminate_pod", pod_ids, name_prefix, gpu_type, status, concurrency, dry_run, live=True
+        )
+    
+    @mcp_server.tool()
+    async def wait_for_pod_state(
+        pod_ids: List[str],
+        state: str = "RUNNING",
+        timeout: float = 300
+    ) -> str:
+        """
+        Wait until one or more pods reach a state, e.g. RUNNING after
+        starting them. Use this instead of re-reading pods://details.
+        
+        Parameters:
+        - pod_ids: IDs of the pods to wait for
+        - state: Target state: RUNNING, EXITED or TERMINATED (default: RUNNING)
+        - timeout: Seconds to wait at most (default: 300)
+        
+        A pod counts as RUNNING once its container is up, not merely when it
+        has been asked to start. Returns the state of each pod and how long
+        it took to reach the target.
+        """
+        try:
+            context = mcp_server.get_run_context()
+            poller = context.get("pod_poller")
+            
+            if not poller:
+                return "Error: RunPod client not available. Please check API key configuration."
+            
+            if not pod_ids:
+                return "Error: pass at least one pod ID."
+            
+            result = await poller.wait(pod_ids, state, timeout)
+            
+            target = state.upper()
+            reached = len(result.reached)
+            if result.timed_out:
+                header = f"# Timed out after {result.elapsed:.0f}s: {reached}/{len(pod_ids)} pods reached {target}"
+            else:
+                header = f"# All {len(pod_ids)} pods reached {target} in {result.elapsed:.1f}s"
+            
+            lines = [header, "", "| Pod ID | State | Reached after |", "|---|---|---|"]
+            for pod_id in pod_ids:
+                pod_id = str(pod_id)
+                after = result.reached.get(pod_id)
+                lines.append(
+                    f"| {pod_id} | {result.states.get(pod_id, 'UNKNOWN')} | "
+                    f"{f'{after:.1f}s' if after is not None else '-'} |"
+                )
+            
+            return "\n".join(lines)
+        except Exception as e:
+            logger.error(f"Error waiting for pods {pod_ids}: {e}")
+            return f"Error waiting for pod state: {str(e)}"
@@ -0,0 +1,355 @@
+"""
+Lightweight request tracing for the RunPod MCP server.
+
+Every sampled MCP resource read or tool call opens a root span. RunPod API
+calls, HTTP attempts and cache lookups made while serving it open child
+spans, and the time between the last child span and the end of the
+request is recorded as a ``format`` span. The current span lives in a
+context variable, so it follows the request into tasks it creates and
+into threads started with ``asyncio.to_thread``. Unsampled requests
+cost one context variable lookup per instrumented call.
+
+Finished traces are kept in memory for the ``status://traces`` resource
+and can be exported as JSON lines to a file or as OTLP/HTTP JSON to a
+collector. Exports run on a background thread with a bounded queue, so
+the event loop never blocks on them.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class Trace:
+    """Spans of one traced request."""
+    
+    __slots__ = ("trace_id", "spans", "finished")
+    
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.finished = False
+    
+    @property
+    def root(self) -> "Span":
+        return self.spans[0]
+
+class Span:
+    """A timed operation within a trace."""
+    
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "error")
+    
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+    
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+    
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (so far, if the span is still open)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the span as a JSON-serializable dictionary."""
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+# Span of the operation currently running in this context
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("runpod_trace_span", default=None)
+
+class _NullSpan:
+    """Context manager used when the current request is not traced."""
+    
+    def __enter__(self) -> None:
+        return None
+    
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+_NULL_SPAN = _NullSpan()
+
+class _ActiveSpan:
+    """Context manager making a span current while it runs."""
+    
+    __slots__ = ("span", "on_finish", "_token")
+    
+    def __init__(self, span: Span, on_finish: Optional[Callable[[Trace], None]] = None):
+        self.span = span
+        self.on_finish = on_finish
+    
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        return self.span
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.span.end_ns = time.time_ns()
+        if exc is not None:
+            self.span.error = f"{type(exc).__name__}: {exc}"
+        _current_span.reset(self._token)
+        if self.on_finish is not None:
+            self.span.trace.finished = True
+            self.on_finish(self.span.trace)
+
+def current_span() -> Optional[Span]:
+    """Return the current span, or None if the request is not traced."""
+    return _current_span.get()
+
+def span(name: str, **attributes: Any):
+    """Open a child span of the current span.
+    
+    Returns a context manager yielding the span, or None when the current
+    request is not traced.
+    """
+    parent = _current_span.get()
+    if parent is None or parent.trace.finished:
+        return _NULL_SPAN
+    child = Span(parent.trace, name, parent.span_id, attributes)
+    parent.trace.spans.append(child)
+    return _ActiveSpan(child)
+
+def add_tail_span(name: str) -> None:
+    """Record the time since the current span's last child ended as a span.
+    
+    Resource handlers fetch first and format afterwards, so the tail of a
+    request is its formatting step.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return
+    children = [s for s in parent.trace.spans if s.parent_id == parent.span_id and s.end_ns is not None]
+    if not children:
+        return
+    tail = Span(parent.trace, name, parent.span_id, {})
+    tail.start_ns = max(s.end_ns for s in children)
+    tail.end_ns = time.time_ns()
+    parent.trace.spans.append(tail)
+
+class BatchExporter:
+    """Exports finished traces from a background thread.
+    
+    Subclasses implement ``export``. Traces submitted while the queue is
+    full are dropped and counted.
+    """
+    
+    def __init__(self, max_queue: int = 1000, interval: float = 1.0):
+        self.interval = interval
+        self.dropped = 0
+        self.exported = 0
+        self.failures = 0
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name=f"{type(self).__name__}", daemon=True)
+        self._thread.start()
+    
+    def submit(self, trace: Trace) -> None:
+        """Queue a finished trace for export."""
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+    
+    def export(self, traces: List[Trace]) -> None:
+        raise NotImplementedError
+    
+    def _run(self) -> None:
+        while True:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.interval)
+                batch.append(item)
+                while len(batch) < 256:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            traces = [trace for trace in batch if trace is not None]
+            if traces:
+                try:
+                    self.export(traces)
+                    self.exported += len(traces)
+                except Exception as e:
+                    self.failures += 1
+                    logger.warning(f"{type(self).__name__} failed to export {len(traces)} traces: {e}")
+            for _ in batch:
+                self._queue.task_done()
+    
+    def flush(self) -> None:
+        """Block until every queued trace has been exported."""
+        self._queue.join()
+
+class JsonFileExporter(BatchExporter):
+    """Appends each finished trace to a file as one line of JSON."""
+    
+    def __init__(self, path: str, **kwargs: Any):
+        self.path = path
+        super().__init__(**kwargs)
+    
+    def export(self, traces: List[Trace]) -> None:
+        with open(self.path, "a") as f:
+            for trace in traces:
+                f.write(json.dumps({"traceId": trace.trace_id, "spans": [s.as_dict() for s in trace.spans]}) + "\n")
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+def otlp_payload(traces: List[Trace], service_name: str = "runpod-mcp") -> Dict[str, Any]:
+    """Build an OTLP/HTTP JSON ExportTraceServiceRequest."""
+    spans = []
+    for trace in traces:
+        for s in trace.spans:
+            entry = {
+                "traceId": trace.trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                # SPAN_KIND_SERVER for roots, SPAN_KIND_INTERNAL otherwise
+                "kind": 2 if s.parent_id is None else 1,
+                "startTimeUnixNano": str(s.start_ns),
+                "endTimeUnixNano": str(s.end_ns or s.start_ns),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in s.attributes.items()],
+                # STATUS_CODE_ERROR or STATUS_CODE_UNSET
+                "status": {"code": 2, "message": s.error} if s.error else {"code": 0},
+            }
+            if s.parent_id:
+                entry["parentSpanId"] = s.parent_id
+            spans.append(entry)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "runpod_mcp"}, "spans": spans}],
+        }]
+    }
+
+class OtlpHttpExporter(BatchExporter):
+    """Sends finished traces to an OTLP/HTTP collector as JSON."""
+    
+    def __init__(self, endpoint: str, **kwargs: Any):
+        import httpx
+        
+        self.endpoint = endpoint if endpoint.rstrip("/").endswith("/v1/traces") else endpoint.rstrip("/") + "/v1/traces"
+        self._http = httpx.Client(timeout=10.0)
+        super().__init__(**kwargs)
+    
+    def export(self, traces: List[Trace]) -> None:
+        self._http.post(self.endpoint, json=otlp_payload(traces)).raise_for_status()
+
+class Tracer:
+    """Samples requests into traces and hands finished traces to exporters."""
+    
+    def __init__(self, sample_rate: float = 0.0, keep: int = 20, rng: Optional[random.Random] = None):
+        """Initialize the tracer.
+        
+        Args:
+            sample_rate: Fraction of requests traced (0 disables tracing)
+            keep: Number of recent traces kept for status://traces
+            rng: Random number generator for sampling
+        """
+        self.sample_rate = sample_rate
+        self.exporters: List[BatchExporter] = []
+        self.recent: deque = deque(maxlen=keep)
+        self.sampled = 0
+        self._rng = rng or random.Random()
+        self._configured = False
+    
+    def configure(self, config) -> None:
+        """Apply the tracing settings of a RunPodConfig, once per process."""
+        if self._configured:
+            return
+        self._configured = True
+        self.sample_rate = config.trace_sample_rate
+        if config.trace_file:
+            self.exporters.append(JsonFileExporter(config.trace_file))
+        if config.trace_otlp_endpoint:
+            self.exporters.append(OtlpHttpExporter(config.trace_otlp_endpoint))
+        if self.sample_rate > 0:
+            logger.info(f"Tracing {self.sample_rate:.0%} of requests")
+    
+    def start_trace(self, name: str, **attributes: Any):
+        """Open a root span for a request, if it is sampled.
+        
+        Inside an existing trace this opens a child span instead.
+        """
+        if _current_span.get() is not None:
+            return span(name, **attributes)
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and self._rng.random() >= self.sample_rate):
+            return _NULL_SPAN
+        self.sampled += 1
+        trace = Trace(os.urandom(16).hex())
+        root = Span(trace, name, None, attributes)
+        trace.spans.append(root)
+        return _ActiveSpan(root, self._finish)
+    
+    def _finish(self, trace: Trace) -> None:
+        self.recent.append(trace)
+        for exporter in self.exporters:
+            exporter.submit(trace)
+    
+    def flush(self) -> None:
+        """Block until all exporters have sent their queued traces."""
+        for exporter in self.exporters:
+            exporter.flush()
+    
+    def render_markdown(self, limit: int = 10) -> str:
+        """Render the slowest recent traces as span trees."""
+        lines = [
+            "# Recent Traces",
+            f"- Sample rate: {self.sample_rate:.0%}",
+            f"- Sampled requests: {self.sampled}",
+        ]
+        for exporter in self.exporters:
+            lines.append(
+                f"- {type(exporter).__name__}: {exporter.exported} exported, "
+                f"{exporter.dropped} dropped, {exporter.failures} failed batches"
+            )
+        if not self.recent:
+            lines.append("")
+            lines.append("No traces recorded yet." if self.sample_rate > 0 else "Tracing is disabled.")
+            return "\n".join(lines)
+        
+        for trace in sorted(self.recent, key=lambda t: -t.root.duration)[:limit]:
+            children: Dict[Optional[str], List[Span]] = {}
+            for s in trace.spans:
+                children.setdefault(s.parent_id, []).append(s)
+            lines.extend(["", f"## {trace.root.name} ({trace.root.duration * 1000:.1f}ms, trace {trace.trace_id})"])
+            
+            def walk(parent_id: Optional[str], depth: int) -> None:
+                for s in sorted(children.get(parent_id, []), key=lambda s: s.start_ns):
+                    offset = (s.start_ns - trace.root.start_ns) / 1e6
+                    detail = ", ".join(f"{key}={value}" for key, value in s.attributes.items())
+                    error = f" ERROR {s.error}" if s.error else ""
+                    lines.append(
+                        f"{'  ' * depth}- {s.name}: {s.duration * 1000:.1f}ms at +{offset:.1f}ms"
+                        f"{f' ({detail})' if detail else ''}{error}"
+                    )
+                    walk(s.span_id, depth + 1)
+            
+            walk(trace.root.span_id, 0)
+        return "\n".join(lines)
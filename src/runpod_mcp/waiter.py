@@ -0,0 +1,206 @@
+"""
+Shared pod state poller for the RunPod MCP server.
+
+Waits for pods to reach a state (e.g. RUNNING after a start) without a
+polling loop per caller: every waiter is served by one background task
+that fetches the whole pod list once per tick. The interval adapts to
+the transition: fast right after an action or a state change, backing
+off while nothing changes (e.g. during an image pull).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-states for pods that are not (or no longer) in the pod list
+STARTING = "STARTING"
+MISSING = "MISSING"
+
+def pod_state(pod: Optional[Dict[str, Any]]) -> str:
+    """Return the observed state of a pod.
+    
+    A pod whose desired status is RUNNING but that has no runtime yet is
+    still being scheduled or pulling its image, and reported as STARTING.
+    """
+    if pod is None:
+        return MISSING
+    status = str(pod.get("desiredStatus") or "UNKNOWN").upper()
+    if status == "RUNNING" and not pod.get("runtime"):
+        return STARTING
+    return status
+
+def _reached(state: str, target: str) -> bool:
+    if target == "TERMINATED":
+        return state in ("TERMINATED", MISSING)
+    return state == target
+
+@dataclass
+class WaitResult:
+    """Outcome of waiting for a set of pods."""
+    states: Dict[str, str]
+    reached: Dict[str, float]
+    timed_out: bool
+    elapsed: float
+
+@dataclass
+class _Waiter:
+    pod_ids: List[str]
+    target: str
+    started: float
+    deadline: float
+    future: asyncio.Future
+    states: Dict[str, str] = field(default_factory=dict)
+    reached: Dict[str, float] = field(default_factory=dict)
+
+class PodStatePoller:
+    """Serves every wait_for_pod_state call from one adaptive polling loop."""
+    
+    def __init__(
+        self,
+        client,
+        min_interval: float = 1.0,
+        max_interval: float = 15.0,
+        fast_period: float = 10.0,
+        backoff: float = 1.5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the poller.
+        
+        Args:
+            client: RunPodClient used to list pods
+            min_interval: Poll interval right after an action or state change
+            max_interval: Longest poll interval while nothing changes
+            fast_period: Seconds after a wait starts during which polling stays fast
+            backoff: Factor applied to the interval after each unchanged poll
+            clock: Monotonic clock function
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.fast_period = fast_period
+        self.backoff = backoff
+        self.polls = 0
+        self.errors = 0
+        self._clock = clock
+        self._interval = min_interval
+        self._waiters: List[_Waiter] = []
+        self._last_states: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    async def wait(self, pod_ids: List[str], target: str = "RUNNING", timeout: float = 300.0) -> WaitResult:
+        """Wait until every pod is in ``target`` state or the timeout passes.
+        
+        Args:
+            pod_ids: IDs of the pods to watch; duplicates are ignored
+            target: Desired state, e.g. RUNNING, EXITED or TERMINATED
+            timeout: Seconds to wait at most
+        
+        Returns:
+            The last observed states and when each pod reached the target
+        """
+        now = self._clock()
+        waiter = _Waiter(
+            pod_ids=list(dict.fromkeys(str(pod_id) for pod_id in pod_ids)),
+            target=target.upper(),
+            started=now,
+            deadline=now + timeout,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        # Poll right away and fast again, since an action was likely just taken
+        self._interval = self.min_interval
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        
+        try:
+            return await waiter.future
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+    
+    async def close(self) -> None:
+        """Stop the polling task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while self._waiters:
+            self._wakeup.clear()
+            await self._poll()
+            self._expire()
+            if not self._waiters:
+                break
+            
+            now = self._clock()
+            delay = min(self._interval, min(w.deadline for w in self._waiters) - now)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, delay))
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _poll(self) -> None:
+        """Fetch the pod list once and update every waiter."""
+        # Read without the client's stale snapshot fallback: during an
+        # outage the poll fails instead of reporting old states as current
+        try:
+            pods = await self.client.get_pods()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Pod state poll failed: {e}")
+            self._interval = min(self.max_interval, self._interval * self.backoff)
+            return
+        self.polls += 1
+        
+        by_id = {str(pod.get("id")): pod for pod in pods or []}
+        now = self._clock()
+        changed = False
+        for waiter in list(self._waiters):
+            for pod_id in waiter.pod_ids:
+                state = pod_state(by_id.get(pod_id))
+                if self._last_states.get(pod_id) != state:
+                    changed = True
+                    self._last_states[pod_id] = state
+                waiter.states[pod_id] = state
+                if pod_id not in waiter.reached and _reached(state, waiter.target):
+                    waiter.reached[pod_id] = now - waiter.started
+            if len(waiter.reached) == len(waiter.pod_ids):
+                self._finish(waiter, timed_out=False)
+        
+        # Forget pods nobody is waiting for any more
+        watched = {pod_id for waiter in self._waiters for pod_id in waiter.pod_ids}
+        self._last_states = {pod_id: state for pod_id, state in self._last_states.items() if pod_id in watched}
+        
+        in_fast_period = any(now - w.started < self.fast_period for w in self._waiters)
+        if changed or in_fast_period:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self.max_interval, self._interval * self.backoff)
+    
+    def _expire(self) -> None:
+        now = self._clock()
+        for waiter in list(self._waiters):
+            if now >= waiter.deadline:
+                self._finish(waiter, timed_out=True)
+    
+    def _finish(self, waiter: _Waiter, timed_out: bool) -> None:
+        self._waiters.remove(waiter)
+        if not waiter.future.done():
+            waiter.future.set_result(WaitResult(
+                states=dict(waiter.states),
+                reached=dict(waiter.reached),
+                timed_out=timed_out,
+                elapsed=self._clock() - waiter.started,
+            ))
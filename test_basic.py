@@ -17,10 +17,10 @@ except ImportError as e:
     print(f"❌ Failed to import RunPod SDK: {e}")
 
 try:
-    import requests
-    print(f"✅ Requests imported successfully: {requests.__version__}")
+    import httpx
+    print(f"✅ HTTPX imported successfully: {httpx.__version__}")
 except ImportError as e:
-    print(f"❌ Failed to import Requests: {e}")
+    print(f"❌ Failed to import HTTPX: {e}")
 
 # Test MCP functionality by creating a simple server
 try:
@@ -0,0 +1,143 @@
+"""
+Tests for the benchmark helpers.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.compare import compare
+from benchmarks.decoding import payloads
+from benchmarks.load import Recorder, load_mix
+from benchmarks.models import MODELS, bench_kind, fleet_payloads
+from benchmarks.resources import fill_template, fleet_for, template_values
+from benchmarks.startup import package_of, parse_importtime
+from src.runpod_mcp.models import Pod
+
+class TestResourceBenchmark(unittest.TestCase):
+    """Test cases for the resource benchmark helpers."""
+
+    def test_fill_template(self):
+        """Test that templates are filled from fleet ids."""
+        values = template_values(fleet_for(10))
+        self.assertEqual(fill_template("pods://details/{pod_id}", values), "pods://details/pod00000")
+        self.assertEqual(fill_template("serverless://metrics/{window}", values), "serverless://metrics/5m")
+        self.assertIsNone(fill_template("things://{unknown}", values))
+
+    def test_fleet_scales(self):
+        """Test that endpoints and volumes grow with the pod count."""
+        fleet = fleet_for(1000)
+        self.assertEqual(len(fleet.pods), 1000)
+        self.assertEqual(len(fleet.endpoints), 50)
+        self.assertEqual(len(fleet.volumes), 20)
+
+class TestCompare(unittest.TestCase):
+    """Test cases for comparing result files."""
+
+    def test_regressions_first(self):
+        """Test that regressions are reported before improvements."""
+        def run(p50, rps):
+            return {"runs": [{"pods": 10, "resources": {"pods://list": {"c1": {"p50_ms": p50, "rps": rps}}}}]}
+
+        rows = compare(run(10.0, 100.0), run(5.0, 50.0))
+
+        self.assertEqual([row["key"] for row in rows], ["10/pods://list/c1/rps", "10/pods://list/c1/p50_ms"])
+        self.assertTrue(rows[0]["regression"])
+        self.assertFalse(rows[1]["regression"])
+        self.assertEqual(compare(run(10.0, 100.0), run(10.5, 100.0)), [])
+
+    def test_startup_results(self):
+        """Test that startup measurements are compared too."""
+        def run(p50):
+            return {"startup": {"first_version_read": {"p50_ms": p50, "p90_ms": 900.0, "min_ms": 700.0}}}
+
+        rows = compare(run(800.0), run(500.0))
+
+        self.assertEqual([row["key"] for row in rows], ["startup/first_version_read/p50_ms"])
+        self.assertFalse(rows[0]["regression"])
+
+    def test_model_results(self):
+        """Test that a slower model decode is reported as a regression."""
+        def run(rate):
+            return {"models": {"pods": {"model_bytes_per_item": 800.0, "model_decode_per_sec": rate, "count": 10}}}
+
+        rows = compare(run(50000.0), run(25000.0))
+
+        self.assertEqual([row["key"] for row in rows], ["models/pods/model_decode_per_sec"])
+        self.assertTrue(rows[0]["regression"])
+
+class TestModelBenchmark(unittest.TestCase):
+    """Test cases for the model benchmark."""
+
+    def test_models_are_smaller_than_dicts(self):
+        """Test that every kind of model retains less memory than its dict."""
+        payloads = fleet_payloads(200)
+        for kind, model in MODELS.items():
+            result = bench_kind(payloads[kind], model, rounds=1)
+            self.assertEqual(result["count"], 200)
+            self.assertLess(result["model_bytes_per_item"], result["dict_bytes_per_item"], kind)
+            self.assertGreater(result["model_decode_per_sec"], 0)
+
+class TestDecodingBenchmark(unittest.TestCase):
+    """Test cases for the decoding benchmark payloads."""
+
+    def test_payloads_carry_unused_fields(self):
+        """Test that the padded payloads hold fields the models skip."""
+        bodies = payloads(20)
+        pods = json.loads(bodies["pods"])
+        templates = json.loads(bodies["templates"])
+        self.assertEqual((len(pods), len(templates)), (20, 20))
+        self.assertIn("machine", pods[0])
+        self.assertIn("readme", templates[0])
+        self.assertTrue(set(pods[0]) - set(Pod.API_FIELDS))
+
+class TestStartupBenchmark(unittest.TestCase):
+    """Test cases for the startup benchmark helpers."""
+
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output."""
+        text = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:      2500 |       2900 |     mcp.types",
+            "import time:       400 |       3300 | src.runpod_mcp.server",
+        ])
+        self.assertEqual(parse_importtime(text), [
+            ("_io", 120, 120), ("mcp.types", 2500, 2900), ("src.runpod_mcp.server", 400, 3300),
+        ])
+
+    def test_package_of(self):
+        """Test grouping of modules by package."""
+        self.assertEqual(package_of("src.runpod_mcp.resources.pods"), "runpod_mcp")
+        self.assertEqual(package_of("mcp.server.fastmcp"), "mcp")
+        self.assertEqual(package_of("http.server"), "stdlib")
+
+class TestLoadHarness(unittest.TestCase):
+    """Test cases for the load harness helpers."""
+
+    def test_recorder_summary(self):
+        """Test per-operation and overall summaries."""
+        recorder = Recorder()
+        for ms in range(1, 101):
+            recorder.record("read", ms / 1000)
+        recorder.record("tool", 0.5, error="Error: boom")
+
+        summary = recorder.summary(elapsed=2.0)
+
+        self.assertEqual(summary["overall"]["count"], 101)
+        self.assertAlmostEqual(summary["overall"]["rps"], 50.5)
+        self.assertAlmostEqual(summary["operations"]["read"]["p99_ms"], 99.0)
+        self.assertEqual(summary["operations"]["tool"]["error_rate"], 1.0)
+        self.assertEqual(summary["error_samples"], {"tool": "Error: boom"})
+
+    def test_default_mix(self):
+        """Test that every default operation is either a read or a tool call."""
+        for op in load_mix(None):
+            self.assertTrue((op.uri is None) != (op.tool is None), op.name)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the circuit breaker module.
+"""
+
+import os
+import sys
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.breaker import CircuitBreaker, CircuitBreakers, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+def status_error(status):
+    """Build an HTTPStatusError for the given status code."""
+    request = httpx.Request("GET", "https://api.runpod.io/v1/pods")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the CircuitBreaker class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.now = 0.0
+        self.breaker = CircuitBreaker("pods", failure_threshold=2, reset_timeout=10, clock=lambda: self.now)
+
+    def trip(self):
+        for _ in range(2):
+            self.breaker.before_call()
+            self.breaker.record_failure(status_error(503))
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive outage errors open the circuit."""
+        self.trip()
+        self.assertEqual(self.breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_client_errors_do_not_open(self):
+        """Test that 4xx responses do not count as failures."""
+        for _ in range(5):
+            self.breaker.record_failure(status_error(404))
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_half_open_trial(self):
+        """Test that one trial call is allowed after the reset timeout."""
+        self.trip()
+        self.now = 11
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial call reopens the circuit."""
+        self.trip()
+        self.now = 11
+        self.breaker.before_call()
+        self.breaker.record_failure(httpx.ConnectError("down"))
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.times_opened, 2)
+
+    def test_route_groups(self):
+        """Test that routes map to their top-level group."""
+        breakers = CircuitBreakers()
+        self.assertIs(breakers.get("/pods/{id}/stop"), breakers.get("/pods"))
+        self.assertIsNot(breakers.get("/pods"), breakers.get("/endpoints"))
+
+if __name__ == "__main__":
+    unittest.main()
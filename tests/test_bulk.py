@@ -0,0 +1,145 @@
+"""
+Tests for the bulk pod operations module.
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mcp.server.fastmcp import FastMCP
+
+from src.runpod_mcp.bulk import concurrency_limit, format_results, run_bulk, select_pods
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.tools.pods import register_pod_tools
+
+PODS = [
+    {"id": "p1", "name": "train-a", "gpuDisplayName": "RTX 4090", "desiredStatus": "RUNNING"},
+    {"id": "p2", "name": "train-b", "gpuDisplayName": "A100 80GB", "desiredStatus": "RUNNING"},
+    {"id": "p3", "name": "infer-a", "gpuDisplayName": "RTX 4090", "desiredStatus": "EXITED"},
+]
+
+class TestSelectPods(unittest.TestCase):
+    """Test cases for select_pods."""
+
+    def test_selectors_combine(self):
+        """Test that all given selectors must match."""
+        selected = select_pods(PODS, name_prefix="train", gpu_type="4090")
+        self.assertEqual([pod["id"] for pod in selected], ["p1"])
+        selected = select_pods(PODS, status="running")
+        self.assertEqual([pod["id"] for pod in selected], ["p1", "p2"])
+        selected = select_pods(PODS, gpu_type="a100-80gb")
+        self.assertEqual([pod["id"] for pod in selected], ["p2"])
+
+    def test_ids_without_listing(self):
+        """Test that explicit IDs are selected even if they are not listed."""
+        selected = select_pods(PODS, pod_ids=["p3", "p9"])
+        self.assertEqual([pod["id"] for pod in selected], ["p3", "p9"])
+
+    def test_ids_with_selector(self):
+        """Test that IDs combined with a selector only keep matching listed pods."""
+        selected = select_pods(PODS, pod_ids=["p1", "p3", "p9"], status="EXITED")
+        self.assertEqual([pod["id"] for pod in selected], ["p3"])
+
+    def test_concurrency_limit(self):
+        """Test that a requested concurrency is validated and capped."""
+        self.assertEqual(concurrency_limit(None, 8), 8)
+        self.assertEqual(concurrency_limit(3, 8), 3)
+        self.assertEqual(concurrency_limit(1000, 8), 8)
+        with self.assertRaises(ValueError):
+            concurrency_limit(0, 8)
+
+class TestRunBulk(unittest.IsolatedAsyncioTestCase):
+    """Test cases for run_bulk."""
+
+    async def test_bounded_concurrency_and_partial_failure(self):
+        """Test that concurrency is bounded and failures are reported per pod."""
+        in_flight = 0
+        peak = 0
+
+        async def action(pod_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if pod_id == "p5":
+                request = httpx.Request("POST", f"https://api.runpod.io/v1/pods/{pod_id}/stop")
+                response = httpx.Response(409, text="pod is busy", request=request)
+                raise httpx.HTTPStatusError("conflict", request=request, response=response)
+
+        pods = [{"id": f"p{i}"} for i in range(10)]
+        results = await run_bulk(action, pods, concurrency=3)
+
+        self.assertEqual(peak, 3)
+        self.assertEqual([result.pod_id for result in results], [pod["id"] for pod in pods])
+        failed = [result for result in results if not result.ok]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].error, "HTTP 409: pod is busy")
+
+        table = format_results("stop", results, 0.5)
+        self.assertIn("9/10 succeeded", table)
+        self.assertIn("| p5 |  | failed: HTTP 409: pod is busy |", table)
+        self.assertIn("pod_ids=['p5']", table)
+
+class FakeClient:
+    """Serves a live pod listing and records terminated pods."""
+
+    def __init__(self, pods):
+        self.config = RunPodConfig(api_key="test", bulk_concurrency=4)
+        self.pods = pods
+        self.terminated = []
+
+    async def get_pods(self):
+        return self.pods
+
+    async def terminate_pod(self, pod_id):
+        self.terminated.append(pod_id)
+
+class StaleMirror:
+    """Fleet mirror still listing pods that have changed since."""
+
+    def list(self, kind):
+        return PODS
+
+    def age(self, kind):
+        return 60.0
+
+    def request_sync(self):
+        pass
+
+class TestBulkTools(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the bulk pod tools."""
+
+    def setUp(self):
+        """Register the tools with a live listing that differs from the mirror."""
+        # p3 was restarted since the mirror's last sync
+        self.client = FakeClient([dict(PODS[2], desiredStatus="RUNNING")])
+        self.server = FastMCP("test")
+        self.server.get_run_context = lambda: {"runpod_client": self.client, "fleet_mirror": StaleMirror()}
+        register_pod_tools(self.server)
+
+    async def call(self, name, **arguments):
+        """Call a tool and return its text output."""
+        content, _ = await self.server.call_tool(name, arguments)
+        return content[0].text
+
+    async def test_terminate_selects_from_live_listing(self):
+        """Test that terminate matches selectors against the API, not the mirror."""
+        text = await self.call("terminate_pods", status="EXITED")
+        self.assertEqual(text, "No pods match the given IDs and selectors.")
+        self.assertEqual(self.client.terminated, [])
+
+    async def test_invalid_concurrency(self):
+        """Test that a concurrency below 1 is rejected."""
+        text = await self.call("terminate_pods", pod_ids=["p1"], concurrency=0)
+        self.assertIn("concurrency must be at least 1", text)
+        self.assertEqual(self.client.terminated, [])
+
+if __name__ == "__main__":
+    unittest.main()
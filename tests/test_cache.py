@@ -0,0 +1,67 @@
+"""
+Tests for the response cache module.
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.cache import TTLCache
+
+class TestTTLCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the TTLCache class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.cache = TTLCache(max_entries=2)
+        self.calls = 0
+
+    async def fetch(self):
+        self.calls += 1
+        return self.calls
+
+    async def test_fresh_hit(self):
+        """Test that fresh entries are served without fetching."""
+        self.assertEqual(await self.cache.get_or_fetch("gpus", self.fetch, ttl=60), 1)
+        self.assertEqual(await self.cache.get_or_fetch("gpus", self.fetch, ttl=60), 1)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats.hits, 1)
+        self.assertEqual(self.cache.stats.misses, 1)
+
+    async def test_stale_while_revalidate(self):
+        """Test that stale entries are served while one refresh runs."""
+        self.cache.set("gpus", "old", ttl=0, stale_ttl=60)
+
+        first = await self.cache.get_or_fetch("gpus", self.fetch, ttl=60, stale_ttl=60)
+        second = await self.cache.get_or_fetch("gpus", self.fetch, ttl=60, stale_ttl=60)
+        self.assertEqual((first, second), ("old", "old"))
+
+        # Let the background refresh complete
+        await asyncio.sleep(0)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(await self.cache.get_or_fetch("gpus", self.fetch, ttl=60), 1)
+        self.assertEqual(self.cache.stats.stale_hits, 2)
+        self.assertEqual(self.cache.stats.refreshes, 1)
+
+    async def test_expired_entry_is_refetched(self):
+        """Test that entries past their stale window are fetched again."""
+        self.cache.set("gpus", "old", ttl=0, stale_ttl=0)
+        self.assertEqual(await self.cache.get_or_fetch("gpus", self.fetch, ttl=60), 1)
+
+    async def test_size_bound(self):
+        """Test that the least recently used entry is evicted."""
+        self.cache.set("a", 1, ttl=60)
+        self.cache.set("b", 2, ttl=60)
+        await self.cache.get_or_fetch("a", self.fetch, ttl=60)
+        self.cache.set("c", 3, ttl=60)
+
+        self.assertIsNone(self.cache.peek("b"))
+        self.assertIsNotNone(self.cache.peek("a"))
+        self.assertEqual(self.cache.stats.evictions, 1)
+
+if __name__ == "__main__":
+    unittest.main()
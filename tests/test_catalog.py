@@ -0,0 +1,52 @@
+"""
+Tests for the GPU catalog module.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.catalog import GpuCatalog, normalize_gpu_name
+
+GPUS = [
+    {"id": "NVIDIA A100 80GB PCIe", "displayName": "A100 80GB", "memoryInGb": 80,
+     "secureCloud": True, "communityCloud": False, "available": True},
+    {"id": "NVIDIA GeForce RTX 4090", "displayName": "RTX 4090", "memoryInGb": 24,
+     "secureCloud": True, "communityCloud": True, "available": False},
+    {"id": "NVIDIA RTX A6000", "memoryInGb": 48, "communityCloud": True},
+]
+
+class TestGpuCatalog(unittest.TestCase):
+    """Test cases for the GpuCatalog class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.catalog = GpuCatalog(GPUS)
+
+    def test_normalize(self):
+        """Test that name variants normalize to the same key."""
+        self.assertEqual(normalize_gpu_name("A100 80GB"), normalize_gpu_name("a100-80gb"))
+
+    def test_lookup_by_id_name_and_alias(self):
+        """Test lookups by id, display name and alias."""
+        self.assertIs(self.catalog.lookup("NVIDIA A100 80GB PCIe"), GPUS[0])
+        self.assertIs(self.catalog.lookup("a100-80gb"), GPUS[0])
+        self.assertIs(self.catalog.lookup("rtx 4090"), GPUS[1])
+        self.assertIs(self.catalog.lookup("rtx4090-24gb"), GPUS[1])
+        self.assertIsNone(self.catalog.lookup("h100"))
+
+    def test_missing_display_name(self):
+        """Test that GPUs without a display name are still indexed."""
+        self.assertIs(self.catalog.lookup("rtx a6000"), GPUS[2])
+
+    def test_filter(self):
+        """Test filtering by VRAM, cloud and availability."""
+        self.assertEqual(self.catalog.filter(min_vram=40), [GPUS[2], GPUS[0]])
+        self.assertEqual(self.catalog.filter(cloud="community"), [GPUS[1], GPUS[2]])
+        self.assertEqual(self.catalog.filter(cloud="secure", available=True), [GPUS[0]])
+
+if __name__ == "__main__":
+    unittest.main()
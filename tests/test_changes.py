@@ -0,0 +1,126 @@
+"""
+Tests for the change feed module.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.changes import (
+    ChangeFeed, ResourceSubscriptions, diff_collection,
+    CREATED, STATUS_CHANGED, COST_CHANGED, TERMINATED
+)
+from src.runpod_mcp.mirror import MirroredCollection
+
+def pods_collection(*pods):
+    """Build a synced pods collection."""
+    collection = MirroredCollection("pods")
+    collection.replace(list(pods))
+    return {"pods": collection}
+
+class FakeSession:
+    """Records resources/updated notifications."""
+
+    def __init__(self, fail=False):
+        self.updated = []
+        self.fail = fail
+
+    async def send_resource_updated(self, uri):
+        if self.fail:
+            raise ConnectionError("closed")
+        self.updated.append(str(uri))
+
+class TestDiffCollection(unittest.TestCase):
+    """Test cases for diff_collection."""
+
+    def test_detects_each_event_type(self):
+        """Test that created, status, cost and terminated changes are detected."""
+        old = {"a": ("RUNNING", 0.5), "b": ("RUNNING", 0.5), "c": ("EXITED", 0)}
+        new = {"a": ("EXITED", 0), "b": ("TERMINATED", 0.5), "d": ("RUNNING", 1.0)}
+        changes = diff_collection("pods", old, new)
+        self.assertIn(("a", STATUS_CHANGED, "RUNNING", "EXITED"), changes)
+        self.assertIn(("a", COST_CHANGED, 0.5, 0), changes)
+        self.assertIn(("b", TERMINATED, "RUNNING", "TERMINATED"), changes)
+        self.assertIn(("c", TERMINATED, "EXITED", None), changes)
+        self.assertIn(("d", CREATED, None, "RUNNING"), changes)
+        self.assertEqual(len(changes), 5)
+
+    def test_no_changes(self):
+        """Test that identical snapshots produce no events."""
+        state = {"a": ("RUNNING", 0.5)}
+        self.assertEqual(diff_collection("pods", state, dict(state)), [])
+
+class TestChangeFeed(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the ChangeFeed class."""
+
+    async def test_first_snapshot_is_baseline(self):
+        """Test that the first snapshot emits no events."""
+        feed = ChangeFeed()
+        events = await feed.observe(pods_collection({"id": "a", "desiredStatus": "RUNNING"}))
+        self.assertEqual(events, [])
+        self.assertEqual(feed.cursor, 0)
+
+    async def test_cursor_reads(self):
+        """Test reading changes since a cursor."""
+        feed = ChangeFeed()
+        await feed.observe(pods_collection({"id": "a", "desiredStatus": "RUNNING", "costPerHr": 0.5}))
+        await feed.observe(pods_collection({"id": "a", "desiredStatus": "EXITED", "costPerHr": 0.5}))
+        await feed.observe(pods_collection(
+            {"id": "a", "desiredStatus": "EXITED", "costPerHr": 0.5},
+            {"id": "b", "desiredStatus": "RUNNING", "costPerHr": 1.0}
+        ))
+
+        events, complete = feed.since(0)
+        self.assertTrue(complete)
+        self.assertEqual([e.event for e in events], [STATUS_CHANGED, CREATED])
+        self.assertIn("RUNNING -> EXITED", events[0].describe())
+
+        events, complete = feed.since(1)
+        self.assertEqual([e.item_id for e in events], ["b"])
+        self.assertEqual(feed.since(feed.cursor)[0], [])
+
+    async def test_dropped_events_are_reported(self):
+        """Test that reading from a cursor older than the log is flagged."""
+        feed = ChangeFeed(max_events=2)
+        await feed.observe(pods_collection())
+        for i in range(3):
+            await feed.observe(pods_collection(*({"id": str(n)} for n in range(i + 1))))
+        events, complete = feed.since(0)
+        self.assertFalse(complete)
+        self.assertEqual(len(events), 2)
+        self.assertTrue(feed.since(1)[1])
+
+    async def test_notifies_subscribers(self):
+        """Test that subscribed sessions get resources/updated for affected resources."""
+        subscriptions = ResourceSubscriptions()
+        listing, detail, other, feed_watcher = FakeSession(), FakeSession(), FakeSession(), FakeSession()
+        subscriptions.subscribe("pods://list", listing)
+        subscriptions.subscribe("pods://details/a", detail)
+        subscriptions.subscribe("pods://details/z", other)
+        subscriptions.subscribe("changes://since/0", feed_watcher)
+
+        feed = ChangeFeed()
+        feed.add_listener(subscriptions.notify)
+        await feed.observe(pods_collection({"id": "a", "desiredStatus": "RUNNING"}))
+        await feed.observe(pods_collection({"id": "a", "desiredStatus": "EXITED"}))
+
+        self.assertEqual(listing.updated, ["pods://list"])
+        self.assertEqual(detail.updated, ["pods://details/a"])
+        self.assertEqual(other.updated, [])
+        self.assertEqual(feed_watcher.updated, ["changes://since/0"])
+
+    async def test_drops_failed_sessions(self):
+        """Test that sessions that cannot be notified are unsubscribed."""
+        subscriptions = ResourceSubscriptions()
+        subscriptions.subscribe("pods://list", FakeSession(fail=True))
+        feed = ChangeFeed()
+        feed.add_listener(subscriptions.notify)
+        await feed.observe(pods_collection())
+        await feed.observe(pods_collection({"id": "a"}))
+        self.assertEqual(subscriptions.count(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
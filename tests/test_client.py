@@ -4,61 +4,83 @@ Tests for the RunPod client module.
 
 import os
 import sys
+import json
+import time
+import asyncio
 import unittest
-from unittest.mock import patch, MagicMock
+
+import httpx
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.runpod_mcp.config import RunPodConfig
 from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.breaker import CircuitOpenError
+from src.runpod_mcp.models import Pod
 
-class TestRunPodClient(unittest.TestCase):
+class TestRunPodClient(unittest.IsolatedAsyncioTestCase):
     """Test cases for the RunPodClient class."""
 
     def setUp(self):
         """Set up the test environment."""
-        self.config = RunPodConfig(api_key="test-api-key")
-        
-        # Create patcher for requests.Session
-        self.session_patcher = patch('requests.Session')
-        self.mock_session_class = self.session_patcher.start()
-        self.mock_session = MagicMock()
-        self.mock_session_class.return_value = self.mock_session
-        
+        self.config = RunPodConfig(api_key="test-api-key", retry_base_delay=0.0)
+
+        # Record every request and answer from a per-test response table
+        self.requests = []
+        self.responses = {}
+        self.delay = 0.0
+
+        async def handler(request):
+            self.requests.append(request)
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            key = (request.method, request.url.path)
+            response = self.responses.get(key, (404, {"error": "not found"}))
+            # A list of responses is served in order, one per request
+            status, body, *headers = response.pop(0) if isinstance(response, list) else response
+            return httpx.Response(status, json=body, headers=headers[0] if headers else None)
+
         # Create client for testing
-        self.client = RunPodClient(self.config)
+        self.client = RunPodClient(self.config, transport=httpx.MockTransport(handler))
 
-    def tearDown(self):
+    async def asyncTearDown(self):
         """Tear down the test environment."""
-        self.session_patcher.stop()
+        await self.client.close()
 
     def test_init(self):
         """Test client initialization."""
         # Check that the session was initialized with correct headers
-        self.mock_session.headers.update.assert_called_once()
-        update_args = self.mock_session.headers.update.call_args[0][0]
-        self.assertEqual(update_args["Authorization"], "Bearer test-api-key")
-        self.assertEqual(update_args["Content-Type"], "application/json")
+        headers = self.client.session.headers
+        self.assertEqual(headers["Authorization"], "Bearer test-api-key")
+        self.assertEqual(headers["Content-Type"], "application/json")
 
-    def test_get_gpus(self):
+    async def test_get_gpu_types(self):
         """Test getting GPUs."""
         expected_result = [{"id": "gpu1", "name": "Test GPU"}]
-        
-        # Setup REST API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = expected_result
-        self.mock_session.get.return_value = mock_response
-        
-        result = self.client.get_gpus()
-        
+        self.responses[("GET", "/v1/gpus")] = (200, expected_result)
+
+        result = await self.client.get_gpu_types()
+
         # Verify REST API was called
-        self.mock_session.get.assert_called_once_with(f"{self.config.api_url}/gpus")
-        
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(str(self.requests[0].url), f"{self.config.api_url}/gpus")
+
         # Verify result
         self.assertEqual(result, expected_result)
 
-    def test_create_pod(self):
+    async def test_get_gpu_types_is_cached(self):
+        """Test that repeated catalog reads are served from the cache."""
+        self.responses[("GET", "/v1/gpus")] = (200, [{"id": "gpu1"}])
+
+        await self.client.get_gpu_types()
+        result = await self.client.get_gpu_types()
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(result, [{"id": "gpu1"}])
+        self.assertEqual(self.client.cache.stats.hits, 1)
+
+    async def test_create_pod(self):
         """Test creating a pod."""
         pod_config = {
             "gpu_id": "gpu1",
@@ -67,62 +89,267 @@ class TestRunPodClient(unittest.TestCase):
             "name": "test-pod"
         }
         expected_result = {"id": "pod1", "name": "test-pod", "status": "CREATED"}
-        
-        # Setup REST API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = expected_result
-        self.mock_session.post.return_value = mock_response
-        
-        result = self.client.create_pod(pod_config)
-        
-        # Verify REST API was called
-        self.mock_session.post.assert_called_once_with(
-            f"{self.config.api_url}/pods",
-            json=pod_config
-        )
-        
+        self.responses[("POST", "/v1/pods")] = (200, expected_result)
+
+        result = await self.client.create_pod(pod_config)
+
+        # Verify REST API was called with the pod configuration
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].method, "POST")
+        self.assertEqual(json.loads(self.requests[0].content), pod_config)
+
         # Verify result
         self.assertEqual(result, expected_result)
-    
-    def test_start_pod(self):
+
+    async def test_start_pod(self):
         """Test starting a pod."""
         pod_id = "pod1"
         expected_result = {"id": "pod1", "status": "STARTING"}
-        
-        # Setup REST API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = expected_result
-        self.mock_session.post.return_value = mock_response
-        
-        result = self.client.start_pod(pod_id)
-        
+        self.responses[("POST", f"/v1/pods/{pod_id}/start")] = (200, expected_result)
+
+        result = await self.client.start_pod(pod_id)
+
         # Verify REST API was called
-        self.mock_session.post.assert_called_once_with(
-            f"{self.config.api_url}/pods/{pod_id}/start"
-        )
-        
+        self.assertEqual(str(self.requests[0].url), f"{self.config.api_url}/pods/{pod_id}/start")
+
         # Verify result
         self.assertEqual(result, expected_result)
-        
-    def test_stop_pod(self):
+
+    async def test_stop_pod(self):
         """Test stopping a pod."""
         pod_id = "pod1"
         expected_result = {"id": "pod1", "status": "STOPPING"}
-        
-        # Setup REST API response
-        mock_response = MagicMock()
-        mock_response.json.return_value = expected_result
-        self.mock_session.post.return_value = mock_response
-        
-        result = self.client.stop_pod(pod_id)
-        
+        self.responses[("POST", f"/v1/pods/{pod_id}/stop")] = (200, expected_result)
+
+        result = await self.client.stop_pod(pod_id)
+
         # Verify REST API was called
-        self.mock_session.post.assert_called_once_with(
-            f"{self.config.api_url}/pods/{pod_id}/stop"
-        )
-        
+        self.assertEqual(str(self.requests[0].url), f"{self.config.api_url}/pods/{pod_id}/stop")
+
         # Verify result
         self.assertEqual(result, expected_result)
 
+    async def test_credits_info_fans_out_concurrently(self):
+        """Test that credit aggregation calls run concurrently."""
+        self.delay = 0.1
+        self.responses[("GET", "/v1/me")] = (200, {"credits": 10.0})
+        self.responses[("GET", "/v1/pods")] = (200, [{"desiredStatus": "RUNNING", "runtime": {"costPerHr": 1.0}}])
+        self.responses[("GET", "/v1/endpoints")] = (200, [])
+
+        start = time.monotonic()
+        result = await self.client.get_credits_info()
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(result["currentBalance"], 10.0)
+        self.assertEqual(result["estimatedMonthlyBurn"], 720.0)
+        self.assertEqual(result["errors"], {})
+
+    async def test_credits_info_tolerates_partial_failure(self):
+        """Test that a failed call does not discard the other results."""
+        self.responses[("GET", "/v1/me")] = (200, {"credits": 10.0})
+        self.responses[("GET", "/v1/pods")] = (500, {"error": "boom"})
+        self.responses[("GET", "/v1/endpoints")] = (200, [{"name": "ep"}])
+
+        result = await self.client.get_credits_info()
+
+        self.assertEqual(result["currentBalance"], 10.0)
+        self.assertEqual(result["activeEndpoints"], [{"name": "ep"}])
+        self.assertIn("pods", result["errors"])
+
+    async def test_concurrent_gets_are_coalesced(self):
+        """Test that identical in-flight GETs share one upstream call."""
+        self.delay = 0.05
+        self.responses[("GET", "/v1/pods")] = (200, [{"id": "pod1"}])
+
+        results = await asyncio.gather(*(self.client.get_pods() for _ in range(5)))
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.client.singleflight.collapsed, 4)
+
+    async def test_collapsed_calls_are_counted_by_route(self):
+        """Test that collapsed calls for different IDs share one route counter."""
+        self.delay = 0.05
+        self.responses[("GET", "/v1/pods/pod1")] = (200, {"id": "pod1"})
+        self.responses[("GET", "/v1/pods/pod2")] = (200, {"id": "pod2"})
+
+        await asyncio.gather(*(self.client.get_pod(pod_id) for pod_id in ("pod1", "pod1", "pod2", "pod2")))
+
+        self.assertEqual(self.client.singleflight.snapshot()["collapsedByGroup"], {"GET /pods/{id}": 2})
+
+    async def test_transient_error_is_retried(self):
+        """Test that a 502 is retried and the request recovers."""
+        self.responses[("GET", "/v1/network-volumes")] = [(502, {}), (200, [{"id": "vol1"}])]
+
+        result = await self.client.get_network_volumes()
+
+        self.assertEqual(result, [{"id": "vol1"}])
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.client.retries.stats["GET /network-volumes"].recovered, 1)
+
+    async def test_serves_snapshot_when_api_is_down(self):
+        """Test that reads fall back to last known data during an outage."""
+        self.responses[("GET", "/v1/pods")] = [(200, [{"id": "pod1"}])] + [(503, {})] * 10
+
+        await self.client.get_pods()
+        self.assertIsNone(self.client.stale_data_age())
+
+        result = await self.client.get_pods(allow_stale=True)
+
+        self.assertEqual(result, [{"id": "pod1"}])
+        self.assertIsNotNone(self.client.stale_data_age())
+
+    async def test_snapshot_fallback_is_opt_in(self):
+        """Test that reads without allow_stale see the outage."""
+        self.responses[("GET", "/v1/pods")] = [(200, [{"id": "pod1"}])] + [(503, {})] * 10
+
+        await self.client.get_pods()
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.get_pods()
+        self.assertIsNone(self.client.stale_data_age())
+
+    async def test_aggregate_resource_shows_stale_notice(self):
+        """Test that snapshots served to concurrent calls reach the resource's notice."""
+        from mcp.server.fastmcp import FastMCP
+        from src.runpod_mcp.resources.account import register_account_resources
+
+        for path, body in (("/v1/me", {"credits": 10.0}), ("/v1/pods", []), ("/v1/endpoints", [])):
+            self.responses[("GET", path)] = [(200, body)] + [(503, {})] * 10
+        server = FastMCP("test")
+        server.get_run_context = lambda: {"runpod_client": self.client}
+        register_account_resources(server)
+
+        async def read():
+            # Each read runs in its own task, as MCP requests do
+            contents = await asyncio.ensure_future(server.read_resource("account://credits"))
+            return list(contents)[0].content
+
+        self.assertNotIn("unavailable", await read())
+        text = await read()
+        self.assertIn("Note: the RunPod API is currently unavailable", text)
+        self.assertIn("$10.00", text)
+
+    async def test_credits_resource_reads_costs_through_models(self):
+        """Test that active pod and endpoint costs are read through the shared models."""
+        from mcp.server.fastmcp import FastMCP
+        from src.runpod_mcp.resources.account import register_account_resources
+
+        self.responses[("GET", "/v1/me")] = (200, {"credits": 10.0})
+        self.responses[("GET", "/v1/pods")] = (200, [
+            {"id": "pod1", "name": "train", "desiredStatus": "RUNNING", "runtime": {"costPerHr": 0.5}},
+        ])
+        self.responses[("GET", "/v1/endpoints")] = (200, [{"id": "ep1", "name": "infer", "costPerHour": 0.25}])
+        server = FastMCP("test")
+        server.get_run_context = lambda: {"runpod_client": self.client}
+        register_account_resources(server)
+
+        text = list(await server.read_resource("account://credits"))[0].content
+        self.assertIn("- train: $0.50/hr", text)
+        self.assertIn("- infer: $0.25/hr", text)
+        self.assertIn("Current Hourly Burn Rate: $0.75/hr", text)
+
+    async def test_open_circuit_fails_fast(self):
+        """Test that an open circuit rejects calls without a request."""
+        self.responses[("GET", "/v1/endpoints/ep1")] = (503, {})
+        self.client.breakers.failure_threshold = 3
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.get_endpoint("ep1")
+
+        sent = len(self.requests)
+        with self.assertRaises(CircuitOpenError):
+            await self.client.get_endpoint("ep1")
+        self.assertEqual(len(self.requests), sent)
+
+    async def test_not_modified_reuses_parsed_body(self):
+        """Test that a 304 returns the previously parsed object."""
+        self.responses[("GET", "/v1/pods")] = [
+            (200, [{"id": "pod1"}], {"ETag": '"v1"'}),
+            (304, None),
+        ]
+
+        first = await self.client.get_pods()
+        second = await self.client.get_pods()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.client.validators.not_modified, 1)
+
+    async def test_unchanged_body_without_validators(self):
+        """Test that an identical body is detected by its content hash."""
+        self.responses[("GET", "/v1/network-volumes")] = [(200, [{"id": "vol1"}]), (200, [{"id": "vol1"}])]
+
+        first = await self.client.get_network_volumes()
+        second = await self.client.get_network_volumes()
+
+        self.assertIs(first, second)
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        self.assertEqual(self.client.validators.unchanged, 1)
+
+    async def test_typed_listing_is_decoded_into_models(self):
+        """Test that typed listings are models, kept apart from the plain response."""
+        self.responses[("GET", "/v1/pods")] = [
+            (200, [{"id": "pod1", "name": "train", "imageName": "unused"}], {"ETag": '"v1"'}),
+            (200, [{"id": "pod1", "name": "train", "imageName": "unused"}], {"ETag": '"v1"'}),
+            (304, None),
+        ]
+
+        typed = await self.client.get_pods(typed=True)
+        plain = await self.client.get_pods()
+        again = await self.client.get_pods(typed=True)
+
+        self.assertEqual([(pod.id, pod.name) for pod in typed], [("pod1", "train")])
+        self.assertIsInstance(typed[0], Pod)
+        self.assertEqual(plain, [{"id": "pod1", "name": "train", "imageName": "unused"}])
+        self.assertIs(again, typed)
+
+    async def test_http_error_raises(self):
+        """Test that HTTP errors are raised to the caller."""
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.get_pod("missing")
+
+        # 404s are not retried
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_iter_pods_pages(self):
+        """Test that pods are yielded page by page until a short page."""
+        self.responses[("GET", "/v1/pods")] = [
+            (200, [{"id": "a"}, {"id": "b"}]),
+            (200, [{"id": "c"}, {"id": "d"}]),
+            (200, [{"id": "e"}]),
+        ]
+
+        pods = [pod["id"] async for pod in self.client.iter_pods(page_size=2)]
+
+        self.assertEqual(pods, ["a", "b", "c", "d", "e"])
+        self.assertEqual([r.url.params["offset"] for r in self.requests], ["0", "2", "4"])
+        self.assertTrue(all(r.url.params["limit"] == "2" for r in self.requests))
+
+    async def test_iter_pods_without_api_paging(self):
+        """Test that a response ignoring the paging parameters is not repeated."""
+        self.responses[("GET", "/v1/pods")] = (200, [{"id": "a"}, {"id": "b"}])
+
+        pods = [pod["id"] async for pod in self.client.iter_pods(page_size=2)]
+
+        self.assertEqual(pods, ["a", "b"])
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_iter_stops_prefetch_on_close(self):
+        """Test that closing the iterator early cancels the prefetched page."""
+        self.responses[("GET", "/v1/network-volumes")] = [
+            (200, [{"id": "a"}, {"id": "b"}]),
+            (200, [{"id": "c"}, {"id": "d"}]),
+        ]
+        self.delay = 0.05
+
+        volumes = self.client.iter_network_volumes(page_size=2)
+        first = await volumes.__anext__()
+        await volumes.aclose()
+
+        self.assertEqual(first["id"], "a")
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(self.responses[("GET", "/v1/network-volumes")]), 1)
+
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -27,6 +27,9 @@ class TestRunPodConfig(unittest.TestCase):
             del os.environ["RUNPOD_API_KEY"]
         if "RUNPOD_API_URL" in os.environ:
             del os.environ["RUNPOD_API_URL"]
+        for key in list(os.environ):
+            if key.startswith("RUNPOD_"):
+                del os.environ[key]
 
     def tearDown(self):
         """Tear down the test environment."""
@@ -102,5 +105,35 @@ class TestRunPodConfig(unittest.TestCase):
         self.assertEqual(config.api_key, "test-api-key")
         self.assertEqual(config.api_url, "https://api.runpod.io/v1")
 
+    def test_get_config_merges_file_under_env(self):
+        """Test that a config file still applies when the API key comes from the environment."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix=".json", delete=False) as temp:
+            json.dump({"api_url": "https://file.runpod.io/v1", "rate_limit": 3.0, "mirror_enabled": True}, temp)
+            temp_path = temp.name
+
+        os.environ["RUNPOD_API_KEY"] = "env-api-key"
+        os.environ["RUNPOD_RATE_LIMIT"] = "7"
+        try:
+            with patch("src.runpod_mcp.config.config_locations", return_value=[temp_path]):
+                config = get_config()
+        finally:
+            os.unlink(temp_path)
+        self.assertEqual(config.api_key, "env-api-key")
+        self.assertEqual(config.api_url, "https://file.runpod.io/v1")
+        self.assertEqual(config.rate_limit, 7.0)
+        self.assertTrue(config.mirror_enabled)
+
+    def test_transport_settings_from_env(self):
+        """Test that connection pool settings are read from the environment."""
+        os.environ["RUNPOD_API_KEY"] = "test-api-key"
+        os.environ["RUNPOD_MAX_CONNECTIONS"] = "50"
+        os.environ["RUNPOD_KEEPALIVE_EXPIRY"] = "12.5"
+        os.environ["RUNPOD_HTTP2"] = "true"
+        config = RunPodConfig.from_env()
+        self.assertEqual(config.max_connections, 50)
+        self.assertEqual(config.keepalive_expiry, 12.5)
+        self.assertTrue(config.http2)
+        self.assertEqual(config.max_keepalive_connections, 10)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Tests for the JSON decoders.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.decoding import JsonDecoder, create_decoder, decoder_available
+from src.runpod_mcp.models import Pod, Template
+
+PODS = [
+    {"id": "pod1", "name": "train", "imageName": "unused", "machine": {"location": "US"},
+     "runtime": {"uptimeInSeconds": 60, "costPerHr": 0.5, "gpus": [{"id": "gpu0"}]},
+     "ports": [{"name": "http", "ip": "10.0.0.1", "publicPort": 8888}], "env": [{"key": "A", "value": "1"}]},
+    {"id": "pod2", "runtime": None, "container": None},
+]
+
+BODY = json.dumps(PODS).encode()
+
+class TestDecoders(unittest.TestCase):
+    """Test cases for the JSON decoders."""
+
+    def check_decoder(self, name):
+        decoder = create_decoder(name)
+        self.assertEqual(decoder.name, name)
+        self.assertEqual(decoder.loads(BODY), PODS)
+        self.assertEqual(decoder.decode_list(BODY, Pod), [Pod.from_api(pod) for pod in PODS])
+        self.assertEqual(decoder.fallbacks, 0)
+
+        # Bodies that do not match the schema decode like with the standard library
+        odd = json.dumps([{"id": "pod3", "ports": ["junk"]}, "junk"]).encode()
+        self.assertEqual(decoder.decode_list(odd, Pod), JsonDecoder().decode_list(odd, Pod))
+        self.assertEqual(decoder.decode_list(b'{"items": []}', Template), {"items": []})
+        with self.assertRaises(ValueError):
+            decoder.loads(b"not json")
+
+    def test_stdlib(self):
+        """Test the standard library decoder."""
+        self.check_decoder("stdlib")
+
+    @unittest.skipUnless(decoder_available("orjson"), "orjson is not installed")
+    def test_orjson(self):
+        """Test the orjson decoder."""
+        self.check_decoder("orjson")
+        # orjson rejects NaN; the standard library accepts it
+        decoder = create_decoder("orjson")
+        value = decoder.loads(b'[NaN]')[0]
+        self.assertNotEqual(value, value)
+        self.assertEqual(decoder.fallbacks, 1)
+
+    @unittest.skipUnless(decoder_available("msgspec"), "msgspec is not installed")
+    def test_msgspec(self):
+        """Test the msgspec decoder and that its schema drops unused fields."""
+        self.check_decoder("msgspec")
+        decoder = create_decoder("msgspec")
+        decoder.decode_list(BODY, Pod)
+        item = decoder._typed[Pod].decode(BODY)[0]
+        self.assertNotIn("imageName", item)
+        self.assertEqual(item["runtime"], {"uptimeInSeconds": 60, "costPerHr": 0.5})
+
+    def test_selection(self):
+        """Test that auto picks an installed decoder and unknown names fall back."""
+        self.assertTrue(decoder_available(create_decoder("auto").name))
+        with self.assertLogs("src.runpod_mcp.decoding", level="WARNING"):
+            self.assertEqual(create_decoder("simdjson").name, "stdlib")
+
+if __name__ == "__main__":
+    unittest.main()
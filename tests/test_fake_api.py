@@ -0,0 +1,78 @@
+"""
+Tests for the fake RunPod API, driven through the real client.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.testing import FakeFleet, FakeRunPodAPI, FaultConfig, LatencyModel
+
+class TestFakeRunPodAPI(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the FakeRunPodAPI class."""
+
+    def setUp(self):
+        """Start a fake API with a small fleet."""
+        self.api = FakeRunPodAPI(FakeFleet(pods=25, endpoints=3, volumes=2, boot_seconds=0)).start()
+        self.config = RunPodConfig(api_key="fake", api_url=self.api.url, retry_base_delay=0.0, rate_limit=0)
+        self.client = RunPodClient(self.config)
+
+    async def asyncTearDown(self):
+        """Stop the client and the fake API."""
+        await self.client.close()
+        self.api.stop()
+
+    async def test_lists_and_details(self):
+        """Test the read routes."""
+        pods = await self.client.get_pods()
+        self.assertEqual(len(pods), 25)
+        pod = await self.client.get_pod(pods[0]["id"])
+        self.assertEqual(pod["id"], pods[0]["id"])
+        self.assertEqual(len(await self.client.get_endpoints()), 3)
+        self.assertEqual(len(await self.client.get_network_volumes()), 2)
+        metrics = await self.client.get_endpoint_metrics("ep0000")
+        self.assertIn("totalRequests", metrics)
+        self.assertEqual((await self.client.get_account_info())["credits"], 125.5)
+        self.assertEqual(self.api.requests["GET /pods/{id}"], 1)
+
+    async def test_conditional_and_paging(self):
+        """Test ETag revalidation and limit/offset paging."""
+        first = await self.client.get_pods()
+        second = await self.client.get_pods()
+        self.assertIs(first, second)
+        self.assertEqual(self.client.validators.not_modified, 1)
+
+        paged = [pod["id"] async for pod in self.client.iter_pods(page_size=10)]
+        self.assertEqual(paged, [pod["id"] for pod in first])
+
+    async def test_pod_lifecycle(self):
+        """Test start, stop and terminate."""
+        await self.client.stop_pod("pod00000")
+        self.assertEqual((await self.client.get_pod("pod00000"))["desiredStatus"], "EXITED")
+        await self.client.start_pod("pod00000")
+        self.assertEqual((await self.client.get_pod("pod00000"))["desiredStatus"], "RUNNING")
+        await self.client.terminate_pod("pod00000")
+        self.assertEqual(len(await self.client.get_pods()), 24)
+
+    async def test_injected_throttling_is_retried(self):
+        """Test that injected 429s are answered with Retry-After and retried."""
+        self.api.faults = FaultConfig(throttle_rate=1.0, retry_after=0)
+        with self.assertRaises(Exception):
+            await self.client.get_endpoints()
+        self.assertEqual(self.api.requests["GET /endpoints"], self.config.retry_max_attempts)
+
+    def test_latency_specs(self):
+        """Test latency distribution parsing."""
+        self.assertEqual(LatencyModel("25").sample(), 0.025)
+        self.assertTrue(0.01 <= LatencyModel("uniform:10:20").sample() <= 0.02)
+        self.assertGreater(LatencyModel("lognormal:40:0.5").sample(), 0)
+        with self.assertRaises(ValueError):
+            LatencyModel("pareto:1:2")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for the logging configuration.
+"""
+
+import io
+import os
+import sys
+import json
+import queue
+import logging
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp import logging_config
+from src.runpod_mcp.logging_config import (
+    DroppingQueueHandler, JsonFormatter, RequestContextFilter, configure_logging,
+    log_queue_samples, request_id_var, stop_logging_queue
+)
+from src.runpod_mcp.tracing import Tracer
+
+class TestLoggingConfig(unittest.TestCase):
+    """Test cases for the logging configuration."""
+
+    def setUp(self):
+        root = logging.getLogger()
+        self.saved_handlers = root.handlers[:]
+        self.saved_level = root.level
+        self.saved_configured = logging_config._configured
+
+    def tearDown(self):
+        stop_logging_queue()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(self.saved_level)
+        logging_config._configured = self.saved_configured
+
+    def make_record(self, message="hello %s", args=("world",)):
+        return logging.LogRecord("runpod_mcp.test", logging.INFO, __file__, 1, message, args, None)
+
+    def test_full_queue_drops_records(self):
+        """Test that a full queue drops and counts records instead of blocking."""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+        for _ in range(5):
+            handler.handle(self.make_record())
+
+        self.assertEqual((handler.enqueued, handler.dropped), (2, 3))
+        self.assertEqual(handler.queue.get_nowait().msg, "hello world")
+
+    def test_json_format_includes_request_and_trace_ids(self):
+        """Test that JSON records carry the request id, trace id and extras."""
+        tracer = Tracer(sample_rate=1.0)
+        token = request_id_var.set("7")
+        try:
+            with tracer.start_trace("resource pods://list") as root:
+                record = self.make_record()
+                record.duration_ms = 1.5
+                RequestContextFilter().filter(record)
+        finally:
+            request_id_var.reset(token)
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["message"], "hello world")
+        self.assertEqual(entry["request_id"], "7")
+        self.assertEqual(entry["trace_id"], root.trace.trace_id)
+        self.assertEqual(entry["duration_ms"], 1.5)
+        self.assertNotIn("tool", entry)
+
+    def test_queue_mode_writes_from_listener(self):
+        """Test that queued records reach the handlers once the listener stops."""
+        stream = io.StringIO()
+        saved_stderr = sys.stderr
+        sys.stderr = stream
+        try:
+            configure_logging(use_queue=True, json_format=True, queue_size=100)
+            logging.getLogger("runpod_mcp.test").warning("queued %d", 1)
+            samples = {(name, labels.get("result")): value for name, _, labels, value in log_queue_samples()}
+            stop_logging_queue()
+        finally:
+            sys.stderr = saved_stderr
+
+        messages = [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+        self.assertIn("queued 1", messages)
+        self.assertEqual(samples[("runpod_log_records_total", "dropped")], 0)
+        self.assertEqual(log_queue_samples(), [])
+
+    def test_unforced_configuration_keeps_existing_setup(self):
+        """Test that force=False does not replace an earlier configuration."""
+        configure_logging(level=logging.DEBUG)
+        configure_logging(level=logging.WARNING, force=False)
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+
+if __name__ == "__main__":
+    unittest.main()
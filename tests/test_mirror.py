@@ -0,0 +1,165 @@
+"""
+Tests for the fleet mirror module.
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.mirror import FleetMirror
+from src.runpod_mcp.resources.formatting import read_collection, read_item, with_mirror_notice
+
+def not_found():
+    """Build a 404 HTTPStatusError."""
+    request = httpx.Request("GET", "https://api.runpod.io/v1/pods/gone")
+    response = httpx.Response(404, request=request)
+    return httpx.HTTPStatusError("HTTP 404", request=request, response=response)
+
+class FakeClient:
+    """Minimal stand-in for RunPodClient that counts list calls."""
+
+    def __init__(self):
+        self.pods = [{"id": "pod-1", "desiredStatus": "RUNNING"}]
+        self.endpoints = [{"id": "ep-1"}]
+        self.volumes = [{"id": "vol-1"}]
+        self.list_calls = 0
+        self.fail_pods = False
+        self.pods_ready = None
+
+    async def get_pods(self):
+        self.list_calls += 1
+        if self.pods_ready is not None:
+            await self.pods_ready.wait()
+        if self.fail_pods:
+            raise httpx.ConnectError("down")
+        return self.pods
+
+    async def get_endpoints(self):
+        self.list_calls += 1
+        return self.endpoints
+
+    async def get_network_volumes(self):
+        self.list_calls += 1
+        return self.volumes
+
+    async def get_pod(self, pod_id):
+        for pod in self.pods:
+            if pod["id"] == pod_id:
+                return pod
+        raise not_found()
+
+    async def get_endpoint(self, endpoint_id):
+        return {"id": endpoint_id}
+
+    async def get_network_volume(self, volume_id):
+        return {"id": volume_id}
+
+class TestFleetMirror(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the FleetMirror class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = FakeClient()
+        self.mirror = FleetMirror(self.client, interval=60)
+
+    async def test_sync_indexes_collections(self):
+        """Test that a full sync mirrors every collection by id."""
+        await self.mirror.sync()
+        self.assertEqual(self.client.list_calls, 3)
+        self.assertEqual(self.mirror.get("pods", "pod-1")["desiredStatus"], "RUNNING")
+        self.assertEqual(self.mirror.list("endpoints"), [{"id": "ep-1"}])
+        self.assertTrue(self.mirror.fresh("volumes"))
+
+    async def test_unsynced_data_is_not_served(self):
+        """Test that nothing is served before the first sync."""
+        self.assertIsNone(self.mirror.list("pods"))
+        self.assertIsNone(self.mirror.get("pods", "pod-1"))
+
+    async def test_failed_sync_keeps_previous_data(self):
+        """Test that a failed sync keeps the last mirrored data and records the error."""
+        await self.mirror.sync()
+        self.client.fail_pods = True
+        await self.mirror.sync()
+        self.assertEqual(len(self.mirror.list("pods")), 1)
+        self.assertEqual(self.mirror.snapshot()["pods"]["lastError"], "down")
+        self.assertIsNone(self.mirror.snapshot()["endpoints"]["lastError"])
+
+    async def test_stale_data_is_not_served(self):
+        """Test that data older than max_staleness falls back to the API."""
+        await self.mirror.sync()
+        self.mirror.collections["pods"].synced_at -= 1000
+        self.assertIsNone(self.mirror.list("pods"))
+        self.assertIsNotNone(self.mirror.list("endpoints"))
+
+    async def test_targeted_refresh(self):
+        """Test that a targeted refresh upserts new items and drops deleted ones."""
+        await self.mirror.sync()
+        before = self.mirror.list("pods")
+        self.client.pods = self.client.pods + [{"id": "pod-2", "desiredStatus": "EXITED"}]
+
+        await self.mirror.refresh("pods", "pod-2")
+        self.assertEqual(self.mirror.get("pods", "pod-2")["desiredStatus"], "EXITED")
+        self.assertIsNot(self.mirror.list("pods"), before)
+
+        self.client.pods = self.client.pods[:1]
+        self.assertIsNone(await self.mirror.refresh("pods", "pod-2"))
+        self.assertIsNone(self.mirror.get("pods", "pod-2"))
+        self.assertEqual(len(self.mirror.list("pods")), 1)
+
+    async def test_failed_sync_through_client_ages_data(self):
+        """Test that an outage is not hidden by the client's snapshot fallback."""
+        responses = [httpx.Response(200, json=[{"id": "pod-1"}])]
+        transport = httpx.MockTransport(lambda request: responses.pop(0) if responses else httpx.Response(503))
+        client = RunPodClient(RunPodConfig(api_key="test", retry_base_delay=0.0), transport=transport)
+        mirror = FleetMirror(client, interval=60)
+        try:
+            await mirror.sync()
+            synced_at = mirror.collections["pods"].synced_at
+            await mirror.sync()
+        finally:
+            await client.close()
+        self.assertEqual(mirror.collections["pods"].synced_at, synced_at)
+        self.assertIn("503", mirror.snapshot()["pods"]["lastError"])
+
+    async def test_start_and_stop(self):
+        """Test that start syncs in the background and stop cancels the task."""
+        self.client.pods_ready = asyncio.Event()
+        await self.mirror.start()
+        await asyncio.sleep(0)
+        self.assertIsNone(self.mirror.list("pods"))
+
+        self.client.pods_ready.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertEqual(self.mirror.snapshot()["pods"]["syncs"], 1)
+        await self.mirror.stop()
+        self.assertIsNone(self.mirror._task)
+
+    async def test_resource_helpers_prefer_mirror(self):
+        """Test that resource reads use the mirror when it is fresh."""
+        await self.mirror.sync()
+        context = {"fleet_mirror": self.mirror}
+
+        pods, age = await read_collection(context, "pods", self.client.get_pods)
+        self.assertEqual(self.client.list_calls, 3)
+        self.assertIsNotNone(age)
+        self.assertIn("fleet mirror", with_mirror_notice("text", age))
+
+        pod, age = await read_item(context, "pods", "pod-1", self.client.get_pod)
+        self.assertEqual(pod["id"], "pod-1")
+
+        pods, age = await read_collection({}, "pods", self.client.get_pods)
+        self.assertEqual(self.client.list_calls, 4)
+        self.assertIsNone(age)
+        self.assertEqual(with_mirror_notice("text", age), "text")
+
+if __name__ == "__main__":
+    unittest.main()
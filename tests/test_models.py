@@ -0,0 +1,72 @@
+"""
+Tests for the slotted resource models.
+"""
+
+import os
+import sys
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.models import EnvVar, Endpoint, GpuType, NetworkVolume, Pod, Template
+
+POD = {
+    "id": "pod1", "name": "train", "gpuDisplayName": "RTX 4090", "gpuCount": 2, "desiredStatus": "RUNNING",
+    "machineId": "m1", "container": {"image": "runpod/pytorch", "diskInGb": 50, "memoryInGb": 62},
+    "runtime": {"uptimeInSeconds": 12300, "costPerHr": 0.69},
+    "ports": [{"name": "http", "ip": "10.0.0.1", "publicPort": 8888}, "junk"],
+    "volumeMounts": [{"name": "data"}],
+    "env": [{"key": "A", "value": "1"}, {"value": "no key"}, {"key": "DB_PASSWORD", "value": "x"}],
+    "imageName": "unused", "lastStatusChange": "unused",
+}
+
+class TestModels(unittest.TestCase):
+    """Test cases for decoding API objects into models."""
+
+    def test_pod(self):
+        """Test that a pod keeps the used fields and flattens nested ones."""
+        pod = Pod.from_api(POD)
+        self.assertEqual((pod.id, pod.gpu_count, pod.image, pod.cost_per_hr), ("pod1", 2, "runpod/pytorch", 0.69))
+        self.assertEqual(pod.uptime, "3h 25m")
+        self.assertEqual([(p.name, p.ip, p.public_port) for p in pod.ports], [("http", "10.0.0.1", 8888)])
+        self.assertEqual([(m.name, m.mount_path) for m in pod.volume_mounts], [("data", "Unknown")])
+        self.assertEqual(pod.env, (EnvVar("A", "1"), EnvVar("DB_PASSWORD", "x")))
+        self.assertEqual([e.sensitive for e in pod.env], [False, True])
+        self.assertFalse(hasattr(pod, "__dict__"))
+        self.assertFalse(hasattr(pod, "imageName"))
+
+    def test_defaults(self):
+        """Test that missing and null fields get the defaults resources display."""
+        pod = Pod.from_api({"runtime": None, "container": None})
+        self.assertEqual((pod.id, pod.name, pod.status, pod.uptime, pod.cost_per_hr), ("Unknown ID", "Unnamed Pod", "UNKNOWN", "0h 0m", 0))
+        self.assertEqual((pod.ports, pod.env), ((), ()))
+
+        gpu = GpuType.from_api({"displayName": "A100"})
+        self.assertEqual((gpu.name, gpu.memory_gb, gpu.min_bid_price, gpu.available), ("A100", "unknown", "N/A", False))
+
+        self.assertEqual(Endpoint.from_api({}).gpu_type, "Unknown")
+        self.assertEqual(Endpoint.from_api({"gpuIds": []}).gpu_ids, ())
+        self.assertEqual(Template.from_api({"container": {"command": "run"}}).command, "run")
+
+    def test_endpoint_and_volume(self):
+        """Test the fields read from an endpoint's template and a volume's attachments."""
+        endpoint = Endpoint.from_api({
+            "gpuIds": ["A100", "H100"], "template": {"container": {"image": "worker"}, "env": [{"key": "K"}]},
+        })
+        self.assertEqual((endpoint.gpu_type, endpoint.image), ("A100", "worker"))
+        self.assertIsNone(endpoint.env[0].value)
+
+        volume = NetworkVolume.from_api({"pods": [{"id": "pod1", "name": "train"}, {}], "endpoints": [{"id": "ep1"}]})
+        self.assertEqual(volume.pods, (("pod1", "train"), ("Unknown", "Unnamed Pod")))
+        self.assertEqual(volume.endpoints, (("ep1", "Unnamed Endpoint"),))
+
+    def test_coerce(self):
+        """Test that coerce decodes dicts and passes models through."""
+        pod = Pod.coerce(POD)
+        self.assertIs(Pod.coerce(pod), pod)
+        self.assertEqual(Pod.coerce(POD), pod)
+        self.assertNotEqual(Pod.from_api({"id": "pod2"}), pod)
+
+if __name__ == "__main__":
+    unittest.main()
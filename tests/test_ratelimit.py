@@ -0,0 +1,68 @@
+"""
+Tests for the rate limiting module.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.ratelimit import RateLimiter, TokenBucket
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the TokenBucket class."""
+
+    async def test_burst_is_immediate(self):
+        """Test that a burst within capacity does not wait."""
+        bucket = TokenBucket(rate=1, burst=3)
+        waits = [await bucket.acquire() for _ in range(3)]
+        self.assertTrue(all(wait < 0.01 for wait in waits))
+        self.assertEqual(bucket.stats.delayed, 0)
+
+    async def test_paces_beyond_burst(self):
+        """Test that requests beyond the burst are paced at the rate."""
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(bucket.stats.delayed, 3)
+
+    async def test_fifo_order(self):
+        """Test that queued callers are served in arrival order."""
+        bucket = TokenBucket(rate=100, burst=1)
+        order = []
+
+        async def caller(i):
+            await bucket.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(caller(i) for i in range(5)))
+        self.assertEqual(order, list(range(5)))
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the RateLimiter class."""
+
+    async def test_route_buckets(self):
+        """Test that mutations get per-route buckets and reads do not."""
+        limiter = RateLimiter(rate=100, burst=10, read_rate=0, mutation_rate=5)
+        await limiter.acquire("GET", "/gpus")
+        await limiter.acquire("POST", "/pods/{id}/stop")
+
+        stats = limiter.snapshot()
+        self.assertEqual(stats["global"]["acquired"], 2)
+        self.assertIn("POST /pods/{id}/stop", stats)
+        self.assertNotIn("GET /gpus", stats)
+
+    async def test_disabled(self):
+        """Test that a zero rate disables limiting."""
+        limiter = RateLimiter(rate=0, burst=0)
+        self.assertEqual(await limiter.acquire("GET", "/pods"), 0.0)
+        self.assertEqual(limiter.snapshot(), {})
+
+if __name__ == "__main__":
+    unittest.main()
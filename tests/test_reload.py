@@ -0,0 +1,116 @@
+"""
+Tests for the cached configuration and hot reloading.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.config import ConfigStore, RunPodConfig
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.reload import ConfigWatcher
+
+class TestConfigStore(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the ConfigStore class."""
+
+    async def test_loads_once_and_swaps_on_change(self):
+        """Test that get() is cached and reload() only applies changes."""
+        configs = [RunPodConfig(api_key="a"), RunPodConfig(api_key="a"), RunPodConfig(api_key="b")]
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return configs[len(calls) - 1]
+
+        store = ConfigStore(loader)
+        applied = []
+
+        async def listener(config):
+            applied.append(config.api_key)
+
+        store.add_listener(listener)
+
+        self.assertEqual(store.get().api_key, "a")
+        self.assertEqual(store.get().api_key, "a")
+        self.assertEqual(len(calls), 1)
+
+        self.assertIsNone(await store.reload())
+        self.assertEqual((await store.reload()).api_key, "b")
+        self.assertEqual(store.get().api_key, "b")
+        self.assertEqual(applied, ["b"])
+        self.assertEqual(store.reloads, 1)
+
+    async def test_watcher_reloads_changed_file(self):
+        """Test that editing a watched file reloads it and bad edits are kept out."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "runpod_config.json")
+
+            def write(data):
+                with open(path, "w") as f:
+                    json.dump(data, f)
+
+            write({"api_key": "first", "rate_limit": 5})
+            store = ConfigStore(lambda: RunPodConfig.from_file(path))
+            watcher = ConfigWatcher(store, interval=60, paths=[path])
+            self.assertEqual(store.get().rate_limit, 5)
+            await watcher.start()
+            try:
+                self.assertFalse(await watcher.check())
+
+                write({"api_key": "first", "rate_limit": 7.5})
+                self.assertTrue(await watcher.check())
+                self.assertEqual(store.get().rate_limit, 7.5)
+
+                write({"rate_limit": 1})
+                self.assertFalse(await watcher.check())
+                self.assertEqual(watcher.failures, 1)
+                self.assertEqual(store.get().rate_limit, 7.5)
+            finally:
+                await watcher.stop()
+
+class TestClientReconfigure(unittest.IsolatedAsyncioTestCase):
+    """Test cases for RunPodClient.reconfigure."""
+
+    async def test_in_flight_requests_finish_on_the_old_pool(self):
+        """Test that reconfiguring waits for in-flight requests before closing the pool."""
+        release = asyncio.Event()
+        seen = []
+
+        async def handler(request):
+            seen.append((request.url.host, request.headers["Authorization"]))
+            if request.url.host == "old.example":
+                await release.wait()
+            return httpx.Response(200, json=[{"id": request.url.host}])
+
+        old = RunPodConfig(api_key="old-key", api_url="https://old.example/v1", retry_base_delay=0.0)
+        new = RunPodConfig(api_key="new-key", api_url="https://new.example/v1", retry_base_delay=0.0, rate_limit=0.0)
+        client = RunPodClient(old, transport=httpx.MockTransport(handler))
+        old_session = client.session
+
+        in_flight = asyncio.ensure_future(client.get_pods())
+        await asyncio.sleep(0.01)
+        # Returns right away; the old pool drains in the background
+        await client.reconfigure(new)
+
+        # New requests already use the new pool while the old one drains
+        self.assertEqual(await client.get_endpoints(), [{"id": "new.example"}])
+        self.assertFalse(old_session.is_closed)
+
+        release.set()
+        self.assertEqual(await in_flight, [{"id": "old.example"}])
+        await asyncio.gather(*client._draining)
+        self.assertTrue(old_session.is_closed)
+        self.assertEqual(seen, [("old.example", "Bearer old-key"), ("new.example", "Bearer new-key")])
+        self.assertIsNone(client.rate_limiter.global_bucket)
+        await client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for the retry module.
+"""
+
+import os
+import sys
+import random
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.retry import RetryEngine, RetryPolicy, parse_retry_after
+
+def status_error(status, headers=None):
+    """Build an HTTPStatusError for the given status code."""
+    request = httpx.Request("GET", "https://api.runpod.io/v1/pods")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+class TestRetryEngine(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the RetryEngine class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.sleeps = []
+
+        async def sleep(delay):
+            self.sleeps.append(delay)
+
+        self.engine = RetryEngine(RetryPolicy(max_attempts=3), sleep=sleep, rng=random.Random(0))
+
+    def failing(self, errors, result="ok"):
+        """Return a coroutine function that raises the given errors in turn."""
+        errors = list(errors)
+
+        async def fn():
+            if errors:
+                raise errors.pop(0)
+            return result
+
+        return fn
+
+    async def test_recovers_from_transient_errors(self):
+        """Test that 429 and 502 responses are retried."""
+        result = await self.engine.call("GET", "/pods", self.failing([status_error(429), status_error(502)]))
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(self.engine.stats["GET /pods"].recovered, 1)
+
+    async def test_fast_fail_on_auth_errors(self):
+        """Test that 401/403/404 are not retried."""
+        for status in (401, 403, 404):
+            with self.assertRaises(httpx.HTTPStatusError):
+                await self.engine.call("GET", "/pods", self.failing([status_error(status)]))
+        self.assertEqual(self.sleeps, [])
+
+    async def test_non_idempotent_not_retried(self):
+        """Test that a POST is not retried on a 502 by default."""
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.engine.call("POST", "/pods/{id}/stop", self.failing([status_error(502)]))
+        self.assertEqual(self.sleeps, [])
+
+    async def test_gives_up_after_max_attempts(self):
+        """Test that retries stop after max_attempts."""
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.engine.call("GET", "/pods", self.failing([status_error(503)] * 5))
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(self.engine.stats["GET /pods"].exhausted, 1)
+
+    async def test_honors_retry_after(self):
+        """Test that Retry-After sets a lower bound on the delay."""
+        await self.engine.call("GET", "/pods", self.failing([status_error(429, {"Retry-After": "7"})]))
+        self.assertGreaterEqual(self.sleeps[0], 7)
+
+    def test_parse_retry_after(self):
+        """Test parsing Retry-After in seconds and as an HTTP date."""
+        self.assertEqual(parse_retry_after(status_error(429, {"Retry-After": "3"}).response), 3.0)
+        date = parse_retry_after(status_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}).response)
+        self.assertEqual(date, 0.0)
+        self.assertIsNone(parse_retry_after(status_error(429).response))
+
+if __name__ == "__main__":
+    unittest.main()
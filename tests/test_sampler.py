@@ -0,0 +1,148 @@
+"""
+Tests for the endpoint metrics sampler.
+"""
+
+import os
+import sys
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.sampler import EndpointSampler, MetricRing, percentile, rolling_increase
+
+class FakeClient:
+    """Serves endpoint metrics whose counters grow by 10 requests per call."""
+
+    def __init__(self):
+        self.endpoints = [{"id": "ep-1", "name": "sd"}, {"id": "ep-2", "name": "llm"}]
+        self.calls = 0
+
+    async def get_endpoints(self):
+        return self.endpoints
+
+    async def get_endpoint_metrics(self, endpoint_id):
+        self.calls += 1
+        if endpoint_id == "ep-2":
+            raise RuntimeError("metrics unavailable")
+        return {
+            "totalRequests": self.calls * 10,
+            "failureCount": self.calls,
+            "averageResponseTime": float(self.calls),
+            "utilization": 0.5,
+        }
+
+async def _metrics(total):
+    return {"totalRequests": total, "failureCount": 0, "averageResponseTime": 1.0, "utilization": 0.5}
+
+class TestHelpers(unittest.TestCase):
+    """Test cases for the summary helpers."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 95), 95.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_rolling_increase_when_total_drops(self):
+        """Test that a rolling total aging out is not counted as new requests."""
+        self.assertEqual(rolling_increase([1000.0, 1020.0, 990.0, 1010.0]), 40.0)
+        self.assertEqual(rolling_increase([1000.0, 900.0, 800.0]), 0.0)
+
+class TestMetricRing(unittest.TestCase):
+    """Test cases for the MetricRing class."""
+
+    def test_wraps_and_windows(self):
+        """Test that the ring keeps the newest samples in order."""
+        ring = MetricRing(capacity=4)
+        for t in range(6):
+            ring.append(float(t), {"requests": t * 10})
+        self.assertEqual(ring.count, 4)
+        window = ring.window(seconds=10, now=5.0)
+        self.assertEqual(list(window["timestamps"]), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(list(window["requests"]), [20.0, 30.0, 40.0, 50.0])
+        window = ring.window(seconds=1.5, now=5.0)
+        self.assertEqual(list(window["timestamps"]), [4.0, 5.0])
+
+class TestEndpointSampler(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the EndpointSampler class."""
+
+    async def test_samples_and_summarizes(self):
+        """Test sampling rounds and window summaries."""
+        self.now = 1000.0
+        client = FakeClient()
+        sampler = EndpointSampler(client, interval=60, clock=lambda: self.now)
+
+        for _ in range(5):
+            await sampler.sample()
+            self.now += 60
+
+        self.assertEqual(sampler.errors, 5)
+        self.assertNotIn("ep-2", sampler.rings)
+        self.now -= 60
+        summary = sampler.summary("ep-1", "1h")
+        self.assertEqual(summary["samples"], 5)
+        # 10 requests per 60s round, counted per two metrics calls
+        self.assertAlmostEqual(summary["requestsPerSec"], 20 / 60)
+        self.assertAlmostEqual(summary["utilization"]["avg"], 0.5)
+        self.assertEqual(sampler.summary("ep-1", "5m")["samples"], 5)
+        self.assertIsNone(sampler.summary("ep-2", "5m"))
+
+    async def test_rolling_totals_that_decrease(self):
+        """Test that a 24-hour total falling as traffic ages out keeps rates small."""
+        self.now = 1000.0
+        client = FakeClient()
+        client.endpoints = client.endpoints[:1]
+        totals = iter([50000, 50030, 49900, 49960, 49920])
+        client.get_endpoint_metrics = lambda endpoint_id: _metrics(next(totals))
+        sampler = EndpointSampler(client, interval=60, clock=lambda: self.now)
+
+        for _ in range(5):
+            await sampler.sample()
+            self.now += 60
+
+        self.now -= 60
+        summary = sampler.summary("ep-1", "1h")
+        # 30 + 60 new requests over four minutes, not the whole total again
+        self.assertAlmostEqual(summary["requestsPerSec"], 90 / 240)
+
+    async def test_drops_removed_endpoints(self):
+        """Test that endpoints that disappear lose their samples."""
+        client = FakeClient()
+        sampler = EndpointSampler(client, interval=60)
+        await sampler.sample()
+        self.assertIn("ep-1", sampler.rings)
+        client.endpoints = []
+        await sampler.sample()
+        self.assertEqual(sampler.rings, {})
+
+    async def test_outage_skips_samples(self):
+        """Test that metrics are not re-recorded from the client's snapshot during an outage."""
+        responses = {
+            "/v1/endpoints": [httpx.Response(200, json=[{"id": "ep-1"}])] * 2,
+            "/v1/endpoints/ep-1/metrics": [httpx.Response(200, json={"totalRequests": 10})],
+        }
+
+        def handler(request):
+            queue = responses[request.url.path]
+            return queue.pop(0) if queue else httpx.Response(503)
+
+        client = RunPodClient(RunPodConfig(api_key="test", retry_max_attempts=1), transport=httpx.MockTransport(handler))
+        sampler = EndpointSampler(client, interval=60)
+        await sampler.sample()
+        await sampler.sample()
+        with self.assertRaises(httpx.HTTPStatusError):
+            await sampler.sample()
+        await client.close()
+
+        self.assertEqual(sampler.rings["ep-1"].count, 1)
+        self.assertEqual(sampler.errors, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,14 @@ Tests for the RunPod MCP server.
 
 import sys
 import os
+import socket
+import asyncio
 import unittest
 from unittest.mock import patch
 
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -22,5 +27,121 @@ class TestRunPodMCPServer(unittest.TestCase):
         self.assertTrue(version_str.startswith("RunPod MCP Server v"))
         self.assertIn(".", version_str)  # Should contain at least one dot for version number
 
+class TestResourceSubscriptions(unittest.IsolatedAsyncioTestCase):
+    """Test cases for resources/subscribe support."""
+
+    def session(self, mirror_enabled):
+        """Connect a client session with the fleet mirror enabled or disabled."""
+        from src.runpod_mcp.config import RunPodConfig
+        from src.runpod_mcp.server import config_store, mcp
+
+        # Nothing listens on port 9, so the mirror's syncs fail right away
+        config = RunPodConfig(
+            api_key="test", api_url="http://127.0.0.1:9", retry_max_attempts=1, mirror_enabled=mirror_enabled
+        )
+        patcher = patch.object(config_store, "get", return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return create_connected_server_and_client_session(mcp._mcp_server)
+
+    async def test_subscriptions_are_per_session(self):
+        """Test that subscribe is advertised and recorded in the session's own feed."""
+        async with self.session(mirror_enabled=True) as first:
+            async with self.session(mirror_enabled=True) as second:
+                capabilities = first.get_server_capabilities()
+                self.assertTrue(capabilities.resources.subscribe)
+
+                await first.subscribe_resource("pods://list")
+                first_status = await first.read_resource("status://mirror")
+                second_status = await second.read_resource("status://mirror")
+
+        self.assertIn("Subscriptions: 1", first_status.contents[0].text)
+        self.assertIn("Subscriptions: 0", second_status.contents[0].text)
+
+    async def test_subscriptions_need_the_mirror(self):
+        """Test that subscribe is neither advertised nor accepted without the mirror."""
+        async with self.session(mirror_enabled=False) as session:
+            self.assertFalse(session.get_server_capabilities().resources.subscribe)
+            with self.assertRaises(McpError):
+                await session.subscribe_resource("pods://list")
+
+class TestSharedRuntime(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the runtime shared by all sessions."""
+
+    def setUp(self):
+        """Start a fake API and point the server's configuration at it."""
+        from src.runpod_mcp.config import RunPodConfig
+        from src.runpod_mcp.server import config_store
+        from src.runpod_mcp.testing import FakeFleet, FakeRunPodAPI
+
+        self.api = FakeRunPodAPI(FakeFleet(pods=5, endpoints=1, volumes=1, boot_seconds=0), latency="50").start()
+        self.addCleanup(self.api.stop)
+        self.config = RunPodConfig(api_key="fake", api_url=self.api.url, retry_base_delay=0.0)
+        patcher = patch.object(config_store, "get", side_effect=lambda: self.config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_sessions_share_one_mirror(self):
+        """Test that a second session does not start a second fleet mirror."""
+        from src.runpod_mcp import server
+
+        self.config.mirror_enabled = True
+
+        async with create_connected_server_and_client_session(server.mcp._mcp_server):
+            async with create_connected_server_and_client_session(server.mcp._mcp_server):
+                self.assertEqual(server.runtime.sessions, 2)
+                for _ in range(100):
+                    if server.runtime.mirror.collections["pods"].syncs:
+                        break
+                    await asyncio.sleep(0.02)
+                self.assertEqual(self.api.requests["GET /pods"], 1)
+        self.assertIsNone(server.runtime)
+
+    async def test_identical_reads_from_sessions_are_coalesced(self):
+        """Test that the same read from two sessions makes one upstream call."""
+        from src.runpod_mcp import server
+
+        async with create_connected_server_and_client_session(server.mcp._mcp_server) as first:
+            async with create_connected_server_and_client_session(server.mcp._mcp_server) as second:
+                await asyncio.gather(first.read_resource("pods://list"), second.read_resource("pods://list"))
+                collapsed = server.runtime.client.singleflight.collapsed
+        self.assertEqual(self.api.requests["GET /pods"], 1)
+        self.assertEqual(collapsed, 1)
+
+    async def test_sessions_share_the_rate_limit(self):
+        """Test that requests from all sessions draw on one global token bucket."""
+        from src.runpod_mcp import server
+
+        self.config.rate_limit = 20.0
+        self.config.rate_limit_burst = 2
+        async with create_connected_server_and_client_session(server.mcp._mcp_server) as first:
+            async with create_connected_server_and_client_session(server.mcp._mcp_server) as second:
+                await asyncio.gather(
+                    first.read_resource("pods://details/pod00000"),
+                    first.read_resource("pods://details/pod00001"),
+                    second.read_resource("pods://details/pod00002"),
+                    second.read_resource("pods://details/pod00003"),
+                )
+                stats = server.runtime.client.rate_limiter.snapshot()["global"]
+        self.assertEqual(stats["acquired"], 4)
+        self.assertGreaterEqual(stats["delayed"], 2)
+
+class TestMetricsEndpoint(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the Prometheus endpoint's lifetime."""
+
+    async def test_stopped_when_the_last_session_ends(self):
+        """Test that the metrics endpoint is shut down with the last session."""
+        from src.runpod_mcp.config import RunPodConfig
+        from src.runpod_mcp.server import config_store, mcp, telemetry
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        config = RunPodConfig(api_key="test", api_url="http://127.0.0.1:9", metrics_port=port)
+        with patch.object(config_store, "get", return_value=config):
+            async with create_connected_server_and_client_session(mcp._mcp_server):
+                self.assertIsNotNone(telemetry._http)
+        self.assertIsNone(telemetry._http)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
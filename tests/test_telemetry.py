@@ -0,0 +1,125 @@
+"""
+Tests for the telemetry module.
+"""
+
+import os
+import sys
+import unittest
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.telemetry import Histogram, Telemetry, client_collector, instrument_server
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for the Histogram class."""
+
+    def test_buckets_and_quantiles(self):
+        """Test bucket placement and interpolated quantiles."""
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [1, 2, 1, 1])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.sum, 5.605)
+        self.assertTrue(0.01 <= histogram.quantile(0.5) <= 0.1)
+        # Values above the largest bound report that bound
+        self.assertEqual(histogram.quantile(1.0), 1.0)
+        self.assertEqual(Histogram().quantile(0.5), 0.0)
+
+class TestTelemetry(unittest.TestCase):
+    """Test cases for the Telemetry registry."""
+
+    def test_prometheus_format(self):
+        """Test histogram and counter exposition."""
+        telemetry = Telemetry(buckets=(0.1, 1.0))
+        telemetry.observe("runpod_api_request_seconds", 0.05, route="/pods", status="200")
+        telemetry.observe("runpod_api_request_seconds", 0.5, route="/pods", status="200")
+        telemetry.inc("runpod_api_response_bytes_total", 100, route="/pods")
+
+        text = telemetry.render_prometheus()
+
+        self.assertIn("# TYPE runpod_api_request_seconds histogram", text)
+        self.assertIn('runpod_api_request_seconds_bucket{route="/pods",status="200",le="0.1"} 1', text)
+        self.assertIn('runpod_api_request_seconds_bucket{route="/pods",status="200",le="+Inf"} 2', text)
+        self.assertIn('runpod_api_request_seconds_count{route="/pods",status="200"} 2', text)
+        self.assertIn('runpod_api_response_bytes_total{route="/pods"} 100', text)
+
+    def test_collectors_are_summed(self):
+        """Test that identical samples from several collectors are merged."""
+        telemetry = Telemetry()
+        collector = lambda: [("runpod_coalesced_requests_total", "counter", {}, 2)]
+        telemetry.add_collector(collector)
+        telemetry.add_collector(lambda: [("runpod_coalesced_requests_total", "counter", {}, 3)])
+
+        self.assertEqual(telemetry.collect(), [("runpod_coalesced_requests_total", "counter", {}, 5.0)])
+        telemetry.remove_collector(collector)
+        self.assertEqual(telemetry.collect()[0][3], 3.0)
+
+class TestInstrumentation(unittest.IsolatedAsyncioTestCase):
+    """Test cases for client and server instrumentation."""
+
+    async def test_client_requests(self):
+        """Test that client requests are timed by route and status."""
+        async def handler(request):
+            if request.url.path == "/v1/pods/abc":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json=[{"id": "abc"}])
+
+        telemetry = Telemetry()
+        config = RunPodConfig(api_key="test-api-key", retry_base_delay=0.0)
+        client = RunPodClient(config, transport=httpx.MockTransport(handler), telemetry=telemetry)
+        await client.get_pods()
+        with self.assertRaises(Exception):
+            await client.get_pod("abc")
+        await client.close()
+
+        keys = {dict(labels)["status"]: h.count for (name, labels), h in telemetry.histograms.items()}
+        self.assertEqual(keys, {"200": 1, "404": 1})
+        self.assertEqual(
+            telemetry.counters[("runpod_api_response_bytes_total", (("method", "GET"), ("route", "/pods")))],
+            len(b'[{"id":"abc"}]'),
+        )
+        names = {sample[0] for sample in client_collector(client)()}
+        self.assertIn("runpod_cache_requests_total", names)
+
+    async def test_server_reads_and_tools(self):
+        """Test that reads are labeled by URI template and errors are counted."""
+        server = FastMCP("test")
+
+        @server.resource("things://{thing_id}")
+        def thing(thing_id: str) -> str:
+            return "Error: no such thing" if thing_id == "missing" else f"thing {thing_id}"
+
+        @server.tool()
+        def ping() -> str:
+            return "pong"
+
+        telemetry = Telemetry()
+        instrument_server(server, telemetry)
+        async with create_connected_server_and_client_session(server._mcp_server) as session:
+            await session.read_resource("things://a")
+            await session.read_resource("things://b")
+            await session.read_resource("things://missing")
+            await session.call_tool("ping", {})
+            await session.call_tool("no-such-tool", {})
+
+        counts = {
+            tuple(value for _, value in labels): histogram.count
+            for (name, labels), histogram in telemetry.histograms.items()
+        }
+        self.assertEqual(counts, {
+            ("ok", "things://{thing_id}"): 2,
+            ("error", "things://{thing_id}"): 1,
+            ("ok", "ping"): 1,
+            ("error", "unknown"): 1,
+        })
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the tracing module.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.tracing import (
+    JsonFileExporter, Tracer, add_tail_span, current_span, otlp_payload, span
+)
+
+class TestTracer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the Tracer class."""
+
+    async def test_spans_nest_across_tasks_and_threads(self):
+        """Test that child spans find their parent through tasks and threads."""
+        tracer = Tracer(sample_rate=1.0)
+
+        async def fetch(name):
+            with span(f"runpod GET {name}"):
+                await asyncio.sleep(0)
+
+        def blocking():
+            with span("blocking"):
+                return current_span().name
+
+        with tracer.start_trace("resource account://credits") as root:
+            await asyncio.gather(fetch("/me"), fetch("/pods"))
+            self.assertEqual(await asyncio.to_thread(blocking), "blocking")
+            add_tail_span("format")
+
+        trace = tracer.recent[-1]
+        self.assertIs(trace.root, root)
+        self.assertEqual(
+            sorted(s.name for s in trace.spans if s.parent_id == root.span_id),
+            ["blocking", "format", "runpod GET /me", "runpod GET /pods"],
+        )
+        self.assertIsNone(current_span())
+
+    async def test_unsampled_requests_record_nothing(self):
+        """Test that a zero sample rate opens no spans."""
+        tracer = Tracer(sample_rate=0.0)
+        with tracer.start_trace("resource pods://list") as root:
+            with span("runpod GET /pods") as child:
+                self.assertIsNone(child)
+        self.assertIsNone(root)
+        self.assertEqual(len(tracer.recent), 0)
+
+    async def test_errors_are_recorded(self):
+        """Test that exceptions mark the span."""
+        tracer = Tracer(sample_rate=1.0)
+        with self.assertRaises(RuntimeError):
+            with tracer.start_trace("tool stop_pods"):
+                with span("runpod POST /pods/{id}/stop"):
+                    raise RuntimeError("boom")
+        self.assertEqual([s.error for s in tracer.recent[-1].spans], ["RuntimeError: boom"] * 2)
+
+    async def test_spans_after_finish_are_ignored(self):
+        """Test that background work outliving its request adds no spans."""
+        tracer = Tracer(sample_rate=1.0)
+        release = asyncio.Event()
+
+        async def background_refresh():
+            await release.wait()
+            with span("late") as child:
+                return child
+
+        with tracer.start_trace("resource gpus://available") as root:
+            # The task copies the context, and with it the root span
+            task = asyncio.ensure_future(background_refresh())
+        release.set()
+
+        self.assertIsNone(await task)
+        self.assertEqual(root.trace.spans, [root])
+
+class TestExport(unittest.TestCase):
+    """Test cases for trace export."""
+
+    def test_json_file_exporter(self):
+        """Test that traces are appended as JSON lines."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            tracer = Tracer(sample_rate=1.0)
+            tracer.exporters.append(JsonFileExporter(path, interval=0.01))
+            with tracer.start_trace("resource pods://list"):
+                with span("runpod GET /pods"):
+                    pass
+            tracer.flush()
+
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(len(lines), 1)
+            self.assertEqual([s["name"] for s in lines[0]["spans"]], ["resource pods://list", "runpod GET /pods"])
+
+    def test_otlp_payload(self):
+        """Test the OTLP/HTTP JSON structure."""
+        tracer = Tracer(sample_rate=1.0)
+        with tracer.start_trace("resource pods://list", uri="pods://list"):
+            with span("runpod GET /pods"):
+                pass
+
+        payload = otlp_payload(list(tracer.recent))
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+        self.assertEqual(len(spans), 2)
+        self.assertEqual(len(spans[0]["traceId"]), 32)
+        self.assertNotIn("parentSpanId", spans[0])
+        self.assertEqual(spans[1]["parentSpanId"], spans[0]["spanId"])
+        self.assertEqual(spans[0]["attributes"], [{"key": "uri", "value": {"stringValue": "pods://list"}}])
+
+if __name__ == "__main__":
+    unittest.main()
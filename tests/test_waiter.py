@@ -0,0 +1,132 @@
+"""
+Tests for the shared pod state poller.
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import httpx
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.runpod_mcp.client import RunPodClient
+from src.runpod_mcp.config import RunPodConfig
+from src.runpod_mcp.waiter import PodStatePoller, pod_state, STARTING, MISSING
+
+class FakeClient:
+    """Serves a scripted sequence of pod listings, one per call."""
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.calls = 0
+
+    async def get_pods(self):
+        listing = self.listings[min(self.calls, len(self.listings) - 1)]
+        self.calls += 1
+        return listing
+
+def running(pod_id):
+    return {"id": pod_id, "desiredStatus": "RUNNING", "runtime": {"uptimeInSeconds": 1}}
+
+def starting(pod_id):
+    return {"id": pod_id, "desiredStatus": "RUNNING", "runtime": None}
+
+class TestPodState(unittest.TestCase):
+    """Test cases for pod_state."""
+
+    def test_states(self):
+        """Test that pods without a runtime are reported as starting."""
+        self.assertEqual(pod_state(starting("a")), STARTING)
+        self.assertEqual(pod_state(running("a")), "RUNNING")
+        self.assertEqual(pod_state({"id": "a", "desiredStatus": "EXITED"}), "EXITED")
+        self.assertEqual(pod_state(None), MISSING)
+
+class TestPodStatePoller(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the PodStatePoller class."""
+
+    async def test_waiters_share_polls(self):
+        """Test that concurrent waiters are served by the same list fetches."""
+        client = FakeClient([
+            [starting("a"), starting("b")],
+            [running("a"), starting("b")],
+            [running("a"), running("b")],
+        ])
+        poller = PodStatePoller(client, min_interval=0.01, max_interval=0.05)
+
+        first, second = await asyncio.gather(
+            poller.wait(["a"], "RUNNING", timeout=5),
+            poller.wait(["a", "b"], "running", timeout=5),
+        )
+
+        self.assertFalse(first.timed_out)
+        self.assertFalse(second.timed_out)
+        self.assertEqual(second.states, {"a": "RUNNING", "b": "RUNNING"})
+        self.assertEqual(client.calls, 3)
+        await poller.close()
+
+    async def test_deadline(self):
+        """Test that a wait returns the last states when the deadline passes."""
+        client = FakeClient([[starting("a")]])
+        poller = PodStatePoller(client, min_interval=0.01, max_interval=0.02)
+
+        result = await poller.wait(["a"], timeout=0.1)
+
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.states, {"a": STARTING})
+        self.assertEqual(result.reached, {})
+        await poller.close()
+
+    async def test_terminated_includes_missing(self):
+        """Test that a pod gone from the list counts as terminated."""
+        client = FakeClient([[running("a")], []])
+        poller = PodStatePoller(client, min_interval=0.01)
+
+        result = await poller.wait(["a"], "TERMINATED", timeout=5)
+
+        self.assertEqual(result.states, {"a": MISSING})
+        self.assertIn("a", result.reached)
+        await poller.close()
+
+    async def test_duplicate_ids(self):
+        """Test that a pod listed twice is waited for once."""
+        client = FakeClient([[running("a")]])
+        poller = PodStatePoller(client, min_interval=0.01)
+
+        result = await poller.wait(["a", "a"], timeout=5)
+
+        self.assertFalse(result.timed_out)
+        self.assertEqual(result.states, {"a": "RUNNING"})
+        await poller.close()
+
+    async def test_outage_is_not_reported_as_state(self):
+        """Test that polls during an outage fail instead of reading the client's snapshot."""
+        responses = [httpx.Response(200, json=[starting("a")])]
+        transport = httpx.MockTransport(lambda request: responses.pop(0) if responses else httpx.Response(503))
+        client = RunPodClient(RunPodConfig(api_key="test", retry_max_attempts=1), transport=transport)
+        poller = PodStatePoller(client, min_interval=0.01, max_interval=0.01)
+
+        result = await poller.wait(["a"], timeout=0.1)
+
+        self.assertEqual(poller.polls, 1)
+        self.assertGreater(poller.errors, 0)
+        self.assertEqual(result.states, {"a": STARTING})
+        await poller.close()
+        await client.close()
+
+    async def test_backs_off_while_unchanged(self):
+        """Test that the interval grows while nothing changes."""
+        client = FakeClient([[starting("a")]])
+        poller = PodStatePoller(client, min_interval=0.01, max_interval=1.0, fast_period=0, backoff=2)
+
+        await poller.wait(["a"], timeout=0.2)
+
+        self.assertGreater(poller._interval, 0.01)
+        # Without backoff a 0.2s wait at 0.01s would take about 20 polls
+        self.assertLess(client.calls, 10)
+        await poller.close()
+
+if __name__ == "__main__":
+    unittest.main()